@@ -0,0 +1,112 @@
+import argparse
+import os
+import shutil
+import tempfile
+
+from common import print_results, summarize, timed, write_results
+from generate_user_data import collection_names, generate_user_data
+
+DEFAULT_MODEL_SIZES = [1000, 10000, 100000]
+DEFAULT_REPEAT = 20
+
+
+def collection_count_for(size: int) -> int:
+    """Scale the number of collections with the data, up to a few hundred."""
+    return min(max(size // 200, 5), 500)
+
+
+def model_operations(model, size: int, repeat: int) -> dict:
+    """
+    Return the benchmarked operations of every public Model method. Each
+    operation takes the sample index so writes never hit duplicates.
+
+    Args:
+        model: The Model class of the benchmarked backend.
+        size (int): The number of generated rows.
+        repeat (int): The number of samples per operation.
+    """
+    from Utils.api_requests import SetInfo
+
+    names = collection_names(collection_count_for(size))
+    existing_ids = [str(20000 + (i * 7919) % size) for i in range(repeat)]
+
+    def new_set(i: int) -> SetInfo:
+        return SetInfo(str(900000 + i), "New Set", "url", "brickset_url", "2024", "100")
+
+    return {
+        "get_all_collections": lambda i: model.get_all_collections(),
+        "get_wishlist_data": lambda i: model.get_wishlist_data(),
+        "get_all_collected_sets": lambda i: model.get_all_collected_sets(),
+        "get_collection_data": lambda i: model.get_collection_data(names[i % len(names)]),
+        "get_collection_data.as_string": lambda i: model.get_collection_data(
+            names[i % len(names)], as_string=True
+        ),
+        "collection_exists": lambda i: model.collection_exists(names[-1]),
+        "set_in_collection": lambda i: model.set_in_collection(existing_ids[i], names[0]),
+        "set_in_wishlist": lambda i: model.set_in_wishlist(existing_ids[i]),
+        "create_collection": lambda i: model.create_collection(f"Bench {i}", "benchmark"),
+        "save_collected_set": lambda i: model.save_collected_set(new_set(i), names[0], "notes"),
+        "save_to_wishlist": lambda i: model.save_to_wishlist(new_set(i), "notes"),
+        "update_wishlisted_set_notes": lambda i: model.update_wishlisted_set_notes(
+            existing_ids[i], f"updated {i}"
+        ),
+        "update_collected_set_notes": lambda i: model.update_collected_set_notes(
+            names[0], existing_ids[i], f"updated {i}"
+        ),
+        "remove_from_collection": lambda i: model.remove_from_collection(
+            names[0], str(900000 + i)
+        ),
+        "remove_from_wishlist": lambda i: model.remove_from_wishlist(str(900000 + i)),
+        "delete_collection": lambda i: model.delete_collection(f"Bench {i}"),
+    }
+
+
+def bench_backend(backend: str, model, size: int, repeat: int) -> list:
+    """Run all Model operations of one backend on freshly generated data."""
+    generate_user_data("UserData", size, size, collection_count_for(size))
+
+    results = []
+    for name, operation in model_operations(model, size, repeat).items():
+        samples = [timed(operation, i) for i in range(repeat)]
+        results.append(summarize(f"{backend}.{name}", size, samples))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark every public Model method.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_MODEL_SIZES)))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", help="Result file, defaults to Benchmarks/results.")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    output = os.path.abspath(args.output) if args.output else None
+    work_directory = tempfile.mkdtemp(prefix="brickbuddy-bench-")
+    os.chdir(work_directory)
+
+    from Models import data_model
+
+    # Whether each backend reads the binary snapshots or parses the CSV files
+    backends = {"csv": False, "snapshot": True}
+
+    try:
+        results = []
+        for size in sizes:
+            for backend, use_snapshots in backends.items():
+                data_model.USE_SNAPSHOTS = use_snapshots
+                results += bench_backend(backend, data_model.Model, size, args.repeat)
+    finally:
+        shutil.rmtree(work_directory, ignore_errors=True)
+
+    print_results(results)
+    path = write_results(
+        "model",
+        results,
+        {"sizes": sizes, "repeat": args.repeat, "backends": list(backends)},
+        output,
+    )
+    print(f"Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
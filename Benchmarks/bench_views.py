@@ -0,0 +1,202 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from common import (
+    DEFAULT_SIZES,
+    print_results,
+    rss_bytes,
+    summarize,
+    timed,
+    write_csv_rows,
+    write_results,
+)
+
+BENCHMARK_COLLECTION = "Benchmark Collection"
+
+
+def write_user_data(catalog_sets: list, size: int) -> None:
+    """
+    Write UserData CSVs holding size wishlisted sets, collections and
+    collected sets, in the current directory.
+
+    Args:
+        catalog_sets (list): Sets in the Brickset response format.
+        size (int): The number of items per file.
+    """
+    rows = [
+        [
+            s["setID"],
+            s["name"],
+            s["image"]["imageURL"],
+            s["bricksetURL"],
+            s["year"],
+            s["pieces"],
+        ]
+        for s in catalog_sets[:size]
+    ]
+    write_csv_rows(
+        os.path.join("UserData", "wishlist.csv"),
+        ["set_id", "name", "url", "brickset_url", "year", "pieces", "notes"],
+        (row + ["notes"] for row in rows),
+    )
+    write_csv_rows(
+        os.path.join("UserData", "collections.csv"),
+        ["collection_name", "collection_description"],
+        [[BENCHMARK_COLLECTION, "benchmark"]]
+        + [[f"Collection {i}", "generated"] for i in range(size - 1)],
+    )
+    write_csv_rows(
+        os.path.join("UserData", "collected_sets.csv"),
+        ["collection_name", "set_id", "name", "url", "brickset_url", "year", "pieces", "notes"],
+        ([BENCHMARK_COLLECTION] + row + ["notes"] for row in rows),
+    )
+
+
+def load_all_batches(app, window, display_next: callable) -> list:
+    """
+    Press Load More until everything is displayed.
+
+    Returns:
+        list: The duration of each Load More, including layout, in milliseconds.
+    """
+    samples = []
+    while window.load_more_button.isVisibleTo(window):
+        samples.append(timed(lambda: (display_next(), app.processEvents())))
+    return samples
+
+
+def bench_view(app, window, name: str, size: int, load_view: callable, display_next: callable) -> list:
+    """
+    Measure construction, Load More latency and memory growth of one view.
+
+    Args:
+        name (str): The name of the view in the results.
+        size (int): The number of items in the view.
+        load_view (callable): Builds the view with its first batch.
+        display_next (callable): Displays the next batch of the view.
+    """
+    rss_before = rss_bytes()
+    construct = timed(lambda: (load_view(), app.processEvents()))
+    batches = load_all_batches(app, window, display_next)
+    rss_after = rss_bytes()
+
+    results = [summarize(f"{name}.construct", size, [construct])]
+    if batches:
+        results.append(summarize(f"{name}.load_more", size, batches))
+    displayed = window.grid_layout.count()
+    total = construct + sum(batches)
+    results.append(summarize(f"{name}.per_card", size, [total / max(displayed, 1)]))
+    results.append(
+        summarize(f"{name}.memory_growth", size, [(rss_after - rss_before) / 1024], "kB")
+    )
+    return results
+
+
+def bench_size(app, server, size: int) -> list:
+    """Run all view benchmarks with a given number of items."""
+    import main
+    from Utils.api_requests import SetInfo
+
+    catalog_sets = [server.service.set_to_json(s) for s in server.service.catalog["sets"]]
+    write_user_data(catalog_sets, size)
+    sets = [
+        SetInfo(s["setID"], s["name"], s["image"]["imageURL"], s["bricksetURL"], s["year"], s["pieces"])
+        for s in catalog_sets[:size]
+    ]
+
+    window = main.MainWindow()
+    window.show()
+    # Let the startup revalidation finish so it doesn't replace the benchmark sets
+    deadline = time.perf_counter() + 10
+    while window.current_theme not in window.theme_sets_cache and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+
+    results = []
+    window.sets = sets
+    results += bench_view(
+        app,
+        window,
+        "theme_view",
+        size,
+        window.load_theme_selection_view,
+        window.display_next_sets_batch,
+    )
+    build_samples = [timed(window.build_set_card) for _ in range(min(size, 50))]
+    results.append(summarize("set_card.build", size, build_samples))
+
+    results += bench_view(
+        app, window, "wishlist_view", size, window.load_wishlist_view, window.display_next_wishlist_batch
+    )
+    results += bench_view(
+        app,
+        window,
+        "collections_view",
+        size,
+        window.load_collections_view,
+        window.display_next_batch_of_collections,
+    )
+    results += bench_view(
+        app,
+        window,
+        "collection_sets_view",
+        size,
+        lambda: window.load_collection_sets_view(BENCHMARK_COLLECTION, "benchmark"),
+        window.display_next_collected_sets_batch,
+    )
+
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MainWindow views offscreen.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--latency-ms", type=float, default=0, help="Image server latency.")
+    parser.add_argument("--output", help="Result file, defaults to Benchmarks/results.")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.pop("BRICKSET_API_URL", None)
+
+    # Run against a throwaway UserData directory
+    output = os.path.abspath(args.output) if args.output else None
+    work_directory = tempfile.mkdtemp(prefix="brickbuddy-bench-")
+    os.chdir(work_directory)
+    os.makedirs("UserData")
+
+    import brickse
+    from PyQt6 import QtCore, QtWidgets
+    from Utils.api_setup import use_api_url, OFFLINE_API_KEY
+    from Utils.fake_brickset import FakeBricksetServer, generate_catalog
+
+    server = FakeBricksetServer(
+        generate_catalog(set_count=max(sizes)), latency_ms=args.latency_ms
+    ).start()
+    use_api_url(server.api_url)
+    brickse.init(OFFLINE_API_KEY)
+    app = QtWidgets.QApplication([])
+
+    try:
+        results = []
+        for size in sizes:
+            results += bench_size(app, server, size)
+    finally:
+        server.stop()
+        shutil.rmtree(work_directory, ignore_errors=True)
+
+    print_results(results)
+    path = write_results(
+        "views", results, {"qt": QtCore.QT_VERSION_STR, "sizes": sizes}, output
+    )
+    print(f"Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Let the benchmarks import the app modules when run as scripts
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIRECTORY not in sys.path:
+    sys.path.insert(0, PROJECT_DIRECTORY)
+
+RESULTS_DIRECTORY = os.path.join(PROJECT_DIRECTORY, "Benchmarks", "results")
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+from Utils.memory import rss_bytes  # noqa: E402  re-exported for the benchmarks
+from Utils.profiling import percentile  # noqa: E402  re-exported for the benchmarks
+
+
+def timed(func: callable, *args, **kwargs) -> float:
+    """
+    Call a function once and return its duration.
+
+    Returns:
+        float: The duration in milliseconds.
+    """
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000
+
+
+def summarize(name: str, size: int, samples: list, unit: str = "ms") -> dict:
+    """
+    Summarize samples of one measurement.
+
+    Args:
+        name (str): The name of the measurement.
+        size (int): The number of items the measurement ran with.
+        samples (list): The measured values.
+        unit (str): The unit of the values.
+    """
+    result = {
+        "name": name,
+        "size": size,
+        "unit": unit,
+        "samples": len(samples),
+        "total": sum(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "p99": percentile(samples, 0.99),
+        "max": max(samples),
+    }
+    if unit == "ms" and result["total"] > 0:
+        result["ops_per_second"] = len(samples) / (result["total"] / 1000)
+    return result
+
+
+def git_commit() -> str:
+    """Return the short hash of the checked out commit, or "unknown"."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_DIRECTORY,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(benchmark: str, results: list, extra: dict = None, path: str = None) -> str:
+    """
+    Write benchmark results as JSON, named after the benchmark and commit.
+
+    Args:
+        benchmark (str): The name of the benchmark suite.
+        results (list): The summaries made by summarize.
+        extra (dict): Additional environment information.
+        path (str): The output file, defaults to Benchmarks/results.
+
+    Returns:
+        str: The path of the written file.
+    """
+    commit = git_commit()
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    if path is None:
+        os.makedirs(RESULTS_DIRECTORY, exist_ok=True)
+        path = os.path.join(RESULTS_DIRECTORY, f"{benchmark}-{commit}-{timestamp}.json")
+
+    document = {
+        "benchmark": benchmark,
+        "commit": commit,
+        "timestamp": timestamp,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **(extra or {}),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def write_csv_rows(path: str, headers: list, rows) -> None:
+    """
+    Write an iterable of rows to a CSV file the way Model does.
+
+    Args:
+        path (str): The path to the CSV file.
+        headers (list): The header row.
+        rows: The rows to write.
+    """
+    with open(path, mode="w", newline="") as file:
+        writer = csv.writer(file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+
+def print_results(results: list) -> None:
+    """Print results as an aligned table."""
+    for result in results:
+        print(
+            f"{result['name']:<36} {result['size']:>6} "
+            f"median {result['median']:>10.3f}{result['unit']:<3} "
+            f"p95 {result['p95']:>10.3f}{result['unit']:<3} n={result['samples']}"
+        )
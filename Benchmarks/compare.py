@@ -0,0 +1,52 @@
+import argparse
+import json
+
+# Relative slowdown of the median reported as a regression
+DEFAULT_THRESHOLD = 0.10
+
+
+def load_results(path: str) -> tuple:
+    """
+    Load a result file.
+
+    Args:
+        path (str): The path to a file written by a benchmark.
+
+    Returns:
+        tuple: The results keyed by measurement name and size, and the whole document.
+    """
+    with open(path, "r") as f:
+        document = json.load(f)
+    return {(r["name"], r["size"]): r for r in document["results"]}, document
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    baseline, baseline_document = load_results(args.baseline)
+    candidate, candidate_document = load_results(args.candidate)
+    print(f"{baseline_document['commit']} -> {candidate_document['commit']}")
+
+    regressions = 0
+    for key in sorted(baseline.keys() & candidate.keys()):
+        before = baseline[key]["median"]
+        after = candidate[key]["median"]
+        change = (after - before) / before if before else 0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(
+            f"{key[0]:<36} {key[1]:>6} {before:>12.3f} -> {after:>12.3f} "
+            f"{baseline[key]['unit']:<3} {change:+7.1%}{flag}"
+        )
+
+    raise SystemExit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import argparse
+import os
+import random
+
+from common import write_csv_rows
+
+WISHLIST_HEADERS = ["set_id", "name", "url", "brickset_url", "year", "pieces", "notes"]
+COLLECTIONS_HEADERS = ["collection_name", "collection_description"]
+COLLECTED_SETS_HEADERS = [
+    "collection_name",
+    "set_id",
+    "name",
+    "url",
+    "brickset_url",
+    "year",
+    "pieces",
+    "notes",
+]
+
+NAME_WORDS = [
+    "Millennium", "Falcon", "Police", "Station", "Fire", "Truck", "Castle", "Hogwarts",
+    "Express", "Tower", "Bridge", "Space", "Shuttle", "Pirate", "Ship", "Haunted", "House",
+]
+NOTES = [
+    "",
+    "",
+    "Bought on sale",
+    "Missing 2 pieces, see \"box 3\"",
+    "Gift from grandma, keep sealed",
+    "Sorted, bagged\nand stored in the attic",
+]
+
+
+def generate_set(rng: random.Random, index: int) -> list:
+    """
+    Generate the columns shared by wishlist and collected set rows.
+
+    Args:
+        rng (random.Random): The random generator.
+        index (int): The index of the set, making its id unique.
+    """
+    number = f"{10000 + index}-1"
+    return [
+        str(20000 + index),
+        " ".join(rng.sample(NAME_WORDS, rng.randint(2, 4))),
+        f"https://images.brickset.com/sets/images/{number}.jpg",
+        f"https://brickset.com/sets/{number}",
+        str(rng.randint(1980, 2024)),
+        str(rng.randint(10, 7500)),
+    ]
+
+
+def collection_names(count: int) -> list:
+    """Return the names of generated collections, starting with the default one."""
+    return ["Default Collection"] + [f"Collection {i}" for i in range(1, count)]
+
+
+def generate_user_data(
+    directory: str,
+    wishlist_rows: int,
+    collected_rows: int,
+    collection_count: int,
+    seed: int = 0,
+) -> None:
+    """
+    Write realistic wishlist, collections and collected sets CSVs. Rows are
+    streamed to disk, so hundreds of thousands of rows need little memory.
+
+    Args:
+        directory (str): The UserData directory to write to.
+        wishlist_rows (int): The number of wishlisted sets.
+        collected_rows (int): The number of collected sets, spread over the collections.
+        collection_count (int): The number of collections.
+        seed (int): The seed of the random generator.
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    names = collection_names(collection_count)
+
+    write_csv_rows(
+        os.path.join(directory, "collections.csv"),
+        COLLECTIONS_HEADERS,
+        ([name, f"Generated collection {name}"] for name in names),
+    )
+    write_csv_rows(
+        os.path.join(directory, "wishlist.csv"),
+        WISHLIST_HEADERS,
+        (generate_set(rng, i) + [rng.choice(NOTES)] for i in range(wishlist_rows)),
+    )
+    write_csv_rows(
+        os.path.join(directory, "collected_sets.csv"),
+        COLLECTED_SETS_HEADERS,
+        (
+            [names[i % collection_count]] + generate_set(rng, i) + [rng.choice(NOTES)]
+            for i in range(collected_rows)
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate large UserData files.")
+    parser.add_argument("--output", default="UserData")
+    parser.add_argument("--wishlist", type=int, default=10000)
+    parser.add_argument("--collected", type=int, default=100000)
+    parser.add_argument("--collections", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generate_user_data(args.output, args.wishlist, args.collected, args.collections, args.seed)
+    print(
+        f"Wrote {args.wishlist} wishlisted sets, {args.collected} collected sets "
+        f"and {args.collections} collections to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
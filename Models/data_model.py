@@ -1,19 +1,83 @@
 import csv
+import functools
+import io
 import os
-from PyQt6.QtWidgets import QMessageBox
+from Models.data_snapshot import DataSnapshot, build_snapshot, write_snapshot
+from Models.model_events import model_changes, ModelChange, INSERTED, UPDATED, DELETED
 from Utils.api_requests import SetInfo
+from Utils.file_lock import FileLock
+from Utils.instrumentation import instrumented
 from Utils.message_handler import MessageBox
 
 DATA_DIRECTORY = "UserData"
 COLLECTIONS_FILE = os.path.join(DATA_DIRECTORY, "collections.csv")
 COLLECTED_SETS_FILE = os.path.join(DATA_DIRECTORY, "collected_sets.csv")
 WISHLIST_FILE = os.path.join(DATA_DIRECTORY, "wishlist.csv")
+DATA_FILES = (COLLECTIONS_FILE, COLLECTED_SETS_FILE, WISHLIST_FILE)
+
+# Shared by all processes using the data directory, see locked
+LOCK_FILE = os.path.join(DATA_DIRECTORY, ".lock")
+# Counter increased by every write to a data file
+GENERATION_FILE = os.path.join(DATA_DIRECTORY, "generation")
+# Read data files from binary snapshots instead of parsing CSV, see open_snapshot
+USE_SNAPSHOTS = True
+
+COLLECTED_SETS_HEADERS = [
+    "collection_name",
+    "set_id",
+    "name",
+    "url",
+    "brickset_url",
+    "year",
+    "pieces",
+    "notes",
+]
+WISHLIST_HEADERS = ["set_id", "name", "url", "brickset_url", "year", "pieces", "notes"]
+
+data_lock = FileLock(LOCK_FILE)
+# Signatures of the data files after this process last wrote them, so
+# changes made by other processes can be told apart from our own
+own_write_signatures = {}
+# Signatures of data files with ragged rows, which have no snapshot and are
+# read as CSV until they change
+ragged_signatures = {}
+
+
+def locked(func):
+    """
+    Run a Model operation while holding the data lock, so read-modify-write
+    operations of several windows or scripts sharing the data directory
+    don't overwrite each other's changes. Operations that warn the user hold
+    the lock only around their check and write instead, as other processes
+    would wait for the dialog.
+
+    Row changes are reported to model_changes after the lock is released,
+    so observers don't run while other processes are locked out.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with model_changes.deferred(), data_lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def file_signature(file_path: str) -> tuple | None:
+    """Return what changes when a file is written, None if it doesn't exist."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
 class CollectedSet:
     """
     A class representing a collected set.
     """
 
+    __slots__ = ("set_info", "collection_name", "notes")
+
     def __init__(self, set_info, collection_name, notes):
         self.set_info = set_info
         self.collection_name = collection_name
@@ -21,26 +85,40 @@ class CollectedSet:
 
 class Model:
     @staticmethod
-    def create_collection(collection_name, collection_description):
+    @instrumented("model.create_collection")
+    def create_collection(collection_name, collection_description) -> bool:
         """
         Saves a new collection to the collections file.
 
         Args:
             collection_name (str): The name of the collection to be saved.
             collection_description (str): The description of the collection.
-        """
-        if Model.collection_exists(collection_name):
-            MessageBox.show_warning("Collection already exists")
-            return
 
-        Model.append_to_csv(
-            COLLECTIONS_FILE,
-            ["collection_name", "collection_description"],
-            [collection_name, collection_description],
-        )
+        Returns:
+            bool: Whether the collection was saved, False if it already exists.
+        """
+        # The warning is shown after the lock is released, other processes
+        # would wait for the dialog otherwise
+        with model_changes.deferred(), data_lock:
+            created = not Model.collection_exists(collection_name)
+            if created:
+                row = [collection_name, collection_description]
+                Model.append_to_csv(
+                    COLLECTIONS_FILE,
+                    ["collection_name", "collection_description"],
+                    row,
+                )
+                model_changes.notify(
+                    [ModelChange(INSERTED, COLLECTIONS_FILE, collection_name, row)]
+                )
+
+        if not created:
+            MessageBox.show_warning("Collection already exists")
+        return created
 
     @staticmethod
-    def save_collected_set(set_data: SetInfo, collection_name, notes):
+    @instrumented("model.save_collected_set")
+    def save_collected_set(set_data: SetInfo, collection_name, notes) -> bool:
         """
         Saves a collected set to the collection data file.
 
@@ -48,38 +126,26 @@ class Model:
             set_data (SetInfo): The set information to be saved.
             collection_name (str): The name of the collection to which the set belongs.
             notes (str): Additional notes about the set.
+
+        Returns:
+            bool: Whether the set was saved, False if it is already in the collection.
         """
-        if Model.set_in_collection(str(set_data.id), collection_name):
+        with model_changes.deferred(), data_lock:
+            saved = not Model.set_in_collection(str(set_data.id), collection_name)
+            if saved:
+                row = Model.collected_set_row(set_data, collection_name, notes)
+                Model.append_to_csv(COLLECTED_SETS_FILE, COLLECTED_SETS_HEADERS, row)
+                model_changes.notify([Model.collected_set_change(INSERTED, row)])
+
+        if not saved:
             MessageBox.show_warning(
                 f"Set {set_data.id} already in collection {collection_name}"
             )
-            return
-
-        Model.append_to_csv(
-            COLLECTED_SETS_FILE,
-            [
-                "collection_name",
-                "set_id",
-                "name",
-                "url",
-                "brickset_url",
-                "year",
-                "pieces",
-                "notes",
-            ],
-            [
-                collection_name,
-                set_data.id,
-                set_data.name,
-                set_data.image_url,
-                set_data.brickset_url,
-                set_data.year,
-                set_data.pieces,
-                notes,
-            ],
-        )
+        return saved
 
     @staticmethod
+    @instrumented("model.remove_from_collection")
+    @locked
     def remove_from_collection(collection_name, set_id):
         """
         Removes a set from a specific collection.
@@ -88,25 +154,161 @@ class Model:
             collection_name (str): The name of the collection.
             set_id (str): The ID of the set to be removed.
         """
-        collection_data = Model.get_collection_data(collection_name, as_string=True)
-        collection_data = [row for row in collection_data if row[1] != set_id]
+        all_collected_sets = Model.get_all_collected_sets()
+        removed_rows = [
+            row
+            for row in all_collected_sets
+            if row[0] == collection_name and row[1] == set_id
+        ]
+        all_collected_sets = [
+            row
+            for row in all_collected_sets
+            if not (row[0] == collection_name and row[1] == set_id)
+        ]
 
         Model.write_to_csv(
             COLLECTED_SETS_FILE,
-            [
-                "collection_name",
-                "set_id",
-                "name",
-                "url",
-                "brickset_url",
-                "year",
-                "pieces",
-                "notes",
-            ],
-            collection_data,
+            COLLECTED_SETS_HEADERS,
+            all_collected_sets,
         )
+        model_changes.notify([Model.collected_set_change(DELETED, row) for row in removed_rows])
 
     @staticmethod
+    @instrumented("model.save_collected_sets")
+    def save_collected_sets(sets: list, collection_name: str, notes: str = "") -> int:
+        """
+        Saves many sets to a collection with a single write.
+        Sets already in the collection are skipped.
+
+        Args:
+            sets (list): The SetInfo objects to be saved.
+            collection_name (str): The name of the collection.
+            notes (str): Notes stored with every set.
+
+        Returns:
+            int: The number of added sets.
+        """
+        new_rows = []
+        with model_changes.deferred(), data_lock:
+            collection_found = Model.collection_exists(collection_name)
+            if collection_found:
+                collected_ids = {
+                    row[1]
+                    for row in Model.get_all_collected_sets()
+                    if row[0] == collection_name
+                }
+                for set_data in sets:
+                    if str(set_data.id) in collected_ids:
+                        continue
+                    collected_ids.add(str(set_data.id))
+                    new_rows.append(Model.collected_set_row(set_data, collection_name, notes))
+
+                Model.append_rows_to_csv(COLLECTED_SETS_FILE, COLLECTED_SETS_HEADERS, new_rows)
+                model_changes.notify(
+                    [Model.collected_set_change(INSERTED, row) for row in new_rows]
+                )
+
+        if not collection_found:
+            MessageBox.show_warning(f"Collection {collection_name} does not exist")
+        return len(new_rows)
+
+    @staticmethod
+    @instrumented("model.move_collected_sets")
+    def move_collected_sets(set_ids: list, source_collection: str, target_collection: str) -> int:
+        """
+        Moves sets from one collection to another with a single write.
+        Notes are kept. Sets already in the target collection are only
+        removed from the source collection.
+
+        Args:
+            set_ids (list): The IDs of the sets to be moved.
+            source_collection (str): The name of the collection the sets are in.
+            target_collection (str): The name of the collection to move them to.
+
+        Returns:
+            int: The number of moved sets.
+        """
+        if source_collection == target_collection:
+            return 0
+
+        with model_changes.deferred(), data_lock:
+            target_found = Model.collection_exists(target_collection)
+            moved_count = 0
+            if target_found:
+                moved_count = Model.move_collected_rows(
+                    {str(set_id) for set_id in set_ids}, source_collection, target_collection
+                )
+
+        if not target_found:
+            MessageBox.show_warning(f"Collection {target_collection} does not exist")
+        return moved_count
+
+    @staticmethod
+    def move_collected_rows(set_ids: set, source_collection: str, target_collection: str) -> int:
+        """
+        Moves collected set rows to another collection, see move_collected_sets.
+        Call it while holding the data lock.
+
+        Returns:
+            int: The number of moved sets.
+        """
+        all_collected_sets = Model.get_all_collected_sets()
+        target_ids = {row[1] for row in all_collected_sets if row[0] == target_collection}
+
+        updated_data = []
+        changes = []
+        for row in all_collected_sets:
+            if row[0] == source_collection and row[1] in set_ids:
+                changes.append(Model.collected_set_change(DELETED, row))
+                if row[1] in target_ids:
+                    continue
+                target_ids.add(row[1])
+                row = [target_collection] + row[1:]
+                changes.append(Model.collected_set_change(INSERTED, row))
+            updated_data.append(row)
+
+        moved_count = sum(1 for change in changes if change.kind == DELETED)
+        if moved_count:
+            Model.write_to_csv(COLLECTED_SETS_FILE, COLLECTED_SETS_HEADERS, updated_data)
+            model_changes.notify(changes)
+        return moved_count
+
+    @staticmethod
+    @instrumented("model.remove_many_from_collection")
+    @locked
+    def remove_many_from_collection(collection_name: str, set_ids: list) -> int:
+        """
+        Removes many sets from a collection with a single write.
+
+        Args:
+            collection_name (str): The name of the collection.
+            set_ids (list): The IDs of the sets to be removed.
+
+        Returns:
+            int: The number of removed sets.
+        """
+        set_ids = {str(set_id) for set_id in set_ids}
+        all_collected_sets = Model.get_all_collected_sets()
+        remaining_sets = [
+            row
+            for row in all_collected_sets
+            if not (row[0] == collection_name and row[1] in set_ids)
+        ]
+
+        removed_count = len(all_collected_sets) - len(remaining_sets)
+        if removed_count:
+            Model.write_to_csv(COLLECTED_SETS_FILE, COLLECTED_SETS_HEADERS, remaining_sets)
+            model_changes.notify(
+                [
+                    Model.collected_set_change(DELETED, row)
+                    for row in all_collected_sets
+                    if row[0] == collection_name and row[1] in set_ids
+                ]
+            )
+        return removed_count
+
+    @staticmethod
+    @instrumented("model.get_all_collections")
     def get_all_collections() -> list:
         """
         Retrieves all collection names.
@@ -117,6 +319,8 @@ class Model:
         return Model.read_csv(COLLECTIONS_FILE, skip_header=True)
 
     @staticmethod
+    @instrumented("model.update_wishlisted_set_notes")
+    @locked
     def update_wishlisted_set_notes(set_id, notes) -> None:
         """
         Updates notes for a specific set in the wishlist.
@@ -137,11 +341,16 @@ class Model:
 
         Model.write_to_csv(
             WISHLIST_FILE,
-            ["set_id", "name", "url", "brickset_url", "year", "pieces", "notes"],
+            WISHLIST_HEADERS,
             updated_data,
         )
+        model_changes.notify(
+            [Model.wishlist_change(UPDATED, row) for row in updated_data if row[0] == set_id]
+        )
 
     @staticmethod
+    @instrumented("model.update_collected_set_notes")
+    @locked
     def update_collected_set_notes(collection_name, set_id, notes) -> None:
         """
         Updates notes for a specific set in a collection.
@@ -151,32 +360,31 @@ class Model:
             set_id (str): The ID of the set.
             notes (str): New notes for the set.
         """
-        collection_data = Model.get_collection_data(collection_name, as_string=True)
+        all_collected_sets = Model.get_all_collected_sets()
         updated_data = [
             (
                 [row[0], row[1], row[2], row[3], row[4], row[5], row[6], notes]
-                if row[1] == set_id
+                if row[0] == collection_name and row[1] == set_id
                 else row
             )
-            for row in collection_data
+            for row in all_collected_sets
         ]
 
         Model.write_to_csv(
             COLLECTED_SETS_FILE,
-            [
-                "collection_name",
-                "set_id",
-                "name",
-                "url",
-                "brickset_url",
-                "year",
-                "pieces",
-                "notes",
-            ],
+            COLLECTED_SETS_HEADERS,
             updated_data,
         )
+        model_changes.notify(
+            [
+                Model.collected_set_change(UPDATED, row)
+                for row in updated_data
+                if row[0] == collection_name and row[1] == set_id
+            ]
+        )
 
     @staticmethod
+    @instrumented("model.get_collection_data")
     def get_collection_data(collection_name, as_string=False) -> list:
         """
         Retrieves all sets in a specific collection.
@@ -188,8 +396,7 @@ class Model:
         Returns:
             list: A list of sets in the collection.
         """
-        collection_data = Model.read_csv(COLLECTED_SETS_FILE, skip_header=True)
-        collection_data = [row for row in collection_data if row[0] == collection_name]
+        collection_data = Model.select_rows(COLLECTED_SETS_FILE, 0, collection_name)
         if as_string:
             return collection_data
         return [
@@ -197,6 +404,7 @@ class Model:
         ]
 
     @staticmethod
+    @instrumented("model.get_all_collected_sets")
     def get_all_collected_sets() -> list:
         """
         Retrieves all collected sets.
@@ -207,6 +415,8 @@ class Model:
         return Model.read_csv(COLLECTED_SETS_FILE, skip_header=True)
 
     @staticmethod
+    @instrumented("model.delete_collection")
+    @locked
     def delete_collection(collection_name: str) -> None:
         """
         Deletes a collection from the collections file.
@@ -223,26 +433,24 @@ class Model:
         )
 
         all_collected_sets = Model.get_all_collected_sets()
+        changes = [ModelChange(DELETED, COLLECTIONS_FILE, collection_name)] + [
+            Model.collected_set_change(DELETED, row)
+            for row in all_collected_sets
+            if row[0] == collection_name
+        ]
         all_collected_sets = [
             row for row in all_collected_sets if row[0] != collection_name
         ]
 
         Model.write_to_csv(
             COLLECTED_SETS_FILE,
-            [
-                "collection_name",
-                "set_id",
-                "name",
-                "url",
-                "brickset_url",
-                "year",
-                "pieces",
-                "notes",
-            ],
+            COLLECTED_SETS_HEADERS,
             all_collected_sets,
         )
+        model_changes.notify(changes)
 
     @staticmethod
+    @instrumented("model.get_wishlist_data")
     def get_wishlist_data() -> list:
         """
         Retrieves all wishlist items.
@@ -253,33 +461,88 @@ class Model:
         return Model.read_csv(WISHLIST_FILE, skip_header=True)
 
     @staticmethod
-    def save_to_wishlist(set_data: SetInfo, notes: str) -> None:
+    @instrumented("model.save_to_wishlist")
+    def save_to_wishlist(set_data: SetInfo, notes: str) -> bool:
         """
         Saves a set to the wishlist.
 
         Args:
             set_data (SetInfo): The set information to be saved.
             notes (str): Additional notes about the set.
+
+        Returns:
+            bool: Whether the set was saved, False if it is already in the wishlist.
         """
-        if Model.set_in_wishlist(str(set_data.id)):
+        with model_changes.deferred(), data_lock:
+            saved = not Model.set_in_wishlist(str(set_data.id))
+            if saved:
+                row = Model.wishlist_row(set_data, notes)
+                Model.append_to_csv(WISHLIST_FILE, WISHLIST_HEADERS, row)
+                model_changes.notify([Model.wishlist_change(INSERTED, row)])
+
+        if not saved:
             MessageBox.show_warning(f"Set {set_data.id} already in wishlist")
-            return
+        return saved
 
-        Model.append_to_csv(
-            WISHLIST_FILE,
-            ["set_id", "name", "url", "brickset_url", "year", "pieces", "notes"],
-            [
-                set_data.id,
-                set_data.name,
-                set_data.image_url,
-                set_data.brickset_url,
-                set_data.year,
-                set_data.pieces,
-                notes,
-            ],
-        )
+    @staticmethod
+    @instrumented("model.save_many_to_wishlist")
+    @locked
+    def save_many_to_wishlist(sets: list, notes: str = "") -> int:
+        """
+        Saves many sets to the wishlist with a single write.
+        Sets already in the wishlist are skipped.
+
+        Args:
+            sets (list): The SetInfo objects to be saved.
+            notes (str): Notes stored with every set.
+
+        Returns:
+            int: The number of added sets.
+        """
+        wishlisted_ids = {row[0] for row in Model.get_wishlist_data()}
+        new_rows = []
+        for set_data in sets:
+            if str(set_data.id) in wishlisted_ids:
+                continue
+            wishlisted_ids.add(str(set_data.id))
+            new_rows.append(Model.wishlist_row(set_data, notes))
+
+        Model.append_rows_to_csv(WISHLIST_FILE, WISHLIST_HEADERS, new_rows)
+        model_changes.notify([Model.wishlist_change(INSERTED, row) for row in new_rows])
+        return len(new_rows)
 
     @staticmethod
+    @instrumented("model.remove_many_from_wishlist")
+    @locked
+    def remove_many_from_wishlist(set_ids: list) -> int:
+        """
+        Removes many sets from the wishlist with a single write.
+
+        Args:
+            set_ids (list): The IDs of the sets to be removed.
+
+        Returns:
+            int: The number of removed sets.
+        """
+        set_ids = {str(set_id) for set_id in set_ids}
+        wishlist_data = Model.get_wishlist_data()
+        remaining_data = [row for row in wishlist_data if row[0] not in set_ids]
+
+        removed_count = len(wishlist_data) - len(remaining_data)
+        if removed_count:
+            Model.write_to_csv(WISHLIST_FILE, WISHLIST_HEADERS, remaining_data)
+            model_changes.notify(
+                [
+                    Model.wishlist_change(DELETED, row)
+                    for row in wishlist_data
+                    if row[0] in set_ids
+                ]
+            )
+        return removed_count
+
+    @staticmethod
+    @instrumented("model.remove_from_wishlist")
+    @locked
     def remove_from_wishlist(set_id: str) -> None:
         """
         Removes a set from the wishlist.
@@ -288,15 +551,75 @@ class Model:
             set_id (str): The ID of the set to be removed.
         """
         wishlist_data = Model.get_wishlist_data()
-        wishlist_data = [row for row in wishlist_data if row[0] != set_id]
+        remaining_data = [row for row in wishlist_data if row[0] != set_id]
 
         Model.write_to_csv(
             WISHLIST_FILE,
-            ["set_id", "name", "url", "brickset_url", "year", "pieces", "notes"],
-            wishlist_data,
+            WISHLIST_HEADERS,
+            remaining_data,
+        )
+        model_changes.notify(
+            [Model.wishlist_change(DELETED, row) for row in wishlist_data if row[0] == set_id]
         )
 
     @staticmethod
+    @instrumented("model.update_set_metadata")
+    @locked
+    def update_set_metadata(updates: dict) -> int:
+        """
+        Replaces the stored name, image URL, Brickset URL, year and pieces of
+        sets in the wishlist and all collections. Notes are kept. Each data
+        file is rewritten once, and only if something changed. Runs off the
+        GUI thread, so it reports no row changes, see MetadataRefresh.finished.
+
+        Args:
+            updates (dict): Fresh SetInfo objects by the stored set ID.
+
+        Returns:
+            int: The number of updated rows.
+        """
+        updated_count = 0
+        for file_path, headers, id_index in (
+            (WISHLIST_FILE, WISHLIST_HEADERS, 0),
+            (COLLECTED_SETS_FILE, COLLECTED_SETS_HEADERS, 1),
+        ):
+            rows = Model.read_csv(file_path, skip_header=True)
+            updated_rows = [
+                Model.refreshed_row(row, id_index, updates.get(row[id_index]))
+                for row in rows
+            ]
+            changed_count = sum(1 for old, new in zip(rows, updated_rows) if old != new)
+            if changed_count:
+                Model.write_to_csv(file_path, headers, updated_rows)
+                updated_count += changed_count
+        return updated_count
+
+    @staticmethod
+    def refreshed_row(row: list, id_index: int, set_data: SetInfo | None) -> list:
+        """
+        Returns a stored row with the set details replaced by fresh ones.
+
+        Args:
+            row (list): The wishlist or collected sets row.
+            id_index (int): The column of the set ID, followed by the set details.
+            set_data (SetInfo | None): The fresh details, None to keep the row.
+        """
+        if set_data is None:
+            return row
+        return (
+            row[: id_index + 1]
+            + [
+                set_data.name,
+                set_data.image_url,
+                set_data.brickset_url,
+                str(set_data.year),
+                str(set_data.pieces),
+            ]
+            + row[id_index + 6 :]
+        )
+
+    @staticmethod
+    @instrumented("model.collection_exists")
     def collection_exists(collection_name: str) -> bool:
         """
         Checks if a collection exists.
@@ -307,10 +630,10 @@ class Model:
         Returns:
             bool: True if the collection exists, False otherwise.
         """
-        collections = Model.get_all_collections()
-        return any(row[0] == collection_name for row in collections)
+        return Model.column_contains(COLLECTIONS_FILE, 0, collection_name)
 
     @staticmethod
+    @instrumented("model.set_in_collection")
     def set_in_collection(set_id: str, collection_name: str) -> bool:
         """
         Checks if a set is already in a collection.
@@ -326,6 +649,7 @@ class Model:
         return any(row[1] == set_id for row in collection_data)
 
     @staticmethod
+    @instrumented("model.set_in_wishlist")
     def set_in_wishlist(set_id: str) -> bool:
         """
         Checks if a set is already in the wishlist.
@@ -336,10 +660,69 @@ class Model:
         Returns:
             bool: True if the set is in the wishlist, False otherwise.
         """
-        wishlist_data = Model.get_wishlist_data()
-        return any(row[0] == set_id for row in wishlist_data)
+        return Model.column_contains(WISHLIST_FILE, 0, set_id)
 
     @staticmethod
+    def collected_set_change(kind: str, row: list) -> ModelChange:
+        """Returns the change of a collected sets row, keyed by collection name and set ID."""
+        row = Model.stored_row(row)
+        return ModelChange(
+            kind, COLLECTED_SETS_FILE, (row[0], row[1]), None if kind == DELETED else row
+        )
+
+    @staticmethod
+    def wishlist_change(kind: str, row: list) -> ModelChange:
+        """Returns the change of a wishlist row, keyed by set ID."""
+        row = Model.stored_row(row)
+        return ModelChange(kind, WISHLIST_FILE, row[0], None if kind == DELETED else row)
+
+    @staticmethod
+    def stored_row(row: list) -> list:
+        """Returns a row as it is read back from a data file, all values as strings."""
+        return ["" if value is None else str(value) for value in row]
+
+    @staticmethod
+    def collected_set_row(set_data: SetInfo, collection_name: str, notes: str) -> list:
+        """
+        Returns the collected sets file row of a set.
+
+        Args:
+            set_data (SetInfo): The set information.
+            collection_name (str): The name of the collection.
+            notes (str): Additional notes about the set.
+        """
+        return [
+            collection_name,
+            set_data.id,
+            set_data.name,
+            set_data.image_url,
+            set_data.brickset_url,
+            set_data.year,
+            set_data.pieces,
+            notes,
+        ]
+
+    @staticmethod
+    def wishlist_row(set_data: SetInfo, notes: str) -> list:
+        """
+        Returns the wishlist file row of a set.
+
+        Args:
+            set_data (SetInfo): The set information.
+            notes (str): Additional notes about the set.
+        """
+        return [
+            set_data.id,
+            set_data.name,
+            set_data.image_url,
+            set_data.brickset_url,
+            set_data.year,
+            set_data.pieces,
+            notes,
+        ]
+
+    @staticmethod
+    @instrumented("model.append_to_csv")
     def append_to_csv(file_path: str, headers: list, row: list) -> None:
         """
         Appends a row to a CSV file, creating the file and adding headers if it doesn't exist.
@@ -349,33 +732,109 @@ class Model:
             headers (list): The headers for the CSV file.
             row (list): The row to append to the CSV file.
         """
-        file_exists = os.path.isfile(file_path)
-        with open(file_path, mode="a", newline="") as file:
-            writer = csv.writer(
-                file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
-            )
-            if not file_exists:
-                writer.writerow(headers)
-            writer.writerow(row)
+        with data_lock:
+            file_exists = os.path.isfile(file_path)
+            with open(file_path, mode="a", newline="") as file:
+                writer = csv.writer(
+                    file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
+                )
+                if not file_exists:
+                    writer.writerow(headers)
+                writer.writerow(row)
+            Model.record_write(file_path)
+
+    @staticmethod
+    @instrumented("model.append_rows_to_csv")
+    def append_rows_to_csv(file_path: str, headers: list, rows: list) -> None:
+        """
+        Appends many rows to a CSV file in one write, creating the file and adding headers if it doesn't exist.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            headers (list): The headers for the CSV file.
+            rows (list): The rows to append to the CSV file.
+        """
+        if not rows:
+            return
+
+        with data_lock:
+            file_exists = os.path.isfile(file_path)
+            with open(file_path, mode="a", newline="") as file:
+                writer = csv.writer(
+                    file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
+                )
+                if not file_exists:
+                    writer.writerow(headers)
+                writer.writerows(rows)
+            Model.record_write(file_path)
 
     @staticmethod
+    @instrumented("model.write_to_csv")
     def write_to_csv(file_path: str, headers: list, data: list) -> None:
         """
-        Writes data to a CSV file, including headers.
+        Writes data to a CSV file, including headers. The file is replaced
+        atomically, so other processes never read a half written file.
 
         Args:
             file_path (str): The path to the CSV file.
             headers (list): The headers for the CSV file.
             data (list): The data to write to the CSV file.
         """
-        with open(file_path, mode="w", newline="") as file:
-            writer = csv.writer(
-                file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
-            )
-            writer.writerow(headers)
-            writer.writerows(data)
+        with data_lock:
+            temp_path = file_path + ".tmp"
+            with open(temp_path, mode="w", newline="") as file:
+                writer = csv.writer(
+                    file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
+                )
+                writer.writerow(headers)
+                writer.writerows(data)
+            os.replace(temp_path, file_path)
+            Model.record_write(file_path)
+
+            if not USE_SNAPSHOTS:
+                return
+
+            # The written rows are at hand, so keep the snapshot up to date
+            rows = [headers] + [
+                ["" if value is None else str(value) for value in row] for row in data
+            ]
+            try:
+                snapshot = build_snapshot(
+                    file_path, rows, file_signature(file_path), Model.generation()
+                )
+            except ValueError:
+                return
+            write_snapshot(file_path, snapshot)
+
+    @staticmethod
+    def record_write(file_path: str) -> None:
+        """
+        Increases the generation counter after a data file was written and
+        remembers the file's signature. Called while holding the data lock.
+
+        Args:
+            file_path (str): The written data file.
+        """
+        generation = Model.generation() + 1
+        temp_path = GENERATION_FILE + ".tmp"
+        with open(temp_path, mode="w") as file:
+            file.write(str(generation))
+        os.replace(temp_path, GENERATION_FILE)
+        own_write_signatures[file_path] = file_signature(file_path)
 
     @staticmethod
+    def generation() -> int:
+        """
+        Returns the number of writes to the data files so far, by any process.
+        """
+        try:
+            with open(GENERATION_FILE, mode="r") as file:
+                return int(file.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    @staticmethod
+    @instrumented("model.read_csv")
     def read_csv(file_path: str, skip_header: bool = False) -> list:
         """
         Reads data from a CSV file.
@@ -390,8 +849,119 @@ class Model:
         if not os.path.isfile(file_path):
             return []
 
+        snapshot = Model.open_snapshot(file_path)
+        if snapshot is not None:
+            with snapshot:
+                return snapshot.rows(1 if skip_header else 0)
+
         with open(file_path, mode="r") as file:
             reader = csv.reader(file)
             if skip_header:
                 next(reader, None)
             return [row for row in reader]
+
+    @staticmethod
+    def open_snapshot(file_path: str) -> DataSnapshot | None:
+        """
+        Opens the binary snapshot of a data file, so it can be read without
+        parsing CSV. A missing snapshot, or one that doesn't match the file's
+        signature and the data generation, is rebuilt from the CSV file.
+
+        Args:
+            file_path (str): The path to the CSV file.
+
+        Returns:
+            DataSnapshot | None: The snapshot, None if the file doesn't exist, has
+                ragged rows or snapshots are disabled. Files with ragged rows
+                are only parsed once per change to find that out.
+        """
+        if not USE_SNAPSHOTS:
+            return None
+        generation = Model.generation()
+        # Writers replace the file, so the signature and the appended rows are
+        # both taken from the one opened file, never from the path again
+        try:
+            with open(file_path, mode="rb") as file:
+                stat = os.fstat(file.fileno())
+                signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+                if ragged_signatures.get(file_path) == signature:
+                    return None
+                snapshot = DataSnapshot.open(file_path, file, signature, generation)
+                if snapshot is not None and snapshot.source_size < signature[2]:
+                    # Only parse the rows appended since the snapshot was written
+                    file.seek(snapshot.source_size)
+                    text = io.TextIOWrapper(file, newline="")
+                    snapshot.append_rows(list(csv.reader(text)))
+                    text.detach()
+        except OSError:
+            return None
+        if snapshot is not None:
+            return snapshot
+
+        # Writers wait, so the snapshot matches the signature it is stored with
+        with data_lock:
+            signature = file_signature(file_path)
+            if signature is None:
+                return None
+            with open(file_path, mode="r", newline="") as file:
+                rows = list(csv.reader(file))
+            try:
+                data = build_snapshot(file_path, rows, signature, Model.generation())
+            except ValueError:
+                ragged_signatures[file_path] = signature
+                return None
+            write_snapshot(file_path, data)
+        return DataSnapshot(data)
+
+    @staticmethod
+    def select_rows(file_path: str, column: int, value: str) -> list:
+        """
+        Reads the rows of a data file, without the header, whose column holds a value.
+        Only the matching rows are decoded from the snapshot.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            column (int): The compared column.
+            value (str): The wanted value.
+        """
+        snapshot = Model.open_snapshot(file_path)
+        if snapshot is None:
+            rows = Model.read_csv(file_path, skip_header=True)
+            return [row for row in rows if row[column] == value]
+        with snapshot:
+            return snapshot.rows_where(column, value, start=1)
+
+    @staticmethod
+    def column_contains(file_path: str, column: int, value: str) -> bool:
+        """
+        Checks if a column of a data file holds a value, the header excluded.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            column (int): The searched column.
+            value (str): The wanted value.
+        """
+        snapshot = Model.open_snapshot(file_path)
+        if snapshot is None:
+            rows = Model.read_csv(file_path, skip_header=True)
+            return any(row[column] == value for row in rows)
+        with snapshot:
+            return snapshot.contains(column, value, start=1)
+
+    @staticmethod
+    def iter_csv(file_path: str, skip_header: bool = False):
+        """
+        Yields the rows of a CSV file one by one, without loading the whole file.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            skip_header (bool): Whether to skip the header row.
+        """
+        if not os.path.isfile(file_path):
+            return
+
+        with open(file_path, mode="r", newline="") as file:
+            reader = csv.reader(file)
+            if skip_header:
+                next(reader, None)
+            yield from reader
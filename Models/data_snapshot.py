@@ -0,0 +1,313 @@
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate, chain
+
+from Utils.disk_cache import CACHE_DIRECTORY
+
+# Magic, format version, generation, signature of the CSV file (inode,
+# modification time, size), checksum of its end, rows, columns and strings
+HEADER = struct.Struct("<8sIQqqqIIII")
+MAGIC = b"BBSNAP\0\0"
+FORMAT_VERSION = 1
+# Strings are stored once, separated by NUL which CSV files can't contain
+SEPARATOR = "\0"
+# Rows appended to the CSV file since the snapshot was written are read from
+# the file, until they make up this share of it and the snapshot is rebuilt
+MAX_APPENDED_SHARE = 0.25
+# Bytes at the end of the CSV file whose checksum tells appended rows apart
+# from a file rewritten in place
+END_CHECK_SIZE = 4096
+
+
+def snapshot_path(file_path: str) -> str:
+    """Return the path of the snapshot of a data file."""
+    return os.path.join(CACHE_DIRECTORY, os.path.basename(file_path) + ".snapshot")
+
+
+def uint32_array(values=()) -> array:
+    """Return an array of unsigned 32 bit integers."""
+    return array("I", values)
+
+
+def end_checksum(file, size: int) -> int:
+    """Return the checksum of the bytes of an open binary file just before size."""
+    file.seek(max(size - END_CHECK_SIZE, 0))
+    return zlib.crc32(file.read(min(size, END_CHECK_SIZE)))
+
+
+def little_endian_bytes(values: array) -> bytes:
+    """Return the bytes of an array in little endian order."""
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def build_snapshot(file_path: str, rows: list, signature: tuple, generation: int) -> bytes:
+    """
+    Return the binary snapshot of the rows of a CSV file.
+
+    The layout is a header, the offsets of the strings in the string table,
+    a row major table of string numbers and the string table itself. Every
+    distinct string is stored once.
+
+    Args:
+        file_path (str): The CSV file.
+        rows (list): The rows of the CSV file, all with the same number of columns.
+        signature (tuple): The (inode, modification time, size) of the CSV file.
+        generation (int): The data generation the rows belong to.
+
+    Raises:
+        ValueError: If the rows don't all have the same number of columns.
+    """
+    column_count = len(rows[0]) if rows else 0
+    if any(len(row) != column_count for row in rows):
+        raise ValueError("Rows of a snapshot need the same number of columns")
+
+    try:
+        with open(file_path, "rb") as file:
+            checksum = end_checksum(file, signature[2])
+    except OSError:
+        checksum = 0
+
+    strings = list(dict.fromkeys(chain.from_iterable(rows)))
+    string_numbers = dict(zip(strings, range(len(strings))))
+    cells = uint32_array(map(string_numbers.__getitem__, chain.from_iterable(rows)))
+
+    encoded_strings = [value.encode() for value in strings]
+    offsets = uint32_array(
+        accumulate(map(len, encoded_strings), lambda end, length: end + length + 1, initial=0)
+    )
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        generation,
+        *signature,
+        checksum,
+        len(rows),
+        column_count,
+        len(strings),
+    )
+    return (
+        header
+        + little_endian_bytes(offsets)
+        + little_endian_bytes(cells)
+        + SEPARATOR.encode().join(encoded_strings)
+    )
+
+
+def write_snapshot(file_path: str, data: bytes) -> None:
+    """
+    Replace the snapshot of a data file. Snapshots are only a faster copy of
+    the CSV files, so failing to write one is not an error.
+
+    Args:
+        file_path (str): The CSV file the snapshot belongs to.
+        data (bytes): The snapshot from build_snapshot.
+    """
+    path = snapshot_path(file_path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+class DataSnapshot:
+    """
+    Read access to a snapshot, memory mapped from its file or kept in memory.
+
+    Rows are decoded only when they are asked for, and lookups by the value
+    of a column compare string numbers instead of decoding the strings.
+    Rows appended to the CSV file later are kept as plain lists.
+    Use it as a context manager so the mapping is closed.
+    """
+
+    def __init__(self, buffer):
+        """
+        Args:
+            buffer: The snapshot bytes or a memory map of its file.
+
+        Raises:
+            ValueError: If the buffer isn't a snapshot of this format.
+        """
+        if len(buffer) < HEADER.size:
+            raise ValueError("Snapshot is truncated")
+        (
+            magic,
+            version,
+            self.generation,
+            inode,
+            modification_time,
+            size,
+            self.end_checksum,
+            self.row_count,
+            self.column_count,
+            string_count,
+        ) = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a snapshot of this version")
+        self.signature = (inode, modification_time, size)
+
+        self.buffer = buffer
+        cells_start = HEADER.size + (string_count + 1) * 4
+        self.strings_start = cells_start + self.row_count * self.column_count * 4
+        self.offsets = self.read_uint32_array(HEADER.size, cells_start)
+        self.cells = self.read_uint32_array(cells_start, self.strings_start)
+        if len(buffer) != self.strings_start + max(self.offsets[-1] - 1, 0):
+            raise ValueError("Snapshot is truncated")
+        self.strings = None
+        self.appended_rows = []
+
+    @staticmethod
+    def open(file_path: str, source, signature: tuple, generation: int):
+        """
+        Open the snapshot of a data file if it matches the file.
+
+        Args:
+            file_path (str): The CSV file.
+            source: The CSV file opened in binary mode. Another process may
+                replace the file at its path at any time, so it is only read
+                through this file object.
+            signature (tuple): The signature of the opened CSV file.
+            generation (int): The current data generation.
+
+        Returns:
+            DataSnapshot | None: The snapshot, None if it is missing or stale.
+        """
+        try:
+            with open(snapshot_path(file_path), "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            snapshot = DataSnapshot(buffer)
+        except (ValueError, struct.error):
+            buffer.close()
+            return None
+
+        # A newer generation than the store's means the data was replaced
+        if snapshot.generation > generation or not snapshot.matches(source, signature):
+            snapshot.close()
+            return None
+        return snapshot
+
+    def matches(self, source, signature: tuple) -> bool:
+        """
+        Check if the snapshot holds the CSV file with a signature, or its
+        beginning when rows were appended to the same file since.
+
+        Args:
+            source: The CSV file opened in binary mode.
+            signature (tuple): The signature of the opened CSV file.
+        """
+        if self.signature == tuple(signature):
+            return True
+        inode, _, size = signature
+        return (
+            inode == self.signature[0]
+            and self.source_size < size
+            and size - self.source_size <= size * MAX_APPENDED_SHARE
+            and end_checksum(source, self.source_size) == self.end_checksum
+        )
+
+    @property
+    def source_size(self) -> int:
+        """The size of the CSV file when the snapshot was written."""
+        return self.signature[2]
+
+    def append_rows(self, rows: list) -> None:
+        """Add rows appended to the CSV file after the snapshot was written."""
+        self.appended_rows.extend(rows)
+
+    def read_uint32_array(self, start: int, end: int) -> array:
+        values = uint32_array()
+        values.frombytes(self.buffer[start:end])
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self.row_count + len(self.appended_rows)
+
+    def string(self, number: int) -> str:
+        """Return a string of the string table."""
+        if self.strings is not None:
+            return self.strings[number]
+        start = self.strings_start + self.offsets[number]
+        end = self.strings_start + self.offsets[number + 1] - 1
+        return self.buffer[start:end].decode()
+
+    def decode_strings(self) -> list:
+        """Decode the whole string table at once, faster when most rows are needed."""
+        if self.strings is None:
+            self.strings = self.buffer[self.strings_start :].decode().split(SEPARATOR)
+        return self.strings
+
+    def row(self, index: int) -> list:
+        """Return a row as a list of strings."""
+        start = index * self.column_count
+        return [self.string(number) for number in self.cells[start : start + self.column_count]]
+
+    def rows(self, start: int = 0) -> list:
+        """Return the rows from start on as lists of strings."""
+        strings = self.decode_strings()
+        values = map(strings.__getitem__, self.cells[start * self.column_count :])
+        rows = [list(row) for row in zip(*[values] * self.column_count)]
+        return rows + [list(row) for row in self.appended_rows[max(start - self.row_count, 0) :]]
+
+    def string_number(self, column: int, value: str) -> int | None:
+        """Return the number of a string stored in a column, None if it isn't there."""
+        if not self.column_count:
+            return None  # Snapshot of an empty file
+        for number in set(self.cells[column :: self.column_count]):
+            if self.string(number) == value:
+                return number
+        return None
+
+    def rows_where(self, column: int, value: str, start: int = 0) -> list:
+        """Return the rows from start on whose column holds a value."""
+        appended_rows = [
+            list(row)
+            for row in self.appended_rows[max(start - self.row_count, 0) :]
+            if row[column] == value
+        ]
+        number = self.string_number(column, value)
+        if number is None:
+            return appended_rows
+        column_values = self.cells[column :: self.column_count]
+        return [
+            self.row(index)
+            for index in range(start, self.row_count)
+            if column_values[index] == number
+        ] + appended_rows
+
+    def contains(self, column: int, value: str, start: int = 0) -> bool:
+        """Return whether a row from start on holds a value in a column."""
+        appended_rows = self.appended_rows[max(start - self.row_count, 0) :]
+        if any(row[column] == value for row in appended_rows):
+            return True
+        number = self.string_number(column, value)
+        return number is not None and number in self.cells[
+            start * self.column_count + column :: self.column_count
+        ]
@@ -0,0 +1,101 @@
+import contextlib
+import threading
+import traceback
+
+# Kinds of changes
+INSERTED = "inserted"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+class ModelChange:
+    """
+    A row of a data file that was inserted, updated or deleted.
+    """
+
+    __slots__ = ("kind", "file_path", "key", "row")
+
+    def __init__(self, kind: str, file_path: str, key, row: list | None = None):
+        """
+        Args:
+            kind (str): INSERTED, UPDATED or DELETED.
+            file_path (str): The data file of the row.
+            key: What identifies the row: the collection name for collections,
+                (collection name, set ID) for collected sets and the set ID for
+                the wishlist.
+            row (list | None): The row after the change, None for deletions.
+        """
+        self.kind = kind
+        self.file_path = file_path
+        self.key = key
+        self.row = row
+
+    def __repr__(self) -> str:
+        return f"ModelChange({self.kind}, {self.file_path}, {self.key!r})"
+
+
+class ChangeNotifier:
+    """
+    Tells observers about the rows changed by Model operations, so views can
+    update the affected cards instead of reloading.
+
+    Observers are called with the list of changes of one operation, on the
+    thread that made it, once the operation released the data lock. Changes
+    made by other processes are not reported here, see DataWatcher.
+    """
+
+    def __init__(self):
+        self.observers = []
+        # Changes held back by deferred, per thread
+        self.deferral = threading.local()
+
+    def subscribe(self, observer: callable) -> None:
+        """
+        Args:
+            observer (callable): Called with a list of ModelChange.
+        """
+        if observer not in self.observers:
+            self.observers.append(observer)
+
+    def unsubscribe(self, observer: callable) -> None:
+        if observer in self.observers:
+            self.observers.remove(observer)
+
+    @contextlib.contextmanager
+    def deferred(self):
+        """
+        Hold back the changes notified in the block and report them together
+        when the outermost block ends. Changes of a block left by an exception
+        are dropped.
+        """
+        depth = getattr(self.deferral, "depth", 0)
+        if depth == 0:
+            self.deferral.changes = []
+        self.deferral.depth = depth + 1
+        try:
+            yield
+        finally:
+            self.deferral.depth = depth
+        if depth == 0:
+            changes, self.deferral.changes = self.deferral.changes, []
+            self.notify(changes)
+
+    def notify(self, changes: list) -> None:
+        """
+        Call every observer with the changes, unless there are none or they
+        are deferred. A failing observer is reported without stopping the
+        others, the changes are already written.
+        """
+        if not changes:
+            return
+        if getattr(self.deferral, "depth", 0):
+            self.deferral.changes.extend(changes)
+            return
+        for observer in list(self.observers):
+            try:
+                observer(changes)
+            except Exception:
+                traceback.print_exc()
+
+
+model_changes = ChangeNotifier()
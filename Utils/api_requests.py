@@ -1,42 +1,180 @@
 import brickse
 import json
+import time
+import urllib.error
+from array import array
+from collections.abc import Sequence
+
+from Utils.instrumentation import instrumented
+from Utils.metrics import metrics
+
+# Failed API requests are retried this many times, waiting longer each time
+MAX_RETRIES = 2
+RETRY_DELAY_S = 0.5
+# Number of sets returned by a search
+SEARCH_PAGE_SIZE = 100
+
+
+def is_transient(error: Exception) -> bool:
+    """Whether a failed request may succeed when retried."""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code >= 500 or error.code == 429
+    return isinstance(error, (urllib.error.URLError, TimeoutError, ConnectionError))
+
+
+def call_api(method: str, request_func: callable, **params) -> dict:
+    """
+    Call a Brickset API method, record its metrics and return the decoded response.
+    Transient failures are retried.
+
+    Args:
+        method (str): The API method name, used to label the metrics.
+        request_func (callable): The brickse function sending the request.
+        **params: The arguments of the brickse function.
+    """
+    endpoint = f"api.{method}"
+    url = brickse.config.API_URL + method
+    attempt = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            data = request_func(**params).read()
+        except Exception as error:
+            metrics.record_request(endpoint, url, (time.perf_counter() - start) * 1000, failed=True)
+            if attempt >= MAX_RETRIES or not is_transient(error):
+                raise
+            attempt += 1
+            metrics.record_retry(endpoint)
+            time.sleep(RETRY_DELAY_S * attempt)
+            continue
+
+        metrics.record_request(endpoint, url, (time.perf_counter() - start) * 1000, len(data))
+        return json.loads(data)
 
 
 def get_themes() -> list[str]:
     """
     Get a list of all LEGO themes names.
     """
-    raw_themes = json.loads(brickse.lego.get_themes().read())
-    return [theme["theme"] for theme in raw_themes["themes"]]
+    return list(get_themes_with_set_counts())
 
 
-def get_sets_from_theme(theme: str) -> list[str]:
+@instrumented("api.get_themes")
+def get_themes_with_set_counts() -> dict[str, int]:
+    """
+    Get the number of sets of every LEGO theme, by theme name.
     """
-    Get a list of all LEGO set names from a specific theme.
+    raw_themes = call_api("getThemes", brickse.lego.get_themes)
+    return {theme["theme"]: theme.get("setCount", 0) for theme in raw_themes["themes"]}
+
+
+@instrumented("api.get_sets_from_theme")
+def get_sets_from_theme(theme: str) -> "SetBatch":
+    """
+    Get all LEGO sets of a specific theme.
 
     Args:
         theme (str): The LEGO theme name.
     """
-    raw_sets = json.loads(brickse.lego.get_sets(theme=theme).read())
-    print("API called")
+    raw_sets = call_api("getSets", brickse.lego.get_sets, theme=theme)
+    return SetBatch.from_raw_sets(raw_sets["sets"])
+
+
+@instrumented("api.search_sets")
+def search_sets(query: str, page_size: int = SEARCH_PAGE_SIZE) -> "SetBatch":
+    """
+    Search LEGO sets of all themes by name or set number.
+
+    Args:
+        query (str): The search text.
+        page_size (int): The maximal number of returned sets.
+    """
+    raw_sets = call_api("getSets", brickse.lego.get_sets, query=query, page_size=page_size)
+    return SetBatch.from_raw_sets(raw_sets["sets"])
+
+
+@instrumented("api.get_sets_by_numbers")
+def get_sets_by_numbers(set_numbers: list) -> "SetBatch":
+    """
+    Get many LEGO sets with a single request.
+
+    Args:
+        set_numbers (list): Set numbers including the variant, e.g. "75192-1".
+    """
+    raw_sets = call_api(
+        "getSets",
+        brickse.lego.get_sets,
+        set_number=",".join(set_numbers),
+        page_size=len(set_numbers),
+    )
+    return SetBatch.from_raw_sets(raw_sets["sets"])
+
+
+@instrumented("api.get_set_details")
+def get_set_details(set_id) -> "SetDetails":
+    """
+    Get the extended information about a set: its subtheme, minifigs,
+    retail prices, description, additional images and instructions.
+    Images and instructions are only requested if the set has any.
+
+    Args:
+        set_id: The Brickset ID of the set.
+
+    Raises:
+        LookupError: If Brickset doesn't know the set.
+    """
+    set_id = to_int(set_id)
+    raw_sets = call_api("getSets", brickse.lego.get_set, set_id=set_id, extended_data=True)
+    if not raw_sets.get("sets"):
+        raise LookupError(f"Set {set_id} not found")
+    raw_set = raw_sets["sets"][0]
+
+    image_urls = []
+    if raw_set.get("additionalImageCount"):
+        raw_images = call_api("getAdditionalImages", brickse.lego.get_set_images, set_id=set_id)
+        image_urls = [
+            image.get("thumbnailURL") or image.get("imageURL")
+            for image in raw_images.get("additionalImages", [])
+        ]
+
+    instructions = []
+    if raw_set.get("instructionsCount"):
+        raw_instructions = call_api(
+            "getInstructions", brickse.lego.get_set_instructions, set_id=set_id
+        )
+        instructions = [
+            (instruction.get("description", ""), instruction["URL"])
+            for instruction in raw_instructions.get("instructions", [])
+        ]
 
-    sets = []
-    default_img_url = "https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/LEGO_logo.svg/1024px-LEGO_logo.svg.png"
+    return SetDetails.from_raw_set(raw_set, image_urls, instructions)
 
-    for set in raw_sets["sets"]:
-        set_id = set.get("setID")
-        set_name = set.get("name")
-        year = set.get("year")
-        pieces = set.get("pieces")
-        brickset_url = set.get("bricksetURL")
-        set_img_url = set.get("image", {}).get("imageURL", default_img_url)
 
-        set_info = SetInfo(set_id, set_name, set_img_url, brickset_url, year, pieces)
-        sets.append(set_info)
+def normalize_set_number(set_number: str) -> str:
+    """Return a set number with its variant, "75192" becomes "75192-1"."""
+    set_number = str(set_number).strip()
+    return set_number if "-" in set_number else f"{set_number}-1"
+
+
+def set_number_from_url(brickset_url: str) -> str:
+    """Return the set number of a Brickset set page URL, e.g. ".../sets/75192-1"."""
+    return (brickset_url or "").rstrip("/").rsplit("/", 1)[-1]
+
+
+DEFAULT_IMAGE_URL = "https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/LEGO_logo.svg/1024px-LEGO_logo.svg.png"
+
+
+def to_int(value) -> int:
+    """Convert an API or CSV value to an int, 0 if it is missing or invalid."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
 
-    return sets
 
 class SetInfo:
+    __slots__ = ("id", "name", "image_url", "brickset_url", "year", "pieces")
+
     def __init__(
         self,
         set_id: int,
@@ -50,8 +188,193 @@ class SetInfo:
         self.name = set_name
         self.image_url = set_img_url
         self.brickset_url = brickset_url
-        self.year = year
-        self.pieces = pieces
+        self.year = to_int(year)
+        self.pieces = to_int(pieces)
+
+    def to_dict(self) -> dict:
+        """Return the set information as a JSON serializable dict."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "image_url": self.image_url,
+            "brickset_url": self.brickset_url,
+            "year": self.year,
+            "pieces": self.pieces,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "SetInfo":
+        """Create set information from a dict made by to_dict."""
+        return SetInfo(
+            data["id"],
+            data["name"],
+            data["image_url"],
+            data["brickset_url"],
+            data["year"],
+            data["pieces"],
+        )
 
     def __str__(self):
         return f"Set ID: {self.id}, Set Name: {self.name}, Year: {self.year}, Pieces: {self.pieces}, Image URL: {self.image_url}"
+
+
+class SetDetails:
+    """
+    Extended information about a set, loaded only when its details are shown.
+    """
+
+    __slots__ = (
+        "set_id",
+        "subtheme",
+        "minifigs",
+        "retail_prices",
+        "rating",
+        "description",
+        "image_urls",
+        "instructions",
+    )
+
+    def __init__(
+        self,
+        set_id: int,
+        subtheme: str,
+        minifigs: int,
+        retail_prices: dict,
+        rating: float,
+        description: str,
+        image_urls: list,
+        instructions: list,
+    ):
+        self.set_id = set_id
+        self.subtheme = subtheme
+        self.minifigs = minifigs
+        self.retail_prices = retail_prices
+        self.rating = rating
+        self.description = description
+        self.image_urls = image_urls
+        self.instructions = instructions
+
+    @staticmethod
+    def from_raw_set(raw_set: dict, image_urls: list, instructions: list) -> "SetDetails":
+        """
+        Create set details from a set of an extended getSets response.
+
+        Args:
+            raw_set (dict): The set from the response.
+            image_urls (list): URLs of the additional images.
+            instructions (list): (description, URL) of every instruction booklet.
+        """
+        retail_prices = {
+            region: prices["retailPrice"]
+            for region, prices in (raw_set.get("LEGOCom") or {}).items()
+            if prices.get("retailPrice")
+        }
+        return SetDetails(
+            to_int(raw_set.get("setID")),
+            raw_set.get("subtheme", ""),
+            to_int(raw_set.get("minifigs")),
+            retail_prices,
+            raw_set.get("rating") or 0,
+            (raw_set.get("extendedData") or {}).get("description", ""),
+            image_urls,
+            instructions,
+        )
+
+
+class SetBatch(Sequence):
+    """
+    Sets of a whole theme stored column by column.
+
+    Numbers are kept in typed arrays and strings in plain lists, so a batch
+    holds no per-set objects. SetInfo objects are created only for the sets
+    that are accessed, e.g. the cards currently displayed.
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.names = []
+        self.image_urls = []
+        self.brickset_urls = []
+        self.years = array("i")
+        self.pieces = array("i")
+
+    def append(self, set_id, name: str, image_url: str, brickset_url: str, year, pieces) -> None:
+        """Add a set to the end of the batch."""
+        self.ids.append(to_int(set_id))
+        self.names.append(name)
+        self.image_urls.append(image_url)
+        self.brickset_urls.append(brickset_url)
+        self.years.append(to_int(year))
+        self.pieces.append(to_int(pieces))
+
+    @staticmethod
+    def from_raw_sets(raw_sets: list) -> "SetBatch":
+        """
+        Create a batch from the sets of a getSets API response.
+
+        Args:
+            raw_sets (list): The "sets" list of the response.
+        """
+        batch = SetBatch()
+        for raw_set in raw_sets:
+            batch.append(
+                raw_set.get("setID"),
+                raw_set.get("name"),
+                raw_set.get("image", {}).get("imageURL", DEFAULT_IMAGE_URL),
+                raw_set.get("bricksetURL"),
+                raw_set.get("year"),
+                raw_set.get("pieces"),
+            )
+        return batch
+
+    @staticmethod
+    def from_sets(sets: list) -> "SetBatch":
+        """
+        Create a batch from SetInfo objects.
+
+        Args:
+            sets (list): The sets to store.
+        """
+        batch = SetBatch()
+        for set_data in sets:
+            batch.append(
+                set_data.id,
+                set_data.name,
+                set_data.image_url,
+                set_data.brickset_url,
+                set_data.year,
+                set_data.pieces,
+            )
+        return batch
+
+    def set_info(self, index: int) -> SetInfo:
+        """Create the SetInfo of the set at an index."""
+        return SetInfo(
+            self.ids[index],
+            self.names[index],
+            self.image_urls[index],
+            self.brickset_urls[index],
+            self.years[index],
+            self.pieces[index],
+        )
+
+    def __getitem__(self, index):
+        """Return a SetInfo, or a list of them for a slice."""
+        if isinstance(index, slice):
+            return [self.set_info(i) for i in range(*index.indices(len(self)))]
+        return self.set_info(index)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SetBatch):
+            return NotImplemented
+        return (
+            self.ids == other.ids
+            and self.names == other.names
+            and self.image_urls == other.image_urls
+            and self.brickset_urls == other.brickset_urls
+            and self.years == other.years
+            and self.pieces == other.pieces
+        )
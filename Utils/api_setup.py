@@ -1,10 +1,37 @@
+import os
 import brickse
 
+# Point the app at another Brickset-compatible server (e.g. Utils/fake_brickset.py)
+API_URL_ENV = "BRICKSET_API_URL"
+OFFLINE_API_KEY = "offline"
+
 def read_key() -> str | None:
     """Read the Brickset API key from a file."""
     with open("./brickset_api_key.txt", "r") as f:
         return f.read().strip()
 
 def init_brickse() -> None:
-    """Initialize the Brickse API with user key."""
+    """Initialize the Brickse API with user key.
+
+    If the BRICKSET_API_URL environment variable is set, requests go to that
+    server instead of brickset.com and no key file is required.
+    """
+    api_url = os.environ.get(API_URL_ENV)
+    if api_url:
+        use_api_url(api_url)
+        brickse.init(OFFLINE_API_KEY)
+        return
+
     brickse.init(read_key())
+
+def use_api_url(api_url: str) -> None:
+    """Send all Brickse requests to a different server.
+
+    Args:
+        api_url (str): The base URL of the API, ending with "/api/v3.asmx/".
+    """
+    if not api_url.endswith("/"):
+        api_url += "/"
+    brickse.config.API_URL = api_url
+    # The request throttle protects brickset.com, a local server doesn't need it
+    brickse.config.REQUEST_DELAY = 0
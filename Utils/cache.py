@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+
+
+# Named caches, reported by profiling and metrics
+named_caches = {}
+
+
+class LRUCache:
+    """
+    A thread-safe least recently used cache with hit/miss/eviction counters.
+    """
+
+    def __init__(self, max_entries: int, name: str | None = None):
+        self.max_entries = max_entries
+        self.name = name
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if name is not None:
+            named_caches[name] = self
+
+    def get(self, key, default=None):
+        """
+        Return the cached value and mark it as recently used.
+
+        Args:
+            key: The key of the entry.
+            default: The value returned when the key is not cached.
+        """
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, value) -> None:
+        """
+        Cache a value, evicting the least recently used entries when full.
+
+        Args:
+            key: The key of the entry.
+            value: The value to cache.
+        """
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key) -> bool:
+        """Check for a key without counting a hit or miss."""
+        with self.lock:
+            return key in self.entries
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.entries)
+
+    def values(self) -> list:
+        """Return the cached values, least recently used first."""
+        with self.lock:
+            return list(self.entries.values())
+
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,63 @@
+from PyQt6 import QtCore
+
+from Models.data_model import (
+    file_signature,
+    own_write_signatures,
+    DATA_DIRECTORY,
+    DATA_FILES,
+)
+
+# Time to wait for more changes before checking the data files, writes of
+# other processes often touch several files in a row
+CHANGE_SETTLE_MS = 200
+
+
+class DataWatcher(QtCore.QObject):
+    """
+    Notices changes to the data files made by other processes, e.g. a second
+    window or the command line tool.
+
+    Changed files are found by comparing their signatures with the ones last
+    seen, and files last written by this process are not reported.
+    """
+
+    files_changed = QtCore.pyqtSignal(list)
+
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.signatures = {path: file_signature(path) for path in DATA_FILES}
+
+        self.settle_timer = QtCore.QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(CHANGE_SETTLE_MS)
+        self.settle_timer.timeout.connect(self.check_files)
+
+        # Files are replaced on write, which also drops them from the watcher,
+        # so the directory is watched as well
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(lambda path: self.settle_timer.start())
+        self.watcher.fileChanged.connect(lambda path: self.settle_timer.start())
+        self.watch_files()
+
+    def watch_files(self) -> None:
+        """Watch the data directory and every existing data file."""
+        watched = set(self.watcher.files() + self.watcher.directories())
+        paths = [DATA_DIRECTORY] + list(DATA_FILES)
+        missing = [path for path in paths if path not in watched and QtCore.QFileInfo(path).exists()]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def check_files(self) -> None:
+        """Report the data files changed by other processes since the last check."""
+        self.watch_files()
+        changed_files = []
+        for path in DATA_FILES:
+            signature = file_signature(path)
+            if signature == self.signatures[path]:
+                continue
+            self.signatures[path] = signature
+            if signature != own_write_signatures.get(path):
+                changed_files.append(path)
+
+        if changed_files:
+            self.files_changed.emit(changed_files)
@@ -0,0 +1,48 @@
+import json
+import os
+
+CACHE_DIRECTORY = os.path.join("UserData", "cache")
+
+
+def cache_path(name: str) -> str:
+    """
+    Return the path of a cache file.
+
+    Args:
+        name (str): The name of the cache entry.
+    """
+    return os.path.join(CACHE_DIRECTORY, f"{name}.json")
+
+
+def read_cache(name: str):
+    """
+    Read a cached JSON value.
+
+    Args:
+        name (str): The name of the cache entry.
+
+    Returns:
+        The cached value or None if it is missing or unreadable.
+    """
+    try:
+        with open(cache_path(name), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(name: str, data) -> None:
+    """
+    Write a JSON value to the cache. The file is replaced atomically so a crash
+    never leaves a half written cache behind.
+
+    Args:
+        name (str): The name of the cache entry.
+        data: The JSON serializable value to cache.
+    """
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    path = cache_path(name)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
@@ -0,0 +1,97 @@
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from PyQt6 import QtCore
+
+from Utils.instrumentation import active_spans, recent_stalls, StallRecord
+
+# Interval of the heartbeat timer, roughly one frame
+HEARTBEAT_MS = 16
+# The event loop is considered stalled when a heartbeat is this late
+STALL_THRESHOLD_MS = 250
+# How often the watchdog thread checks the heartbeat
+CHECK_INTERVAL_MS = 50
+# Number of frame times kept for the overlay
+FRAME_HISTORY = 120
+
+
+class EventLoopWatchdog(QtCore.QObject):
+    """
+    Measures Qt event loop latency and records the Python stack of the GUI
+    thread whenever the loop is blocked for longer than a threshold.
+
+    A timer on the GUI thread beats every HEARTBEAT_MS. A separate thread
+    notices when the beat is late, and captures the GUI thread's stack and
+    open spans while it is still blocked.
+    """
+
+    stall_detected = QtCore.pyqtSignal(object)
+
+    def __init__(self, threshold_ms: float = STALL_THRESHOLD_MS, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.gui_thread_id = threading.get_ident()
+        self.frame_times = deque(maxlen=FRAME_HISTORY)
+        self.last_beat = time.perf_counter()
+        self.current_stall = None
+        self.running = False
+
+        self.heartbeat = QtCore.QTimer(self)
+        self.heartbeat.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.heartbeat.setInterval(HEARTBEAT_MS)
+        self.heartbeat.timeout.connect(self.beat)
+
+    def start(self) -> None:
+        """Start the heartbeat and the watchdog thread."""
+        self.running = True
+        self.last_beat = time.perf_counter()
+        self.heartbeat.start()
+        threading.Thread(target=self.watch, daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop watching the event loop."""
+        self.running = False
+        self.heartbeat.stop()
+
+    def beat(self) -> None:
+        """Record the frame time and close a stall that just ended."""
+        now = time.perf_counter()
+        self.frame_times.append((now - self.last_beat) * 1000)
+        self.last_beat = now
+
+        stall = self.current_stall
+        if stall is not None:
+            self.current_stall = None
+            stall.duration_ms = (now - stall.start) * 1000
+            self.stall_detected.emit(stall)
+
+    def watch(self) -> None:
+        """Watchdog thread: capture the GUI thread's stack during a stall."""
+        while self.running:
+            time.sleep(CHECK_INTERVAL_MS / 1000)
+            last_beat = self.last_beat
+            blocked_ms = (time.perf_counter() - last_beat) * 1000
+            if blocked_ms < self.threshold_ms or self.current_stall is not None:
+                continue
+
+            frame = sys._current_frames().get(self.gui_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            stall = StallRecord(last_beat, stack, list(active_spans.get(self.gui_thread_id, [])))
+            if self.last_beat != last_beat:
+                continue  # The loop resumed while the stack was captured
+            self.current_stall = stall
+            recent_stalls.append(stall)
+
+    def frame_stats(self) -> tuple:
+        """
+        Return statistics of recent frame times.
+
+        Returns:
+            tuple: The last, average and maximal frame time in milliseconds.
+        """
+        if not self.frame_times:
+            return 0, 0, 0
+        frames = list(self.frame_times)
+        return frames[-1], sum(frames) / len(frames), max(frames)
@@ -0,0 +1,473 @@
+import argparse
+import json
+import random
+import re
+import struct
+import threading
+import time
+import urllib.parse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+API_PATH = "/api/v3.asmx/"
+IMAGE_PATH = "/images/"
+
+# Catalog defaults
+DEFAULT_THEME_COUNT = 60
+DEFAULT_SET_COUNT = 3000
+DEFAULT_IMAGE_SIZE = 240
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 500
+FIRST_YEAR = 1980
+LAST_YEAR = 2024
+
+THEME_WORDS = [
+    "Bricklink", "Star Wars", "City", "Technic", "Creator", "Ninjago", "Friends",
+    "Castle", "Space", "Pirates", "Harry Potter", "Marvel", "Ideas", "Duplo",
+    "Speed Champions", "Architecture", "Minecraft", "Icons", "Town", "Trains",
+]
+SET_WORDS = [
+    "Station", "Fortress", "Cruiser", "Tower", "Outpost", "Shuttle", "Market",
+    "Garage", "Harbor", "Temple", "Racer", "Dragon", "Castle", "Base", "Village",
+]
+IMAGE_COLORS = [
+    (200, 40, 40), (30, 90, 200), (240, 200, 30), (40, 150, 60), (120, 120, 120),
+]
+
+
+def generate_catalog(
+    theme_count: int = DEFAULT_THEME_COUNT,
+    set_count: int = DEFAULT_SET_COUNT,
+    seed: int = 0,
+) -> dict:
+    """
+    Generate a deterministic Brickset-like catalog of themes and sets.
+
+    Args:
+        theme_count (int): The number of themes to generate.
+        set_count (int): The number of sets spread over the themes.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        dict: The catalog with "themes" (list of names) and "sets" (list of set dicts).
+    """
+    rng = random.Random(seed)
+
+    themes = []
+    for i in range(theme_count):
+        base = THEME_WORDS[i % len(THEME_WORDS)]
+        themes.append(base if i < len(THEME_WORDS) else f"{base} {i // len(THEME_WORDS) + 1}")
+
+    sets = []
+    for i in range(set_count):
+        set_id = 10000 + i
+        number = str(1000 + i)
+        theme = themes[i % theme_count]
+        year = rng.randint(FIRST_YEAR, LAST_YEAR)
+        sets.append(
+            {
+                "setID": set_id,
+                "number": number,
+                "numberVariant": 1,
+                "name": f"{rng.choice(SET_WORDS)} {rng.choice(SET_WORDS)} {i}",
+                "year": year,
+                "theme": theme,
+                "themeGroup": "Modern day",
+                "subtheme": f"{theme} Wave {year % 4 + 1}",
+                "category": "Normal",
+                "pieces": rng.randint(20, 7500),
+                "minifigs": rng.randint(0, 12),
+                "rating": round(rng.uniform(3.0, 5.0), 1),
+                "retailPrice": round(rng.uniform(5.0, 850.0), 2),
+                "instructionsCount": rng.randint(0, 3),
+                "additionalImageCount": rng.randint(0, 6),
+            }
+        )
+
+    return {"themes": themes, "sets": sets}
+
+
+def load_catalog(path: str) -> dict:
+    """
+    Load a catalog fixture previously saved with save_catalog.
+
+    Args:
+        path (str): The path to the JSON fixture.
+    """
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_catalog(catalog: dict, path: str) -> None:
+    """
+    Save a catalog as a JSON fixture so runs can be replayed exactly.
+
+    Args:
+        catalog (dict): The catalog to save.
+        path (str): The path to the JSON fixture.
+    """
+    with open(path, "w") as f:
+        json.dump(catalog, f)
+
+
+def make_png(width: int, height: int, color: tuple) -> bytes:
+    """
+    Build a solid color PNG image without any imaging library.
+
+    Args:
+        width (int): The width of the image.
+        height (int): The height of the image.
+        color (tuple): The RGB color of the image.
+    """
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    row = b"\x00" + bytes(color) * width
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+class FakeBrickset:
+    """
+    In-memory stand-in for the Brickset v3 web service.
+    """
+
+    def __init__(
+        self,
+        catalog: dict,
+        base_url: str,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        image_size: int = DEFAULT_IMAGE_SIZE,
+        seed: int = 0,
+    ):
+        self.catalog = catalog
+        self.base_url = base_url
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.image_size = image_size
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.images = {}
+        self.request_count = 0
+
+        self.sets_by_id = {s["setID"]: s for s in catalog["sets"]}
+        self.sets_by_number = {
+            f"{s['number']}-{s['numberVariant']}": s for s in catalog["sets"]
+        }
+
+    def simulate_network(self) -> bool:
+        """Sleep for the configured latency. Returns False if the request should fail."""
+        with self.rng_lock:
+            self.request_count += 1
+            delay = self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)
+            failed = self.rng.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay / 1000)
+        return not failed
+
+    def set_to_json(self, set_data: dict, extended: bool = False) -> dict:
+        """
+        Convert a catalog set into the Brickset response format.
+
+        Args:
+            set_data (dict): The catalog set.
+            extended (bool): Whether to include the extended data block.
+        """
+        image_url = f"{self.base_url}{IMAGE_PATH}{set_data['setID']}.png"
+        number = f"{set_data['number']}-{set_data['numberVariant']}"
+        result = {
+            "setID": set_data["setID"],
+            "number": set_data["number"],
+            "numberVariant": set_data["numberVariant"],
+            "name": set_data["name"],
+            "year": set_data["year"],
+            "theme": set_data["theme"],
+            "themeGroup": set_data["themeGroup"],
+            "subtheme": set_data["subtheme"],
+            "category": set_data["category"],
+            "pieces": set_data["pieces"],
+            "minifigs": set_data["minifigs"],
+            "image": {"thumbnailURL": image_url, "imageURL": image_url},
+            "bricksetURL": f"https://brickset.com/sets/{number}",
+            "rating": set_data["rating"],
+            "instructionsCount": set_data["instructionsCount"],
+            "additionalImageCount": set_data["additionalImageCount"],
+            "LEGOCom": {"US": {"retailPrice": set_data["retailPrice"]}},
+        }
+        if extended:
+            result["extendedData"] = {
+                "description": f"{set_data['name']} from the {set_data['theme']} theme."
+            }
+        return result
+
+    def get_themes(self, params: dict) -> dict:
+        """Handle the getThemes method."""
+        counts = {}
+        years = {}
+        for s in self.catalog["sets"]:
+            counts[s["theme"]] = counts.get(s["theme"], 0) + 1
+            low, high = years.get(s["theme"], (s["year"], s["year"]))
+            years[s["theme"]] = (min(low, s["year"]), max(high, s["year"]))
+
+        themes = [
+            {
+                "theme": theme,
+                "setCount": counts.get(theme, 0),
+                "subthemeCount": 4,
+                "yearFrom": years.get(theme, (0, 0))[0],
+                "yearTo": years.get(theme, (0, 0))[1],
+            }
+            for theme in self.catalog["themes"]
+        ]
+        return {"status": "success", "matches": len(themes), "themes": themes}
+
+    def get_sets(self, params: dict) -> dict:
+        """Handle the getSets method."""
+        query = json.loads(params.get("params", "{}"))
+
+        if "setID" in query:
+            found = self.sets_by_id.get(int(query["setID"]))
+            matches = [found] if found else []
+        elif "setNumber" in query:
+            numbers = str(query["setNumber"]).split(",")
+            matches = [self.sets_by_number[n] for n in numbers if n in self.sets_by_number]
+        else:
+            matches = self.catalog["sets"]
+
+        if "theme" in query:
+            themes = set(str(query["theme"]).split(","))
+            matches = [s for s in matches if s["theme"] in themes]
+        if "year" in query:
+            years = {int(y) for y in str(query["year"]).split(",")}
+            matches = [s for s in matches if s["year"] in years]
+        if "query" in query:
+            term = str(query["query"]).lower()
+            matches = [
+                s
+                for s in matches
+                if term in s["name"].lower()
+                or term in s["number"]
+                or term in s["theme"].lower()
+            ]
+
+        order = query.get("orderBy", "")
+        if order:
+            key = order.removesuffix("DESC").lower()
+            field = {"name": "name", "yearfrom": "year", "pieces": "pieces"}.get(key)
+            if field:
+                matches = sorted(matches, key=lambda s: s[field], reverse=order.endswith("DESC"))
+
+        page_size = min(int(query.get("pageSize", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        page_number = max(int(query.get("pageNumber", 1)), 1)
+        start = (page_number - 1) * page_size
+        extended = bool(int(query.get("extendedData", 0)))
+
+        return {
+            "status": "success",
+            "matches": len(matches),
+            "sets": [
+                self.set_to_json(s, extended) for s in matches[start : start + page_size]
+            ],
+        }
+
+    def get_additional_images(self, params: dict) -> dict:
+        """Handle the getAdditionalImages method."""
+        set_data = self.sets_by_id.get(int(params.get("setID", 0)))
+        count = set_data["additionalImageCount"] if set_data else 0
+        images = [
+            {
+                "thumbnailURL": f"{self.base_url}{IMAGE_PATH}{set_data['setID']}_{i}.png",
+                "imageURL": f"{self.base_url}{IMAGE_PATH}{set_data['setID']}_{i}.png",
+            }
+            for i in range(count)
+        ]
+        return {"status": "success", "matches": count, "additionalImages": images}
+
+    def get_instructions(self, params: dict) -> dict:
+        """Handle the getInstructions method."""
+        set_data = self.sets_by_id.get(int(params.get("setID", 0)))
+        count = set_data["instructionsCount"] if set_data else 0
+        instructions = [
+            {
+                "URL": f"{self.base_url}/instructions/{set_data['setID']}_{i}.pdf",
+                "description": f"Book {i + 1}",
+            }
+            for i in range(count)
+        ]
+        return {"status": "success", "matches": count, "instructions": instructions}
+
+    def get_image(self, name: str) -> bytes:
+        """
+        Return the PNG bytes of a set image.
+
+        Args:
+            name (str): The image file name without extension.
+        """
+        if name not in self.images:
+            color = IMAGE_COLORS[sum(map(ord, name)) % len(IMAGE_COLORS)]
+            self.images[name] = make_png(self.image_size, self.image_size, color)
+        return self.images[name]
+
+
+API_METHODS = {
+    "getThemes": FakeBrickset.get_themes,
+    "getSets": FakeBrickset.get_sets,
+    "getAdditionalImages": FakeBrickset.get_additional_images,
+    "getInstructions": FakeBrickset.get_instructions,
+}
+
+IMAGE_PATTERN = re.compile(r"^/images/([0-9_]+)\.png$")
+
+
+class FakeBricksetHandler(BaseHTTPRequestHandler):
+    """
+    HTTP handler routing Brickset API and image requests to a FakeBrickset.
+    """
+
+    service: FakeBrickset = None
+
+    def do_GET(self) -> None:
+        url = urllib.parse.urlsplit(self.path)
+        self.handle_request(url.path, url.query)
+
+    def do_POST(self) -> None:
+        url = urllib.parse.urlsplit(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        self.handle_request(url.path, self.rfile.read(length).decode("utf8"))
+
+    def handle_request(self, path: str, query: str) -> None:
+        """
+        Route a request to the API method or image matching its path.
+
+        Args:
+            path (str): The request path.
+            query (str): The url-encoded request parameters.
+        """
+        if not self.service.simulate_network():
+            self.send_body(503, "application/json", b'{"status": "error"}')
+            return
+
+        image_match = IMAGE_PATTERN.match(path)
+        if image_match:
+            self.send_body(200, "image/png", self.service.get_image(image_match.group(1)))
+            return
+
+        method = API_METHODS.get(path.removeprefix(API_PATH))
+        if not path.startswith(API_PATH) or method is None:
+            self.send_body(404, "application/json", b'{"status": "error"}')
+            return
+
+        params = dict(urllib.parse.parse_qsl(query))
+        body = json.dumps(method(self.service, params)).encode("utf8")
+        self.send_body(200, "application/json", body)
+
+    def send_body(self, status: int, content_type: str, body: bytes) -> None:
+        """Send a complete response."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Keep the console quiet, benchmarks issue thousands of requests."""
+
+
+class FakeBricksetServer:
+    """
+    Local HTTP server serving a FakeBrickset, runnable in a background thread.
+    """
+
+    def __init__(
+        self,
+        catalog: dict | None = None,
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+        **service_options,
+    ):
+        handler = type("Handler", (FakeBricksetHandler,), {})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.base_url = f"http://{host}:{self.httpd.server_address[1]}"
+        handler.service = FakeBrickset(
+            catalog or generate_catalog(), self.base_url, **service_options
+        )
+        self.service = handler.service
+        self.thread = None
+
+    @property
+    def api_url(self) -> str:
+        """The URL to use as brickse.config.API_URL."""
+        return self.base_url + API_PATH
+
+    def start(self) -> "FakeBricksetServer":
+        """Start serving in a daemon thread."""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeBricksetServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Brickset stand-in server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--themes", type=int, default=DEFAULT_THEME_COUNT)
+    parser.add_argument("--sets", type=int, default=DEFAULT_SET_COUNT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--image-size", type=int, default=DEFAULT_IMAGE_SIZE)
+    parser.add_argument("--fixture", help="Serve the catalog stored in this JSON file.")
+    parser.add_argument("--save-fixture", help="Save the served catalog to this JSON file.")
+    args = parser.parse_args()
+
+    if args.fixture:
+        catalog = load_catalog(args.fixture)
+    else:
+        catalog = generate_catalog(args.themes, args.sets, args.seed)
+    if args.save_fixture:
+        save_catalog(catalog, args.save_fixture)
+
+    server = FakeBricksetServer(
+        catalog,
+        args.host,
+        args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        image_size=args.image_size,
+        seed=args.seed,
+    )
+    print(f"Serving fake Brickset at {server.api_url}")
+    print(f"Run the app with BRICKSET_API_URL={server.api_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def lock_file(file) -> None:
+    """Block until this process holds the exclusive advisory lock of an open file."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        return
+
+    file.seek(0)
+    while True:
+        try:
+            # Waits about 10 seconds before giving up, so keep trying
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def unlock_file(file) -> None:
+    """Release the advisory lock of an open file."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """
+    An exclusive lock shared by all processes using the same lock file,
+    used as a context manager.
+
+    The lock is reentrant within a process, so a locked operation can call
+    other locked operations. Threads of the same process wait for each other.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): The lock file, created on first use.
+        """
+        self.path = path
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.file = None
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        if self.depth == 0:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self.file = open(self.path, "a+b")
+                lock_file(self.file)
+            except BaseException:
+                if self.file is not None:
+                    self.file.close()
+                    self.file = None
+                self.thread_lock.release()
+                raise
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.depth -= 1
+        if self.depth == 0:
+            try:
+                unlock_file(self.file)
+            finally:
+                self.file.close()
+                self.file = None
+        self.thread_lock.release()
+        return False
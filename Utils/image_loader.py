@@ -0,0 +1,190 @@
+import time
+import urllib.request
+from PyQt6 import QtGui, QtCore, QtWidgets, sip
+
+from Utils.cache import LRUCache
+from Utils.instrumentation import instrumented
+from Utils.memory import configured_limit
+from Utils.metrics import metrics
+from Utils.workers import run_in_background
+
+# Size of the set images shown on cards
+IMAGE_SIZE = 150
+# Number of scaled images kept in memory (a 150x150 image is roughly 90 kB),
+# the environment variable overrides it
+IMAGE_CACHE_SIZE_ENV = "BRICKBUDDY_IMAGE_CACHE_SIZE"
+IMAGE_CACHE_SIZE = configured_limit(IMAGE_CACHE_SIZE_ENV, 400)
+
+image_cache = LRUCache(IMAGE_CACHE_SIZE, "images")
+
+
+@instrumented("image.download")
+def download_image(image_url: str) -> bytes:
+    """
+    Download the raw image data.
+
+    Args:
+        image_url (str): The URL of the image.
+    """
+    start = time.perf_counter()
+    try:
+        image_data = urllib.request.urlopen(image_url).read()
+    except Exception:
+        metrics.record_request("image", image_url, (time.perf_counter() - start) * 1000, failed=True)
+        raise
+    metrics.record_request("image", image_url, (time.perf_counter() - start) * 1000, len(image_data))
+    return image_data
+
+
+@instrumented("image.decode")
+def decode_image(image_data: bytes, size: int = IMAGE_SIZE) -> QtGui.QImage:
+    """
+    Decode and scale image data. Safe to call off the GUI thread.
+
+    Args:
+        image_data (bytes): The encoded image.
+        size (int): The maximal width and height of the scaled image.
+    """
+    image = QtGui.QImage()
+    image.loadFromData(image_data)
+    return image.scaled(
+        size,
+        size,
+        QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+        QtCore.Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+def fetch_set_image(image_url: str, size: int = IMAGE_SIZE) -> QtGui.QImage:
+    """
+    Return a scaled set image, downloading it unless it is cached.
+    Safe to call off the GUI thread.
+
+    Args:
+        image_url (str): The URL of the image.
+        size (int): The maximal width and height of the scaled image.
+    """
+    image = image_cache.get(image_url)
+    if image is None:
+        image = decode_image(download_image(image_url), size)
+        image_cache.put(image_url, image)
+    return image
+
+
+def prefetch_set_image(image_url: str, size: int = IMAGE_SIZE) -> int:
+    """
+    Download a set image into the cache ahead of time.
+
+    Args:
+        image_url (str): The URL of the image.
+        size (int): The maximal width and height of the scaled image.
+
+    Returns:
+        int: The number of downloaded bytes, 0 if the image was already cached.
+    """
+    if image_url in image_cache:
+        return 0
+    image_data = download_image(image_url)
+    image_cache.put(image_url, decode_image(image_data, size))
+    return len(image_data)
+
+
+# Number of images downloaded at the same time
+MAX_CONCURRENT_DOWNLOADS = 4
+
+
+class ImageRequest:
+    """
+    A request to show an image in a label.
+    """
+
+    def __init__(self, label: QtWidgets.QLabel, image_url: str, order: int):
+        self.label = label
+        self.image_url = image_url
+        self.order = order
+        self.cancelled = False
+
+
+class ImageScheduler(QtCore.QObject):
+    """
+    Downloads images for labels, most important first.
+
+    The priority of every pending request is evaluated each time a download
+    slot frees up, so scrolling immediately changes what is loaded next.
+    Lower priority values are loaded first.
+    """
+
+    def __init__(self, priority_func: callable, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.priority_func = priority_func
+        self.pending = []
+        self.in_flight = {}
+        self.request_count = 0
+
+        self.dispatch_timer = QtCore.QTimer(self)
+        self.dispatch_timer.setSingleShot(True)
+        self.dispatch_timer.setInterval(0)
+        self.dispatch_timer.timeout.connect(self.dispatch)
+
+    def request(self, label: QtWidgets.QLabel, image_url: str) -> ImageRequest:
+        """
+        Queue an image download for a label.
+
+        Args:
+            label (QtWidgets.QLabel): The label to show the image in.
+            image_url (str): The URL of the image.
+        """
+        self.request_count += 1
+        image_request = ImageRequest(label, image_url, self.request_count)
+        self.pending.append(image_request)
+        self.dispatch_timer.start()
+        return image_request
+
+    def cancel_all(self) -> None:
+        """Cancel every request, e.g. when the cards showing them are destroyed."""
+        for image_request in self.pending:
+            image_request.cancelled = True
+        for requests in self.in_flight.values():
+            for image_request in requests:
+                image_request.cancelled = True
+        self.pending = []
+
+    def is_alive(self, image_request: ImageRequest) -> bool:
+        """Whether the request is still wanted and its label still exists."""
+        return not image_request.cancelled and not sip.isdeleted(image_request.label)
+
+    def dispatch(self) -> None:
+        """Start downloads of the most important requests until all slots are busy."""
+        self.pending = [r for r in self.pending if self.is_alive(r)]
+
+        while self.pending and len(self.in_flight) < MAX_CONCURRENT_DOWNLOADS:
+            image_request = min(
+                self.pending, key=lambda r: (self.priority_func(r.label), r.order)
+            )
+            self.pending.remove(image_request)
+
+            image_url = image_request.image_url
+            if image_url in self.in_flight:
+                self.in_flight[image_url].append(image_request)
+                continue
+
+            self.in_flight[image_url] = [image_request]
+            run_in_background(
+                fetch_set_image,
+                image_url,
+                on_finished=lambda image, url=image_url: self.finished(url, image),
+                on_failed=lambda error, url=image_url: self.finished(url, None),
+            )
+
+    @instrumented("image.show")
+    def finished(self, image_url: str, image: QtGui.QImage | None) -> None:
+        """Show a downloaded image in all labels still waiting for it."""
+        pixmap = QtGui.QPixmap.fromImage(image) if image is not None else None
+        for image_request in self.in_flight.pop(image_url, []):
+            if not self.is_alive(image_request):
+                continue
+            if pixmap is None:
+                image_request.label.setText("No image")
+            else:
+                image_request.label.setPixmap(pixmap)
+        self.dispatch()
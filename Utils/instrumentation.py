@@ -0,0 +1,103 @@
+import functools
+import threading
+import time
+from collections import deque
+
+# Number of finished spans and stalls kept for inspection
+RECENT_SPANS_COUNT = 200
+RECENT_STALLS_COUNT = 20
+
+recent_spans = deque(maxlen=RECENT_SPANS_COUNT)
+recent_stalls = deque(maxlen=RECENT_STALLS_COUNT)
+
+# Names of the spans currently open on each thread, by thread id
+active_spans = {}
+
+_span_listeners = []
+
+
+class SpanRecord:
+    """
+    A finished span: a named operation and how long it took.
+    """
+
+    def __init__(self, name: str, start: float, duration_ms: float, thread_id: int):
+        self.name = name
+        self.start = start
+        self.duration_ms = duration_ms
+        self.thread_id = thread_id
+
+
+class StallRecord:
+    """
+    A period in which the GUI event loop did not run.
+    """
+
+    def __init__(self, start: float, stack: str, spans: list):
+        self.start = start
+        self.duration_ms = 0
+        self.stack = stack
+        self.spans = spans
+
+
+def add_span_listener(listener: callable) -> None:
+    """
+    Call a function with every finished SpanRecord, on the thread that ran it.
+
+    Args:
+        listener (callable): The function to call.
+    """
+    _span_listeners.append(listener)
+
+
+def remove_span_listener(listener: callable) -> None:
+    """Stop calling a function added with add_span_listener."""
+    if listener in _span_listeners:
+        _span_listeners.remove(listener)
+
+
+class span:
+    """
+    Context manager measuring a named operation.
+
+    Example:
+        with span("model.read_csv"):
+            ...
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> "span":
+        self.thread_id = threading.get_ident()
+        active_spans.setdefault(self.thread_id, []).append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        duration_ms = (time.perf_counter() - self.start) * 1000
+        active_spans[self.thread_id].pop()
+
+        record = SpanRecord(self.name, self.start, duration_ms, self.thread_id)
+        recent_spans.append(record)
+        for listener in list(_span_listeners):
+            listener(record)
+
+
+def instrumented(name: str) -> callable:
+    """
+    Decorator wrapping every call of a function in a span.
+
+    Args:
+        name (str): The name of the span.
+    """
+
+    def decorator(func: callable) -> callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
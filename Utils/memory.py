@@ -0,0 +1,79 @@
+import os
+import sys
+from PyQt6 import QtWidgets
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def configured_limit(env_name: str, default: int) -> int:
+    """
+    Return a size limit set by the environment.
+
+    Args:
+        env_name (str): The environment variable holding the limit.
+        default (int): The limit used when the variable is unset or invalid.
+    """
+    try:
+        return max(int(os.environ[env_name]), 0)
+    except (KeyError, ValueError):
+        return default
+
+
+def rss_bytes() -> int:
+    """Return the current resident set size of the process, 0 if unknown."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        if resource is None:
+            return 0
+        # Peak instead of current RSS, in kB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def pixmap_bytes(widgets: list) -> int:
+    """
+    Return the memory held by the pixmaps shown in labels. Labels sharing a
+    pixmap count it once.
+
+    Args:
+        widgets (list): The widgets to look at.
+    """
+    pixmaps = {}
+    for widget in widgets:
+        if not isinstance(widget, QtWidgets.QLabel):
+            continue
+        pixmap = widget.pixmap()
+        if pixmap is not None and not pixmap.isNull():
+            pixmaps[pixmap.cacheKey()] = pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    return sum(pixmaps.values())
+
+
+def memory_snapshot(image_cache) -> dict:
+    """
+    Return the memory telemetry of the application.
+
+    Args:
+        image_cache (LRUCache): The cache of decoded QImages.
+    """
+    widgets = QtWidgets.QApplication.allWidgets()
+    return {
+        "rss_bytes": rss_bytes(),
+        "live_widgets": len(widgets),
+        "pixmap_bytes": pixmap_bytes(widgets),
+        "cached_images": len(image_cache),
+        "cached_image_bytes": sum(image.sizeInBytes() for image in image_cache.values()),
+    }
+
+
+def format_memory(snapshot: dict) -> str:
+    """Format a memory snapshot as a single line."""
+    return (
+        f"rss {snapshot['rss_bytes'] / 2**20:.1f}MB  widgets {snapshot['live_widgets']}  "
+        f"pixmaps {snapshot['pixmap_bytes'] / 2**20:.1f}MB  "
+        f"images {snapshot['cached_images']} ({snapshot['cached_image_bytes'] / 2**20:.1f}MB)"
+    )
@@ -1,31 +1,75 @@
-from PyQt6.QtWidgets import QMessageBox
+import sys
+
+
+class QtReporter:
+    """
+    Reports messages in message boxes. Qt is imported on first use, so
+    modules reporting messages can be used without it.
+    """
+
+    @staticmethod
+    def show(icon_name: str, title: str, message: str):
+        from PyQt6.QtWidgets import QMessageBox
+
+        msg_box = QMessageBox()
+        msg_box.setIcon(getattr(QMessageBox.Icon, icon_name))
+        msg_box.setText(message)
+        msg_box.setWindowTitle(title)
+        msg_box.exec()
+
+    def warning(self, message: str):
+        self.show("Warning", "Warning", message)
+
+    def info(self, message: str):
+        self.show("Information", "Information", message)
+
+
+class ConsoleReporter:
+    """
+    Reports messages on the standard error output, for headless use.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def warning(self, message: str):
+        print(f"warning: {message}", file=self.stream or sys.stderr)
+
+    def info(self, message: str):
+        print(message, file=self.stream or sys.stderr)
+
+
+_reporter = QtReporter()
+
+
+def set_reporter(reporter) -> None:
+    """
+    Replace how messages are reported, e.g. with a ConsoleReporter.
+
+    Args:
+        reporter: An object with warning(message) and info(message) methods.
+    """
+    global _reporter
+    _reporter = reporter
 
 
 class MessageBox:
     @staticmethod
     def show_warning(message: str):
         """
-        Display a warning message using PyQt6.
+        Display a warning message using the current reporter.
 
         Args:
             message (str): The message to display.
         """
-        msg_box = QMessageBox()
-        msg_box.setIcon(QMessageBox.Icon.Warning)
-        msg_box.setText(message)
-        msg_box.setWindowTitle("Warning")
-        msg_box.exec()
+        _reporter.warning(message)
 
     @staticmethod
     def show_info(message: str):
         """
-        Display an information message using PyQt6.
+        Display an information message using the current reporter.
 
         Args:
             message (str): The message to display.
         """
-        msg_box = QMessageBox()
-        msg_box.setIcon(QMessageBox.Icon.Information)
-        msg_box.setText(message)
-        msg_box.setWindowTitle("Information")
-        msg_box.exec()
+        _reporter.info(message)
@@ -0,0 +1,110 @@
+from PyQt6 import QtCore
+
+from Models.data_model import Model, COLLECTED_SETS_FILE, WISHLIST_FILE
+from Utils.api_requests import get_sets_by_numbers, set_number_from_url
+from Utils.set_transfer import chunks
+from Utils.workers import run_in_background
+
+# Number of set numbers refreshed with one API request
+REFRESH_BATCH_SIZE = 100
+
+
+def stored_set_numbers() -> dict:
+    """
+    Return the set numbers of every wishlisted and collected set, mapped to
+    the stored set IDs. Sets stored without a Brickset URL are skipped.
+    """
+    set_ids_by_number = {}
+    rows = [
+        (row[0], row[3]) for row in Model.iter_csv(WISHLIST_FILE, skip_header=True)
+    ] + [
+        (row[1], row[4]) for row in Model.iter_csv(COLLECTED_SETS_FILE, skip_header=True)
+    ]
+    for set_id, brickset_url in rows:
+        set_number = set_number_from_url(brickset_url)
+        if set_number:
+            set_ids_by_number.setdefault(set_number, set()).add(set_id)
+    return set_ids_by_number
+
+
+class MetadataRefresh(QtCore.QObject):
+    """
+    Refreshes the stored details of every wishlisted and collected set.
+
+    The distinct set numbers are fetched in batches, one request per batch,
+    so brickse's request delay keeps the job within the rate limit. Batches
+    run one after another off the GUI thread, and the data files are
+    rewritten once at the end.
+    """
+
+    progress = QtCore.pyqtSignal(int, int)
+    finished = QtCore.pyqtSignal(int)
+    failed = QtCore.pyqtSignal(object)
+
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.running = False
+        self.batches = []
+        self.set_ids_by_number = {}
+        self.updates = {}
+        self.done = 0
+        self.total = 0
+
+    def start(self) -> bool:
+        """
+        Start the refresh.
+
+        Returns:
+            bool: False if a refresh is already running.
+        """
+        if self.running:
+            return False
+
+        self.running = True
+        self.set_ids_by_number = stored_set_numbers()
+        self.batches = list(chunks(self.set_ids_by_number, REFRESH_BATCH_SIZE))
+        self.updates = {}
+        self.done = 0
+        self.total = len(self.set_ids_by_number)
+        self.progress.emit(self.done, self.total)
+        self.fetch_next_batch()
+        return True
+
+    def fetch_next_batch(self) -> None:
+        """Fetch the next batch, or save the fetched details after the last one."""
+        if not self.batches:
+            run_in_background(
+                Model.update_set_metadata,
+                self.updates,
+                on_finished=self.saved,
+                on_failed=self.stop_with_error,
+            )
+            return
+
+        batch = self.batches.pop(0)
+        run_in_background(
+            get_sets_by_numbers,
+            batch,
+            on_finished=lambda sets: self.batch_loaded(batch, sets),
+            on_failed=self.stop_with_error,
+        )
+
+    def batch_loaded(self, batch: list, sets: list) -> None:
+        """Remember the fetched details of a batch and continue with the next one."""
+        for set_data in sets:
+            set_number = set_number_from_url(set_data.brickset_url)
+            for set_id in self.set_ids_by_number.get(set_number, ()):
+                self.updates[set_id] = set_data
+
+        self.done += len(batch)
+        self.progress.emit(self.done, self.total)
+        self.fetch_next_batch()
+
+    def saved(self, updated_count: int) -> None:
+        self.running = False
+        self.finished.emit(updated_count)
+
+    def stop_with_error(self, error: Exception) -> None:
+        self.running = False
+        self.batches = []
+        self.failed.emit(error)
@@ -0,0 +1,205 @@
+import json
+import threading
+import time
+import urllib.parse
+
+from Utils.cache import named_caches
+
+# Upper bounds of the latency histogram buckets, the last bucket is unbounded
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """
+    Counts of request durations in fixed buckets.
+    """
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        """Add one measured duration."""
+        index = 0
+        while index < len(LATENCY_BUCKETS_MS) and duration_ms > LATENCY_BUCKETS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile as the upper bound of the bucket containing it.
+
+        Args:
+            fraction (float): The percentile as a fraction, e.g. 0.95.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                break
+        if index < len(LATENCY_BUCKETS_MS):
+            return min(float(LATENCY_BUCKETS_MS[index]), self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [
+            f">{LATENCY_BUCKETS_MS[-1]}ms"
+        ]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class EndpointMetrics:
+    """
+    Counters of one kind of request, e.g. "api.getSets" or "image".
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes = 0
+        self.latency = LatencyHistogram()
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class MetricsRegistry:
+    """
+    Thread-safe network metrics of the API and image layers.
+
+    Cache counters are not duplicated here, they are read from the named
+    LRU caches when a snapshot is taken.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.endpoints = {}
+        self.bytes_per_host = {}
+
+    def record_request(
+        self, endpoint: str, url: str, duration_ms: float, size: int = 0, failed: bool = False
+    ) -> None:
+        """
+        Record a finished request.
+
+        Args:
+            endpoint (str): The kind of the request.
+            url (str): The requested URL, used to account bytes per host.
+            duration_ms (float): How long the request took.
+            size (int): The number of received bytes.
+            failed (bool): Whether the request failed.
+        """
+        host = urllib.parse.urlsplit(url).netloc or "unknown"
+        with self.lock:
+            metrics = self.endpoints.setdefault(endpoint, EndpointMetrics())
+            metrics.requests += 1
+            metrics.bytes += size
+            metrics.latency.observe(duration_ms)
+            if failed:
+                metrics.errors += 1
+            self.bytes_per_host[host] = self.bytes_per_host.get(host, 0) + size
+
+    def record_retry(self, endpoint: str) -> None:
+        """Record that a failed request of the endpoint is retried."""
+        with self.lock:
+            self.endpoints.setdefault(endpoint, EndpointMetrics()).retries += 1
+
+    def reset(self) -> None:
+        """Forget all recorded requests."""
+        with self.lock:
+            self.started = time.time()
+            self.endpoints = {}
+            self.bytes_per_host = {}
+
+    def snapshot(self) -> dict:
+        """Return all metrics, including cache counters, as a JSON serializable dict."""
+        with self.lock:
+            endpoints = {
+                name: metrics.to_dict() for name, metrics in sorted(self.endpoints.items())
+            }
+            bytes_per_host = dict(sorted(self.bytes_per_host.items()))
+            uptime = time.time() - self.started
+
+        caches = {
+            name: {
+                "entries": len(cache),
+                "max_entries": cache.max_entries,
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "evictions": cache.evictions,
+                "hit_rate": cache.hit_rate(),
+            }
+            for name, cache in sorted(named_caches.items())
+        }
+        return {
+            "uptime_s": round(uptime, 1),
+            "endpoints": endpoints,
+            "bytes_per_host": bytes_per_host,
+            "caches": caches,
+        }
+
+    def dump(self, path: str) -> None:
+        """
+        Write a snapshot to a JSON file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+def format_snapshot(snapshot: dict) -> str:
+    """Format a metrics snapshot as a plain text table."""
+    lines = [
+        f"{'endpoint':<24} {'requests':>8} {'errors':>7} {'retries':>7} "
+        f"{'kB':>9} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>8}"
+    ]
+    for name, stats in snapshot["endpoints"].items():
+        latency = stats["latency"]
+        lines.append(
+            f"{name:<24} {stats['requests']:>8} {stats['errors']:>7} {stats['retries']:>7} "
+            f"{stats['bytes'] / 1024:>9.1f} {latency['p50_ms']:>7.0f} "
+            f"{latency['p95_ms']:>7.0f} {latency['max_ms']:>8.0f}"
+        )
+
+    lines.append("")
+    lines.append(f"{'host':<40} {'kB':>9}")
+    for host, size in snapshot["bytes_per_host"].items():
+        lines.append(f"{host:<40} {size / 1024:>9.1f}")
+
+    lines.append("")
+    lines.append(f"{'cache':<16} {'entries':>11} {'hits':>7} {'misses':>7} {'evicted':>8} {'hit rate':>9}")
+    for name, stats in snapshot["caches"].items():
+        entries = f"{stats['entries']}/{stats['max_entries']}"
+        lines.append(
+            f"{name:<16} {entries:>11} {stats['hits']:>7} {stats['misses']:>7} "
+            f"{stats['evictions']:>8} {stats['hit_rate']:>9.0%}"
+        )
+    return "\n".join(lines)
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,119 @@
+from PyQt6 import QtCore
+
+from Utils.api_requests import get_sets_from_theme
+from Utils.cache import LRUCache
+from Utils.image_loader import prefetch_set_image
+from Utils.workers import run_in_background
+
+# How long the user has to be inactive before prefetching starts
+IDLE_DELAY_MS = 1500
+# Budgets for one idle period, reset whenever the user acts
+MAX_THEME_REQUESTS = 3
+MAX_IMAGE_REQUESTS = 16
+MAX_PREFETCH_BYTES = 4 * 1024 * 1024
+
+
+class Prefetcher(QtCore.QObject):
+    """
+    Fetches data the user is likely to need next while the app is idle.
+
+    Theme set lists are stored in the shared theme cache, images in the image
+    cache of Utils.image_loader. Tasks run one at a time so prefetching never
+    competes with the user's own requests for more than one connection.
+    """
+
+    def __init__(self, theme_cache: LRUCache, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.theme_cache = theme_cache
+        self.queue = []
+        self.generation = 0
+        self.running = False
+        self.theme_requests = 0
+        self.image_requests = 0
+        self.downloaded_bytes = 0
+
+        self.idle_timer = QtCore.QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(IDLE_DELAY_MS)
+        self.idle_timer.timeout.connect(self.run_next)
+
+    def schedule(self, themes: list, image_urls: list) -> None:
+        """
+        Replace the planned work and start it once the user is idle.
+
+        Args:
+            themes (list): Themes whose sets should be prefetched, most likely first.
+            image_urls (list): Image URLs to prefetch, most likely first.
+        """
+        self.cancel()
+        self.queue = [("image", url) for url in image_urls] + [
+            ("theme", theme) for theme in themes if theme not in self.theme_cache
+        ]
+        self.idle_timer.start()
+
+    def cancel(self) -> None:
+        """Drop all planned work and reset the budgets. Called on every user action."""
+        self.idle_timer.stop()
+        self.queue = []
+        self.generation += 1
+        self.theme_requests = 0
+        self.image_requests = 0
+        self.downloaded_bytes = 0
+
+    def within_budget(self, kind: str) -> bool:
+        """Whether another task of the given kind fits the budgets."""
+        if self.downloaded_bytes >= MAX_PREFETCH_BYTES:
+            return False
+        if kind == "theme":
+            return self.theme_requests < MAX_THEME_REQUESTS
+        return self.image_requests < MAX_IMAGE_REQUESTS
+
+    def run_next(self) -> None:
+        """Start the next task that fits the budgets."""
+        if self.running:
+            return
+
+        while self.queue:
+            kind, target = self.queue.pop(0)
+            if self.within_budget(kind):
+                break
+        else:
+            return
+
+        generation = self.generation
+        self.running = True
+        if kind == "theme":
+            self.theme_requests += 1
+            run_in_background(
+                get_sets_from_theme,
+                target,
+                on_finished=lambda sets: self.theme_prefetched(generation, target, sets),
+                on_failed=lambda error: self.task_done(generation),
+            )
+        else:
+            self.image_requests += 1
+            run_in_background(
+                prefetch_set_image,
+                target,
+                on_finished=lambda size: self.image_prefetched(generation, size),
+                on_failed=lambda error: self.task_done(generation),
+            )
+
+    def theme_prefetched(self, generation: int, theme: str, sets: list) -> None:
+        """Store prefetched sets of a theme. Fresh data is kept even if cancelled."""
+        self.theme_cache.put(theme, sets)
+        self.task_done(generation)
+
+    def image_prefetched(self, generation: int, size: int) -> None:
+        """Account the downloaded bytes of a prefetched image."""
+        if generation == self.generation:
+            self.downloaded_bytes += size
+        self.task_done(generation)
+
+    def task_done(self, generation: int) -> None:
+        """Continue with the next task unless the work was cancelled meanwhile."""
+        self.running = False
+        if generation == self.generation:
+            self.run_next()
+        elif self.queue:
+            self.idle_timer.start()
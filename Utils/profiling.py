@@ -0,0 +1,195 @@
+import cProfile
+import json
+import os
+import threading
+import time
+
+from Utils.cache import named_caches
+from Utils.instrumentation import add_span_listener, remove_span_listener, recent_stalls
+from Utils.metrics import metrics
+
+# Set to an output directory (or 1 for DEFAULT_PROFILE_DIRECTORY) to profile a session
+PROFILE_ENV = "BRICKBUDDY_PROFILE"
+# Set to 1 to also capture a cProfile of the GUI thread
+CPROFILE_ENV = "BRICKBUDDY_CPROFILE"
+DEFAULT_PROFILE_DIRECTORY = "profiles"
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """
+    Return a percentile of the samples using nearest rank.
+
+    Args:
+        samples (list): The measured values.
+        fraction (float): The percentile as a fraction, e.g. 0.95.
+    """
+    ordered = sorted(samples)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class ProfilingSession:
+    """
+    Records every span of a session and writes it as a Chrome trace
+    (chrome://tracing, Perfetto) plus a per-operation summary.
+    """
+
+    def __init__(
+        self, output_directory: str, use_cprofile: bool = False, startup_timer=None
+    ):
+        self.output_directory = output_directory
+        self.startup_timer = startup_timer
+        self.name = time.strftime("session-%Y%m%d-%H%M%S")
+        self.start_time = time.perf_counter()
+        self.events = []
+        self.durations = {}
+        self.lock = threading.Lock()
+        self.profiler = cProfile.Profile() if use_cprofile else None
+
+    def start(self) -> "ProfilingSession":
+        """Start recording spans and, if enabled, profiling the calling thread."""
+        add_span_listener(self.record)
+        if self.profiler is not None:
+            self.profiler.enable()
+        return self
+
+    def record(self, span_record) -> None:
+        """Span listener storing a finished span."""
+        event = {
+            "name": span_record.name,
+            "cat": span_record.name.split(".")[0],
+            "ph": "X",
+            "ts": (span_record.start - self.start_time) * 1_000_000,
+            "dur": span_record.duration_ms * 1000,
+            "pid": os.getpid(),
+            "tid": span_record.thread_id,
+        }
+        with self.lock:
+            self.events.append(event)
+            self.durations.setdefault(span_record.name, []).append(span_record.duration_ms)
+
+    def summary(self) -> dict:
+        """
+        Return count, total and p95 time per operation, network metrics, cache
+        hit rates and the startup phases.
+        """
+        with self.lock:
+            durations = {name: list(samples) for name, samples in self.durations.items()}
+
+        operations = {
+            name: {
+                "count": len(samples),
+                "total_ms": sum(samples),
+                "p95_ms": percentile(samples, 0.95),
+            }
+            for name, samples in sorted(durations.items())
+        }
+        caches = {
+            name: {
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "evictions": cache.evictions,
+                "hit_rate": cache.hit_rate(),
+            }
+            for name, cache in named_caches.items()
+        }
+        network = metrics.snapshot()
+        startup = None
+        if self.startup_timer is not None:
+            startup = {
+                "phases_ms": dict(self.startup_timer.phases),
+                "budget_ms": self.startup_timer.budget_ms,
+                "within_budget": self.startup_timer.within_budget(),
+            }
+        return {
+            "startup": startup,
+            "operations": operations,
+            "caches": caches,
+            "endpoints": network["endpoints"],
+            "bytes_per_host": network["bytes_per_host"],
+            "stalls": len(recent_stalls),
+        }
+
+    def stop(self) -> list:
+        """
+        Stop recording and write the trace, summary and cProfile files.
+
+        Returns:
+            list: The paths of the written files.
+        """
+        remove_span_listener(self.record)
+        if self.profiler is not None:
+            self.profiler.disable()
+
+        os.makedirs(self.output_directory, exist_ok=True)
+        base_path = os.path.join(self.output_directory, self.name)
+        paths = [f"{base_path}-trace.json", f"{base_path}-summary.json"]
+
+        stall_events = [
+            {
+                "name": "event loop stall",
+                "cat": "stall",
+                "ph": "X",
+                "ts": (stall.start - self.start_time) * 1_000_000,
+                "dur": stall.duration_ms * 1000,
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": {"spans": stall.spans, "stack": stall.stack},
+            }
+            for stall in recent_stalls
+            if stall.start >= self.start_time
+        ]
+        with self.lock:
+            trace = {"traceEvents": self.events + stall_events, "displayTimeUnit": "ms"}
+        with open(paths[0], "w") as f:
+            json.dump(trace, f)
+
+        summary = self.summary()
+        with open(paths[1], "w") as f:
+            json.dump(summary, f, indent=2)
+
+        if self.profiler is not None:
+            paths.append(f"{base_path}.prof")
+            self.profiler.dump_stats(paths[-1])
+
+        if self.startup_timer is not None:
+            print(self.startup_timer.report())
+        print_summary(summary)
+        print("Profile written to " + ", ".join(paths))
+        return paths
+
+
+def print_summary(summary: dict) -> None:
+    """Print the summary of a profiling session as a table."""
+    print(f"{'operation':<40} {'count':>7} {'total ms':>10} {'p95 ms':>9}")
+    for name, stats in summary["operations"].items():
+        print(
+            f"{name:<40} {stats['count']:>7} {stats['total_ms']:>10.1f} {stats['p95_ms']:>9.2f}"
+        )
+    for name, stats in summary["caches"].items():
+        print(f"cache {name}: {stats['hit_rate']:.0%} hit rate ({stats['hits']} hits, {stats['misses']} misses)")
+
+
+def profiling_from_environment(
+    output_directory: str | None = None, use_cprofile: bool = False, startup_timer=None
+) -> ProfilingSession | None:
+    """
+    Start a profiling session if requested by arguments or the environment.
+
+    Args:
+        output_directory (str | None): Output directory given on the command line.
+        use_cprofile (bool): Whether cProfile was requested on the command line.
+        startup_timer (StartupTimer | None): The startup timer whose phases
+            are added to the summary.
+
+    Returns:
+        ProfilingSession | None: The started session, or None if profiling is off.
+    """
+    output_directory = output_directory or os.environ.get(PROFILE_ENV)
+    if not output_directory:
+        return None
+    if output_directory == "1":
+        output_directory = DEFAULT_PROFILE_DIRECTORY
+
+    use_cprofile = use_cprofile or os.environ.get(CPROFILE_ENV) == "1"
+    return ProfilingSession(output_directory, use_cprofile, startup_timer).start()
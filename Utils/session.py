@@ -0,0 +1,75 @@
+from Utils.api_requests import SetBatch, SetInfo
+from Utils.disk_cache import read_cache, write_cache
+
+SESSION_CACHE = "session"
+
+
+class SessionSnapshot:
+    """
+    A compact snapshot of what the user was looking at when the app closed.
+    """
+
+    def __init__(
+        self,
+        theme: str,
+        sets: list,
+        active_view: str,
+        view_args: list,
+        displayed_count: int,
+        scroll_position: int,
+    ):
+        self.theme = theme
+        self.sets = sets
+        self.active_view = active_view
+        self.view_args = view_args
+        self.displayed_count = displayed_count
+        self.scroll_position = scroll_position
+
+    def to_dict(self) -> dict:
+        """Return the snapshot as a JSON serializable dict."""
+        return {
+            "theme": self.theme,
+            "sets": [set_data.to_dict() for set_data in self.sets],
+            "active_view": self.active_view,
+            "view_args": self.view_args,
+            "displayed_count": self.displayed_count,
+            "scroll_position": self.scroll_position,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "SessionSnapshot":
+        """Create a snapshot from a dict made by to_dict."""
+        return SessionSnapshot(
+            data["theme"],
+            SetBatch.from_sets(SetInfo.from_dict(set_data) for set_data in data["sets"]),
+            data["active_view"],
+            data["view_args"],
+            data["displayed_count"],
+            data["scroll_position"],
+        )
+
+
+def save_session(snapshot: SessionSnapshot) -> None:
+    """
+    Persist the session snapshot for the next launch.
+
+    Args:
+        snapshot (SessionSnapshot): The snapshot to save.
+    """
+    write_cache(SESSION_CACHE, snapshot.to_dict())
+
+
+def load_session() -> SessionSnapshot | None:
+    """
+    Load the snapshot saved by the previous session.
+
+    Returns:
+        SessionSnapshot | None: The snapshot, or None if there is no usable one.
+    """
+    data = read_cache(SESSION_CACHE)
+    if data is None:
+        return None
+    try:
+        return SessionSnapshot.from_dict(data)
+    except (KeyError, TypeError):
+        return None
@@ -0,0 +1,55 @@
+from PyQt6 import QtCore
+
+from Utils.api_requests import get_set_details
+from Utils.cache import LRUCache
+from Utils.workers import run_in_background
+
+# Number of sets whose extended details are kept
+SET_DETAILS_CACHE_SIZE = 200
+
+
+class SetDetailsLoader(QtCore.QObject):
+    """
+    Loads the extended details of sets off the GUI thread, only when they
+    are shown. Loaded details are cached by set ID, and a set requested
+    again while loading is fetched only once.
+    """
+
+    details_ready = QtCore.pyqtSignal(int, object)
+    details_failed = QtCore.pyqtSignal(int, object)
+
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.cache = LRUCache(SET_DETAILS_CACHE_SIZE, "set_details")
+        self.loading = set()
+
+    def load(self, set_id: int) -> None:
+        """
+        Load the details of a set. Cached details are emitted immediately.
+
+        Args:
+            set_id (int): The Brickset ID of the set.
+        """
+        cached_details = self.cache.get(set_id)
+        if cached_details is not None:
+            self.details_ready.emit(set_id, cached_details)
+            return
+        if set_id in self.loading:
+            return
+
+        self.loading.add(set_id)
+        run_in_background(
+            get_set_details,
+            set_id,
+            on_finished=lambda details: self.finished(set_id, details),
+            on_failed=lambda error: self.failed(set_id, error),
+        )
+
+    def finished(self, set_id: int, details) -> None:
+        self.loading.discard(set_id)
+        self.cache.put(set_id, details)
+        self.details_ready.emit(set_id, details)
+
+    def failed(self, set_id: int, error: Exception) -> None:
+        self.loading.discard(set_id)
+        self.details_failed.emit(set_id, error)
@@ -0,0 +1,171 @@
+from array import array
+from collections.abc import Sequence
+
+from Utils.api_requests import SetBatch, SetInfo, to_int
+
+# Sort orders offered to the user, mapped to the sort key used by SetIndex
+SORT_ORDERS = {
+    "Default order": None,
+    "Name": "name",
+    "Year": "year",
+    "Pieces": "pieces",
+    "Set ID": "id",
+}
+
+
+class SetFilter:
+    """
+    Criteria sets have to match to be shown. Bounds of 0 are not applied.
+    """
+
+    def __init__(
+        self,
+        query: str = "",
+        year_from: int = 0,
+        year_to: int = 0,
+        min_pieces: int = 0,
+        max_pieces: int = 0,
+    ):
+        self.query = query.strip().casefold()
+        self.year_from = year_from
+        self.year_to = year_to
+        self.min_pieces = min_pieces
+        self.max_pieces = max_pieces
+
+    def key(self) -> tuple:
+        """Return a hashable key of the criteria."""
+        return (self.query, self.year_from, self.year_to, self.min_pieces, self.max_pieces)
+
+    def is_empty(self) -> bool:
+        """Whether the filter lets every set through."""
+        return self.key() == ("", 0, 0, 0, 0)
+
+
+class FilteredItems(Sequence):
+    """
+    A view of some items of a list in a given order, without copying them.
+    """
+
+    def __init__(self, items: Sequence, indices: array):
+        self.items = items
+        self.indices = indices
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.items[i] for i in self.indices[index]]
+        return self.items[self.indices[index]]
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+
+class SetIndex:
+    """
+    Sort keys of a list of sets, precomputed once so filtering and sorting
+    never touch the items themselves.
+
+    Sorted permutations are cached per sort order, and the result of the
+    last filter is kept so redisplaying the same filter is free.
+    """
+
+    def __init__(self, items: Sequence, set_info_func: callable = None):
+        """
+        Args:
+            items (Sequence): The sets, e.g. a SetBatch, wishlist rows or collected sets.
+            set_info_func (callable): Returns the SetInfo of an item, if items aren't SetInfo.
+        """
+        self.items = items
+        self.item_count = len(items)
+        self.permutations = {}
+        self.last_key = None
+        self.last_result = None
+
+        if isinstance(items, SetBatch):
+            self.ids = items.ids
+            self.years = items.years
+            self.pieces = items.pieces
+            self.names = [name.casefold() for name in items.names]
+            return
+
+        set_infos = [set_info_func(item) for item in items] if set_info_func else items
+        self.ids = array("q", (to_int(set_data.id) for set_data in set_infos))
+        self.years = array("i", (set_data.year for set_data in set_infos))
+        self.pieces = array("i", (set_data.pieces for set_data in set_infos))
+        self.names = [(set_data.name or "").casefold() for set_data in set_infos]
+
+    def is_current(self, items: Sequence) -> bool:
+        """Whether the index was built from these items and they didn't change size."""
+        return self.items is items and self.item_count == len(items)
+
+    def permutation(self, sort_key: str | None, descending: bool = False) -> Sequence:
+        """
+        Return the item indices in sort order.
+
+        Args:
+            sort_key (str | None): "name", "year", "pieces", "id" or None for the original order.
+            descending (bool): Whether to reverse the order.
+        """
+        cache_key = (sort_key, descending)
+        if cache_key not in self.permutations:
+            if sort_key is None:
+                order = range(self.item_count)
+                if descending:
+                    order = reversed(order)
+                permutation = array("i", order)
+            else:
+                column = {
+                    "name": self.names,
+                    "year": self.years,
+                    "pieces": self.pieces,
+                    "id": self.ids,
+                }[sort_key]
+                permutation = array(
+                    "i",
+                    sorted(range(self.item_count), key=column.__getitem__, reverse=descending),
+                )
+            self.permutations[cache_key] = permutation
+        return self.permutations[cache_key]
+
+    def apply(
+        self, set_filter: SetFilter, sort_key: str | None = None, descending: bool = False
+    ) -> FilteredItems:
+        """
+        Return the matching items in sort order.
+
+        Args:
+            set_filter (SetFilter): The criteria to match.
+            sort_key (str | None): The sort order, see permutation.
+            descending (bool): Whether to reverse the order.
+        """
+        key = (set_filter.key(), sort_key, descending)
+        if key == self.last_key:
+            return self.last_result
+
+        permutation = self.permutation(sort_key, descending)
+        if set_filter.is_empty():
+            indices = permutation
+        else:
+            names, years, pieces = self.names, self.years, self.pieces
+            checks = []
+            if set_filter.query:
+                checks.append(lambda i, query=set_filter.query: query in names[i])
+            if set_filter.year_from:
+                checks.append(lambda i, bound=set_filter.year_from: years[i] >= bound)
+            if set_filter.year_to:
+                checks.append(lambda i, bound=set_filter.year_to: years[i] <= bound)
+            if set_filter.min_pieces:
+                checks.append(lambda i, bound=set_filter.min_pieces: pieces[i] >= bound)
+            if set_filter.max_pieces:
+                checks.append(lambda i, bound=set_filter.max_pieces: pieces[i] <= bound)
+            indices = array(
+                "i", (i for i in permutation if all(check(i) for check in checks))
+            )
+
+        self.last_key = key
+        self.last_result = FilteredItems(self.items, indices)
+        return self.last_result
+
+
+def wishlist_row_set_info(row: list) -> SetInfo:
+    """Return the SetInfo of a wishlist CSV row."""
+    return SetInfo(*row[:6])
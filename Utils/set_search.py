@@ -0,0 +1,92 @@
+from PyQt6 import QtCore
+
+from Utils.api_requests import search_sets
+from Utils.cache import LRUCache
+from Utils.workers import run_in_background
+
+# Time without keystrokes before a query is sent
+DEBOUNCE_MS = 300
+# Shorter queries match too many sets to be useful
+MIN_QUERY_LENGTH = 2
+# Number of queries whose results are kept
+SEARCH_CACHE_SIZE = 100
+
+
+def normalize_query(query: str) -> str:
+    """Return the form of a query used as cache key and sent to the API."""
+    return " ".join(query.casefold().split())
+
+
+class SetSearch(QtCore.QObject):
+    """
+    As-you-type set search across all themes.
+
+    Keystrokes restart a debounce timer, so only the query the user paused
+    on is sent. Results of queries superseded meanwhile are dropped, and all
+    results are cached, so backspacing to an earlier query is instant.
+    """
+
+    results_ready = QtCore.pyqtSignal(str, object)
+    search_failed = QtCore.pyqtSignal(str, object)
+
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.cache = LRUCache(SEARCH_CACHE_SIZE, "search")
+        self.query = ""
+        self.generation = 0
+
+        self.debounce_timer = QtCore.QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.run)
+
+    def search(self, query: str) -> None:
+        """
+        Search for a query once the user stops typing.
+        Cached queries are answered immediately.
+
+        Args:
+            query (str): The text typed by the user.
+        """
+        self.cancel()
+        self.query = normalize_query(query)
+        if len(self.query) < MIN_QUERY_LENGTH or self.query in self.cache:
+            self.run()
+        else:
+            self.debounce_timer.start()
+
+    def cancel(self) -> None:
+        """Drop the pending query and the results of any running one."""
+        self.debounce_timer.stop()
+        self.generation += 1
+
+    def run(self) -> None:
+        """Answer the current query from the cache or start its request."""
+        query = self.query
+        if len(query) < MIN_QUERY_LENGTH:
+            self.results_ready.emit(query, [])
+            return
+
+        cached_results = self.cache.get(query)
+        if cached_results is not None:
+            self.results_ready.emit(query, cached_results)
+            return
+
+        generation = self.generation
+        run_in_background(
+            search_sets,
+            query,
+            on_finished=lambda results: self.finished(generation, query, results),
+            on_failed=lambda error: self.failed(generation, query, error),
+        )
+
+    def finished(self, generation: int, query: str, results) -> None:
+        """Cache the results and show them unless the query was superseded."""
+        self.cache.put(query, results)
+        if generation == self.generation:
+            self.results_ready.emit(query, results)
+
+    def failed(self, generation: int, query: str, error: Exception) -> None:
+        """Report a failed search unless the query was superseded."""
+        if generation == self.generation:
+            self.search_failed.emit(query, error)
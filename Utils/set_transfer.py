@@ -0,0 +1,326 @@
+import csv
+import json
+import os
+import re
+
+from Models.data_model import (
+    Model,
+    COLLECTED_SETS_FILE,
+    COLLECTED_SETS_HEADERS,
+    WISHLIST_FILE,
+    WISHLIST_HEADERS,
+)
+from Utils.api_requests import (
+    get_sets_by_numbers,
+    normalize_set_number,
+    set_number_from_url,
+    SetInfo,
+)
+
+# Number of set numbers resolved with one API request
+IMPORT_CHUNK_SIZE = 100
+# Size of the pieces a JSON array is read in
+JSON_READ_SIZE = 64 * 1024
+
+# Column names holding set numbers in Brickset, Rebrickable and our own exports
+NUMBER_COLUMNS = ("set_number", "set number", "setnumber", "set_num", "number")
+VARIANT_COLUMN = "variant"
+# Numbers like 10294-1, COMCON001-1 or tru01-1, with at least one digit
+SET_NUMBER_PATTERN = re.compile(r"^(?=[A-Za-z0-9]*\d)[A-Za-z0-9]+(-\d+)?$")
+
+# Set numbers listed in the import report, the rest are only counted
+MAX_REPORTED_NOT_FOUND = 20
+
+EXPORT_HEADERS = ["set_number", "set_id", "name", "year", "pieces", "notes"]
+
+
+class ImportResult:
+    """
+    Counts of an import.
+    """
+
+    def __init__(self):
+        self.read = 0
+        self.added = 0
+        self.duplicates = 0
+        self.not_found_count = 0
+        self.not_found = []
+
+    def add_not_found(self, set_number: str) -> None:
+        """Count a set number the API doesn't know."""
+        self.not_found_count += 1
+        if len(self.not_found) < MAX_REPORTED_NOT_FOUND:
+            self.not_found.append(set_number)
+
+    def __str__(self):
+        return (
+            f"Read {self.read} set numbers: {self.added} added, "
+            f"{self.duplicates} already present, {self.not_found_count} not found"
+        )
+
+
+def file_format(path: str, requested_format: str | None = None) -> str:
+    """Return "csv", "json" or "jsonl", from the request or the file extension."""
+    if requested_format:
+        return requested_format
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    return extension if extension in ("json", "jsonl") else "csv"
+
+
+def number_from_record(record) -> str | None:
+    """Return the set number of a JSON value: a number string or an object."""
+    if isinstance(record, (str, int)):
+        return str(record)
+    if isinstance(record, dict):
+        fields = {key.casefold(): value for key, value in record.items()}
+        for column in NUMBER_COLUMNS:
+            if fields.get(column):
+                number = str(fields[column])
+                if "-" not in number and fields.get(VARIANT_COLUMN):
+                    number = f"{number}-{fields[VARIANT_COLUMN]}"
+                return number
+    return None
+
+
+def iter_csv_numbers(file):
+    """
+    Yield the set numbers of a CSV file. Files with a header need a set
+    number column (Brickset's Number and Variant, Rebrickable's Set Number),
+    files without one list a set number in their first column.
+    """
+    reader = csv.reader(file)
+    first_row = next(reader, None)
+    if not first_row:
+        return
+
+    columns = [column.strip().casefold() for column in first_row]
+    has_header = any(column in NUMBER_COLUMNS for column in columns)
+    if not has_header and SET_NUMBER_PATTERN.match(first_row[0].strip()):
+        yield first_row[0].strip()
+        for row in reader:
+            if row and row[0].strip():
+                yield row[0].strip()
+        return
+
+    number_index = next((columns.index(c) for c in NUMBER_COLUMNS if c in columns), None)
+    if number_index is None:
+        raise ValueError(f"No set number column in {', '.join(first_row)}")
+    variant_index = columns.index(VARIANT_COLUMN) if VARIANT_COLUMN in columns else None
+
+    for row in reader:
+        if len(row) <= number_index or not row[number_index].strip():
+            continue
+        number = row[number_index].strip()
+        if (
+            "-" not in number
+            and variant_index is not None
+            and len(row) > variant_index
+            and row[variant_index].strip()
+        ):
+            number = f"{number}-{row[variant_index].strip()}"
+        yield number
+
+
+def iter_json_array(file):
+    """Yield the items of a JSON array, reading the file piece by piece."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    started = False
+    end_of_file = False
+
+    while True:
+        # Skip whitespace and separators between items
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if not started and position < len(buffer):
+            if buffer[position] != "[":
+                raise ValueError("Expected a JSON array")
+            started = True
+            position += 1
+            continue
+        if started and position < len(buffer) and buffer[position] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if end_of_file:
+                if buffer[position:].strip():
+                    raise
+                return
+            chunk = file.read(JSON_READ_SIZE)
+            end_of_file = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        if end == len(buffer) and not end_of_file:
+            # A number may continue in the next piece, read more first
+            chunk = file.read(JSON_READ_SIZE)
+            end_of_file = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        position = end
+        yield item
+
+
+def iter_set_numbers(path: str, requested_format: str | None = None):
+    """
+    Yield the normalized set numbers of a CSV, JSON array or JSON lines file.
+
+    Args:
+        path (str): The path of the file.
+        requested_format (str | None): "csv", "json" or "jsonl", guessed from the extension if None.
+    """
+    source_format = file_format(path, requested_format)
+    with open(path, newline="" if source_format == "csv" else None) as file:
+        if source_format == "csv":
+            numbers = iter_csv_numbers(file)
+        elif source_format == "jsonl":
+            numbers = (number_from_record(json.loads(line)) for line in file if line.strip())
+        else:
+            numbers = (number_from_record(item) for item in iter_json_array(file))
+
+        for number in numbers:
+            if number:
+                yield normalize_set_number(number)
+
+
+def chunks(items, size: int):
+    """Yield lists of up to size consecutive items."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_sets(
+    path: str,
+    collection_name: str | None = None,
+    notes: str = "",
+    requested_format: str | None = None,
+    progress_func: callable = None,
+) -> ImportResult:
+    """
+    Import a list of set numbers into a collection or the wishlist.
+
+    The file is read and resolved through the API in chunks, and each chunk
+    is appended with a single write, so memory use doesn't depend on the
+    size of the file. Sets already present are skipped.
+
+    Args:
+        path (str): The file with set numbers.
+        collection_name (str | None): The target collection, the wishlist if None.
+        notes (str): Notes stored with every imported set.
+        requested_format (str | None): The file format, guessed from the extension if None.
+        progress_func (callable): Called with the ImportResult after every chunk.
+    """
+    if collection_name is None:
+        target_file, headers = WISHLIST_FILE, WISHLIST_HEADERS
+        present_ids = {row[0] for row in Model.iter_csv(WISHLIST_FILE, skip_header=True)}
+    else:
+        target_file, headers = COLLECTED_SETS_FILE, COLLECTED_SETS_HEADERS
+        present_ids = {
+            row[1]
+            for row in Model.iter_csv(COLLECTED_SETS_FILE, skip_header=True)
+            if row[0] == collection_name
+        }
+
+    result = ImportResult()
+    for numbers in chunks(iter_set_numbers(path, requested_format), IMPORT_CHUNK_SIZE):
+        result.read += len(numbers)
+        found_sets = {
+            set_number_from_url(set_data.brickset_url): set_data
+            for set_data in get_sets_by_numbers(list(dict.fromkeys(numbers)))
+        }
+
+        rows = []
+        for number in numbers:
+            set_data = found_sets.get(number)
+            if set_data is None:
+                result.add_not_found(number)
+            elif str(set_data.id) in present_ids:
+                result.duplicates += 1
+            else:
+                present_ids.add(str(set_data.id))
+                if collection_name is None:
+                    rows.append(Model.wishlist_row(set_data, notes))
+                else:
+                    rows.append(Model.collected_set_row(set_data, collection_name, notes))
+
+        Model.append_rows_to_csv(target_file, headers, rows)
+        result.added += len(rows)
+        if progress_func is not None:
+            progress_func(result)
+
+    return result
+
+
+def iter_stored_sets(collection_name: str | None = None):
+    """
+    Yield (SetInfo, notes) of every set in a collection or the wishlist,
+    reading the data file row by row.
+
+    Args:
+        collection_name (str | None): The collection, the wishlist if None.
+    """
+    if collection_name is None:
+        for row in Model.iter_csv(WISHLIST_FILE, skip_header=True):
+            yield SetInfo(*row[:6]), row[6]
+    else:
+        for row in Model.iter_csv(COLLECTED_SETS_FILE, skip_header=True):
+            if row[0] == collection_name:
+                yield SetInfo(*row[1:7]), row[7]
+
+
+def export_record(set_data: SetInfo, notes: str) -> dict:
+    """Return the exported fields of a set."""
+    return {
+        "set_number": set_number_from_url(set_data.brickset_url),
+        "set_id": set_data.id,
+        "name": set_data.name,
+        "year": set_data.year,
+        "pieces": set_data.pieces,
+        "notes": notes,
+    }
+
+
+def export_sets(output, collection_name: str | None = None, output_format: str = "csv") -> int:
+    """
+    Write a collection or the wishlist to a file object, one set at a time.
+
+    Args:
+        output: The text file object to write to.
+        collection_name (str | None): The collection, the wishlist if None.
+        output_format (str): "csv", "json" or "jsonl".
+
+    Returns:
+        int: The number of exported sets.
+    """
+    count = 0
+    records = (export_record(*stored_set) for stored_set in iter_stored_sets(collection_name))
+
+    if output_format == "csv":
+        writer = csv.DictWriter(output, EXPORT_HEADERS)
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+    elif output_format == "jsonl":
+        for record in records:
+            output.write(json.dumps(record) + "\n")
+            count += 1
+    else:
+        output.write("[")
+        for record in records:
+            output.write(("," if count else "") + "\n  " + json.dumps(record))
+            count += 1
+        output.write("\n]\n")
+    return count
@@ -0,0 +1,48 @@
+import time
+
+# Target time from process start to the first painted window
+FIRST_PAINT_BUDGET_MS = 500
+
+
+class StartupTimer:
+    """
+    Records how long each startup phase took, relative to its creation.
+    """
+
+    def __init__(self, budget_ms: float = FIRST_PAINT_BUDGET_MS):
+        self.start = time.perf_counter()
+        self.budget_ms = budget_ms
+        self.phases = []
+        self.reported = False
+
+    def mark(self, phase: str) -> float:
+        """
+        Record the end of a startup phase.
+
+        Args:
+            phase (str): The name of the phase.
+
+        Returns:
+            float: Milliseconds elapsed since the timer was created.
+        """
+        elapsed = (time.perf_counter() - self.start) * 1000
+        self.phases.append((phase, elapsed))
+        return elapsed
+
+    def elapsed(self, phase: str) -> float | None:
+        """Return the time at which a phase ended, or None if it didn't yet."""
+        for name, elapsed in self.phases:
+            if name == phase:
+                return elapsed
+        return None
+
+    def within_budget(self) -> bool:
+        """Whether the first paint happened within the budget."""
+        first_paint = self.elapsed("first_paint")
+        return first_paint is not None and first_paint <= self.budget_ms
+
+    def report(self) -> str:
+        """Return a one line summary of the recorded phases."""
+        phases = ", ".join(f"{name} {elapsed:.0f}ms" for name, elapsed in self.phases)
+        status = "within" if self.within_budget() else "over"
+        return f"Startup: {phases} ({status} {self.budget_ms:.0f}ms first paint budget)"
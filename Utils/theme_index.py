@@ -0,0 +1,91 @@
+import bisect
+
+# Ranks of the match kinds, better matches come first
+NAME_PREFIX_MATCH = 0
+WORD_PREFIX_MATCH = 1
+FUZZY_MATCH = 2
+
+
+class ThemeIndex:
+    """
+    Search index over theme names.
+
+    Whole names and the remainders of names starting at each later word are
+    kept in sorted lists, so prefix matches are found by binary search. When
+    prefixes don't fill the result, names containing the query letters in
+    order (e.g. "swr" for "Star Wars") are added, most compact match first.
+    """
+
+    def __init__(self, themes: list):
+        """
+        Args:
+            themes (list): The theme names in display order.
+        """
+        self.themes = list(themes)
+        self.folded = [theme.casefold() for theme in self.themes]
+        self.names = sorted((name, i) for i, name in enumerate(self.folded))
+        self.words = sorted(
+            (name[start + 1 :], i)
+            for i, name in enumerate(self.folded)
+            for start, letter in enumerate(name)
+            if letter == " "
+        )
+
+    @staticmethod
+    def prefix_matches(entries: list, prefix: str) -> list:
+        """Return the theme indices of sorted (key, index) entries whose key starts with prefix."""
+        matches = []
+        position = bisect.bisect_left(entries, (prefix, -1))
+        while position < len(entries) and entries[position][0].startswith(prefix):
+            matches.append(entries[position][1])
+            position += 1
+        return matches
+
+    @staticmethod
+    def fuzzy_span(name: str, query: str) -> int | None:
+        """
+        Return the length of the shortest part of the name containing the
+        query letters in order, or None if it doesn't contain them.
+        """
+        best = None
+        start = name.find(query[0])
+        while start != -1:
+            position = start
+            for letter in query[1:]:
+                position = name.find(letter, position + 1)
+                if position == -1:
+                    return best
+            span = position - start + 1
+            if best is None or span < best:
+                best = span
+            start = name.find(query[0], start + 1)
+        return best
+
+    def search(self, query: str, limit: int = 50) -> list:
+        """
+        Return the themes matching a query, best matches first.
+
+        Args:
+            query (str): The text typed by the user.
+            limit (int): The maximal number of results.
+        """
+        query = " ".join(query.casefold().split())
+        if not query:
+            return self.themes[:limit]
+
+        ranked = {}
+        for rank, entries in ((NAME_PREFIX_MATCH, self.names), (WORD_PREFIX_MATCH, self.words)):
+            for i in self.prefix_matches(entries, query):
+                ranked.setdefault(i, (rank, 0, self.folded[i]))
+
+        if len(ranked) < limit:
+            compact_query = query.replace(" ", "")
+            for i, name in enumerate(self.folded):
+                if i in ranked:
+                    continue
+                span = self.fuzzy_span(name, compact_query)
+                if span is not None:
+                    ranked[i] = (FUZZY_MATCH, span, name)
+
+        best = sorted(ranked, key=ranked.__getitem__)[:limit]
+        return [self.themes[i] for i in best]
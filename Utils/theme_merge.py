@@ -0,0 +1,173 @@
+import heapq
+from collections.abc import Sequence
+from itertools import chain
+
+from PyQt6 import QtCore
+
+from Utils.api_requests import get_sets_from_theme, SetBatch
+from Utils.cache import LRUCache
+from Utils.workers import run_in_background
+
+# Number of theme set lists fetched at the same time
+MAX_CONCURRENT_THEME_FETCHES = 4
+
+# Merge orders by display name: the sort key and whether it is descending
+MERGE_ORDERS = {
+    "Newest first": ("year", True),
+    "Oldest first": ("year", False),
+    "Name": ("name", False),
+}
+
+
+def sorted_entries(source: int, batch: SetBatch, sort_key: str, descending: bool):
+    """
+    Yield (key, source, index) of every set of a batch in merge order.
+    The source number keeps sets with equal keys in theme order.
+    """
+    if sort_key == "year":
+        keys = [-year for year in batch.years] if descending else batch.years
+    else:
+        keys = [(name or "").casefold() for name in batch.names]
+    for index in sorted(range(len(batch)), key=keys.__getitem__):
+        yield keys[index], source, index
+
+
+class MergedSets(Sequence):
+    """
+    The sets of several themes in one order, without duplicates.
+
+    Each theme is sorted on its own and the themes are combined by a k-way
+    merge that only runs as far as the displayed sets reach, so showing the
+    first batch doesn't merge the whole result.
+    """
+
+    def __init__(self, batches: list, sort_key: str = "year", descending: bool = True):
+        """
+        Args:
+            batches (list): The SetBatch of every theme.
+            sort_key (str): "year" or "name".
+            descending (bool): Whether to merge from the highest key.
+        """
+        self.batches = batches
+        self.merged = SetBatch()
+        self.merged_ids = set()
+        self.pending = heapq.merge(
+            *(
+                sorted_entries(source, batch, sort_key, descending)
+                for source, batch in enumerate(batches)
+            )
+        )
+        self.count = len(set(chain.from_iterable(batch.ids for batch in batches)))
+
+    def merge_until(self, count: int) -> None:
+        """Merge until count sets are available or all themes are merged."""
+        while len(self.merged) < count:
+            entry = next(self.pending, None)
+            if entry is None:
+                return
+            _, source, index = entry
+            batch = self.batches[source]
+            if batch.ids[index] in self.merged_ids:
+                continue
+            self.merged_ids.add(batch.ids[index])
+            self.merged.append(
+                batch.ids[index],
+                batch.names[index],
+                batch.image_urls[index],
+                batch.brickset_urls[index],
+                batch.years[index],
+                batch.pieces[index],
+            )
+
+    def __getitem__(self, index):
+        """Return a SetInfo, or a list of them for a slice."""
+        if isinstance(index, slice):
+            self.merge_until(index.indices(self.count)[1])
+            return self.merged[index]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("MergedSets index out of range")
+        self.merge_until(index + 1)
+        return self.merged[index]
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class MultiThemeLoader(QtCore.QObject):
+    """
+    Fetches the set lists of several themes concurrently, on a pool limited
+    to MAX_CONCURRENT_THEME_FETCHES threads, and merges them once all have
+    arrived. Themes in the shared theme cache are not fetched again.
+    """
+
+    progress = QtCore.pyqtSignal(int, int)
+    loaded = QtCore.pyqtSignal(object)
+    theme_failed = QtCore.pyqtSignal(str, object)
+
+    def __init__(self, theme_cache: LRUCache, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.theme_cache = theme_cache
+        self.thread_pool = QtCore.QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(MAX_CONCURRENT_THEME_FETCHES)
+        self.generation = 0
+        self.themes = []
+        self.batches = {}
+        self.order = ("year", True)
+
+    def load(self, themes: list, order: tuple) -> None:
+        """
+        Load and merge the sets of themes. Loads still running are dropped.
+
+        Args:
+            themes (list): The theme names.
+            order (tuple): The sort key and whether it is descending, see MERGE_ORDERS.
+        """
+        self.generation += 1
+        self.themes = list(themes)
+        self.order = order
+        self.batches = {}
+
+        generation = self.generation
+        for theme in self.themes:
+            cached_sets = self.theme_cache.get(theme)
+            if cached_sets is not None:
+                self.batches[theme] = cached_sets
+                continue
+            run_in_background(
+                get_sets_from_theme,
+                theme,
+                thread_pool=self.thread_pool,
+                on_finished=lambda sets, theme=theme: self.fetched(generation, theme, sets),
+                on_failed=lambda error, theme=theme: self.fetch_failed(generation, theme, error),
+            )
+        self.check_complete()
+
+    def cancel(self) -> None:
+        """Drop the results of running loads."""
+        self.generation += 1
+
+    def fetched(self, generation: int, theme: str, sets: SetBatch) -> None:
+        self.theme_cache.put(theme, sets)
+        if generation != self.generation:
+            return
+        self.batches[theme] = sets
+        self.check_complete()
+
+    def fetch_failed(self, generation: int, theme: str, error: Exception) -> None:
+        """Report the theme and merge the others without it."""
+        if generation != self.generation:
+            return
+        self.batches[theme] = SetBatch()
+        self.theme_failed.emit(theme, error)
+        self.check_complete()
+
+    def check_complete(self) -> None:
+        """Report progress and emit the merged sets once every theme is there."""
+        self.progress.emit(len(self.batches), len(self.themes))
+        if len(self.batches) == len(self.themes):
+            sort_key, descending = self.order
+            self.loaded.emit(
+                MergedSets([self.batches[theme] for theme in self.themes], sort_key, descending)
+            )
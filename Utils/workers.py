@@ -0,0 +1,70 @@
+from PyQt6 import QtCore
+
+# Workers currently running, kept referenced until their signals are delivered
+_active_workers = set()
+
+
+class WorkerSignals(QtCore.QObject):
+    """
+    Signals emitted by a Worker, delivered on the thread that connected them.
+    """
+
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(Exception)
+
+
+class Worker(QtCore.QRunnable):
+    """
+    A QRunnable running a function on a thread pool.
+    """
+
+    def __init__(self, func: callable, *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        """Run the function and emit its result or exception."""
+        try:
+            try:
+                result = self.func(*self.args, **self.kwargs)
+            except Exception as e:
+                self.signals.failed.emit(e)
+            else:
+                self.signals.finished.emit(result)
+        except RuntimeError:
+            pass  # The application shut down while the task was running
+        finally:
+            _active_workers.discard(self)
+
+
+def run_in_background(
+    func: callable,
+    *args,
+    on_finished: callable = None,
+    on_failed: callable = None,
+    thread_pool: QtCore.QThreadPool = None,
+    **kwargs,
+) -> Worker:
+    """
+    Run a function off the GUI thread. Callbacks are invoked on the GUI thread.
+
+    Args:
+        func (callable): The function to run.
+        on_finished (callable): Called with the return value of func.
+        on_failed (callable): Called with the exception raised by func.
+        thread_pool (QtCore.QThreadPool): The pool to run on, the global one by default.
+    """
+    worker = Worker(func, *args, **kwargs)
+    if on_finished is not None:
+        worker.signals.finished.connect(on_finished)
+    if on_failed is not None:
+        worker.signals.failed.connect(on_failed)
+    else:
+        worker.signals.failed.connect(lambda e: print(f"Background task failed: {e}"))
+
+    _active_workers.add(worker)
+    (thread_pool or QtCore.QThreadPool.globalInstance()).start(worker)
+    return worker
@@ -0,0 +1,85 @@
+from PyQt6 import QtWidgets, QtCore
+
+from Utils.set_filter import SetFilter, SORT_ORDERS
+
+MAX_YEAR = 2100
+MAX_PIECES = 100000
+
+
+class FilterBar(QtWidgets.QWidget):
+    """
+    Search, year and piece count filters and the sort order of a set grid.
+    Emits changed whenever any of them is adjusted.
+    """
+
+    changed = QtCore.pyqtSignal()
+
+    def __init__(self, parent: QtWidgets.QWidget = None):
+        super().__init__(parent)
+        layout = QtWidgets.QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        self.search_input = QtWidgets.QLineEdit()
+        self.search_input.setPlaceholderText("Search by name")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.changed)
+        layout.addWidget(self.search_input, 2)
+
+        self.year_from_input = self.create_bound_input("Year from", MAX_YEAR)
+        self.year_to_input = self.create_bound_input("Year to", MAX_YEAR)
+        self.min_pieces_input = self.create_bound_input("Min pieces", MAX_PIECES)
+        self.max_pieces_input = self.create_bound_input("Max pieces", MAX_PIECES)
+        for bound_input in (
+            self.year_from_input,
+            self.year_to_input,
+            self.min_pieces_input,
+            self.max_pieces_input,
+        ):
+            layout.addWidget(bound_input)
+
+        self.sort_dropdown = QtWidgets.QComboBox()
+        self.sort_dropdown.addItems(SORT_ORDERS)
+        self.sort_dropdown.currentIndexChanged.connect(self.changed)
+        layout.addWidget(self.sort_dropdown)
+
+        self.descending_checkbox = QtWidgets.QCheckBox("Descending")
+        self.descending_checkbox.toggled.connect(self.changed)
+        layout.addWidget(self.descending_checkbox)
+
+    def create_bound_input(self, label: str, maximum: int) -> QtWidgets.QSpinBox:
+        """
+        Create a spin box for an optional bound, showing the label while it is 0.
+
+        Args:
+            label (str): The text shown when the bound is not set.
+            maximum (int): The maximal value of the bound.
+        """
+        bound_input = QtWidgets.QSpinBox()
+        bound_input.setRange(0, maximum)
+        bound_input.setSpecialValueText(label)
+        bound_input.setMinimumWidth(110)
+        bound_input.valueChanged.connect(self.changed)
+        return bound_input
+
+    def current_filter(self) -> SetFilter:
+        """Return the filter described by the inputs."""
+        return SetFilter(
+            self.search_input.text(),
+            self.year_from_input.value(),
+            self.year_to_input.value(),
+            self.min_pieces_input.value(),
+            self.max_pieces_input.value(),
+        )
+
+    def sort_key(self) -> str | None:
+        """Return the selected sort key, None for the original order."""
+        return SORT_ORDERS[self.sort_dropdown.currentText()]
+
+    def descending(self) -> bool:
+        """Whether the sort order is reversed."""
+        return self.descending_checkbox.isChecked()
+
+    def is_default(self) -> bool:
+        """Whether the bar neither filters nor reorders anything."""
+        return self.current_filter().is_empty() and self.sort_key() is None and not self.descending()
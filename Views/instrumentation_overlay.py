@@ -0,0 +1,63 @@
+import os
+from PyQt6 import QtWidgets, QtGui, QtCore
+
+from Utils.event_loop_watchdog import EventLoopWatchdog
+from Utils.image_loader import image_cache
+from Utils.instrumentation import recent_stalls
+from Utils.memory import format_memory, memory_snapshot
+
+# Set to 1 to show the overlay on startup, F12 toggles it at any time
+OVERLAY_ENV = "BRICKBUDDY_OVERLAY"
+OVERLAY_REFRESH_MS = 500
+OVERLAY_STALLS_SHOWN = 3
+
+
+class InstrumentationOverlay(QtWidgets.QLabel):
+    """
+    Small on-screen readout of frame times, memory use and recent event loop stalls.
+    """
+
+    def __init__(self, watchdog: EventLoopWatchdog, parent: QtWidgets.QWidget):
+        super().__init__(parent)
+        self.watchdog = watchdog
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 180); color: #7CFC00;"
+            "font-family: monospace; font-size: 11px; padding: 6px;"
+        )
+
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setInterval(OVERLAY_REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        self.shortcut = QtGui.QShortcut(QtGui.QKeySequence("F12"), parent)
+        self.shortcut.activated.connect(self.toggle)
+        # isVisible stays False until the window is shown, isHidden doesn't
+        self.setVisible(os.environ.get(OVERLAY_ENV) == "1")
+        if not self.isHidden():
+            self.refresh()
+            self.refresh_timer.start()
+
+    def toggle(self) -> None:
+        """Show or hide the overlay."""
+        self.setVisible(self.isHidden())
+        if not self.isHidden():
+            self.refresh()
+            self.refresh_timer.start()
+        else:
+            self.refresh_timer.stop()
+
+    def refresh(self) -> None:
+        """Update the text and keep the overlay in the top right corner."""
+        last, average, worst = self.watchdog.frame_stats()
+        lines = [f"frame {last:5.1f}ms  avg {average:5.1f}ms  max {worst:6.1f}ms"]
+        lines.append(format_memory(memory_snapshot(image_cache)))
+        lines.append(f"stalls {len(recent_stalls)}")
+        for stall in list(recent_stalls)[-OVERLAY_STALLS_SHOWN:]:
+            location = stall.spans[-1] if stall.spans else "untracked code"
+            lines.append(f"  {stall.duration_ms:6.0f}ms  {location}")
+        self.setText("\n".join(lines))
+
+        self.adjustSize()
+        self.move(self.parentWidget().width() - self.width() - 10, 10)
+        self.raise_()
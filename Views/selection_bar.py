@@ -0,0 +1,38 @@
+from PyQt6 import QtWidgets
+
+
+class SelectionBar(QtWidgets.QWidget):
+    """
+    Shows how many cards are selected and the actions for all of them.
+    Hidden while nothing is selected.
+    """
+
+    def __init__(self, actions: list, clear_callback: callable, parent: QtWidgets.QWidget = None):
+        """
+        Args:
+            actions (list): (text, callback) pairs of the bulk actions.
+            clear_callback (callable): Called to clear the selection.
+        """
+        super().__init__(parent)
+        layout = QtWidgets.QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        self.count_label = QtWidgets.QLabel()
+        self.count_label.setStyleSheet("font-size: 16px; color: white;")
+        layout.addWidget(self.count_label)
+        layout.addStretch()
+
+        for text, callback in actions + [("Clear selection", clear_callback)]:
+            button = QtWidgets.QPushButton(text)
+            button.setObjectName("actionButton")
+            button.setFixedHeight(30)
+            button.clicked.connect(lambda checked, callback=callback: callback())
+            layout.addWidget(button)
+
+        self.set_count(0)
+
+    def set_count(self, count: int) -> None:
+        """Show the number of selected cards."""
+        self.count_label.setText(f"{count} selected")
+        self.setVisible(count > 0)
@@ -0,0 +1,82 @@
+from PyQt6 import QtWidgets
+
+from Utils.memory import configured_limit
+
+# Free cards kept for reuse, the rest is destroyed on release. The
+# environment variable overrides it
+MAX_POOLED_CARDS_ENV = "BRICKBUDDY_MAX_POOLED_CARDS"
+MAX_POOLED_CARDS = configured_limit(MAX_POOLED_CARDS_ENV, 64)
+
+
+class SetCard(QtWidgets.QWidget):
+    """
+    A theme set card that can be rebound to another set instead of rebuilt.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.set_data = None
+        self.name_label = None
+        self.id_label = None
+        self.pieces_label = None
+        self.image_label = None
+
+    def bind(self, set_data) -> None:
+        """
+        Show another set on the card. Button callbacks read set_data at click
+        time, so they don't need to be reconnected.
+
+        Args:
+            set_data (SetInfo): The information about the set.
+        """
+        self.set_data = set_data
+        self.name_label.setText(f"📇 Name: {set_data.name}")
+        self.id_label.setText(f"🪪 ID: {set_data.id}")
+        self.pieces_label.setText(f"🧱 Bricks: {set_data.pieces}")
+
+    def unbind(self) -> None:
+        """Forget the set and release its image, so an idle card holds no pixmap."""
+        self.set_data = None
+        self.image_label.clear()
+
+
+class CardPool:
+    """
+    Keeps detached set cards so theme changes and Load More reuse them.
+    """
+
+    def __init__(self, create_card: callable, max_size: int = MAX_POOLED_CARDS):
+        self.create_card = create_card
+        self.max_size = max_size
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.destroyed = 0
+        # Parent of free cards, so they stay alive without becoming windows
+        self.holder = QtWidgets.QWidget()
+
+    def acquire(self) -> SetCard:
+        """Return a free card, creating one only if the pool is empty."""
+        if self.free:
+            self.reused += 1
+            return self.free.pop()
+        self.created += 1
+        return self.create_card()
+
+    def release(self, card: SetCard) -> None:
+        """
+        Detach a card from its layout and keep it for reuse, or destroy it
+        when the pool is full.
+
+        Args:
+            card (SetCard): The card to release.
+        """
+        card.unbind()
+        if len(self.free) >= self.max_size:
+            card.setParent(None)
+            card.deleteLater()
+            self.destroyed += 1
+            return
+        card.hide()
+        card.setParent(self.holder)
+        self.free.append(card)
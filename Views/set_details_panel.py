@@ -0,0 +1,108 @@
+import html
+
+from PyQt6 import QtWidgets, QtCore
+
+# Height of the strip of additional images
+IMAGE_STRIP_HEIGHT = 180
+
+
+class SetDetailsPanel(QtWidgets.QWidget):
+    """
+    The details of a set. The basic information is shown at once, the
+    extended details once they are loaded.
+    """
+
+    def __init__(self, set_data, show_image: callable, parent: QtWidgets.QWidget = None):
+        """
+        Args:
+            set_data (SetInfo): The set to show.
+            show_image (callable): Called with a label and an image URL to show the image in the label.
+        """
+        super().__init__(parent)
+        self.set_id = int(set_data.id)
+        self.show_image = show_image
+        self.setStyleSheet("QLabel { color: white; font-size: 14px; }")
+
+        self.layout = QtWidgets.QVBoxLayout()
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self.layout)
+
+        name_label = QtWidgets.QLabel(f"📇 {set_data.name}")
+        name_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        name_label.setWordWrap(True)
+        self.layout.addWidget(name_label)
+
+        self.form_layout = QtWidgets.QFormLayout()
+        self.add_row("🪪 ID", set_data.id)
+        self.add_row("📅 Year", set_data.year or "Unknown")
+        self.add_row("🧱 Bricks", set_data.pieces)
+        self.layout.addLayout(self.form_layout)
+
+        self.status_label = QtWidgets.QLabel("Loading details...")
+        self.layout.addWidget(self.status_label)
+        self.layout.addStretch()
+
+    def add_row(self, title: str, value) -> None:
+        value_label = QtWidgets.QLabel(str(value))
+        value_label.setWordWrap(True)
+        self.form_layout.addRow(QtWidgets.QLabel(title), value_label)
+
+    def show_details(self, details) -> None:
+        """
+        Show the extended details.
+
+        Args:
+            details (SetDetails): The loaded details of the set.
+        """
+        self.status_label.hide()
+        self.add_row("🗂️ Subtheme", details.subtheme or "None")
+        self.add_row("🧑 Minifigs", details.minifigs)
+        prices = ", ".join(
+            f"{region} {price:.2f}" for region, price in details.retail_prices.items()
+        )
+        self.add_row("💰 Retail price", prices or "Unknown")
+        if details.rating:
+            self.add_row("⭐ Rating", f"{details.rating:.1f}")
+
+        if details.description:
+            description_label = QtWidgets.QLabel(details.description)
+            description_label.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+            description_label.setWordWrap(True)
+            self.layout.insertWidget(self.layout.count() - 1, description_label)
+
+        if details.image_urls:
+            image_strip = self.create_image_strip(details.image_urls)
+            self.layout.insertWidget(self.layout.count() - 1, image_strip)
+
+        if details.instructions:
+            links = "<br>".join(
+                f'<a href="{html.escape(url)}" style="color: #8AB4F8;">'
+                f"📘 {html.escape(description or 'Instructions')}</a>"
+                for description, url in details.instructions
+            )
+            instructions_label = QtWidgets.QLabel(links)
+            instructions_label.setOpenExternalLinks(True)
+            self.layout.insertWidget(self.layout.count() - 1, instructions_label)
+
+    def create_image_strip(self, image_urls: list) -> QtWidgets.QScrollArea:
+        """Create a horizontally scrolling row of the additional images."""
+        strip = QtWidgets.QWidget()
+        strip_layout = QtWidgets.QHBoxLayout()
+        strip_layout.setContentsMargins(0, 0, 0, 0)
+        strip.setLayout(strip_layout)
+        for image_url in image_urls:
+            image_label = QtWidgets.QLabel()
+            image_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+            strip_layout.addWidget(image_label)
+            self.show_image(image_label, image_url)
+
+        scroll_area = QtWidgets.QScrollArea()
+        scroll_area.setWidget(strip)
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFixedHeight(IMAGE_STRIP_HEIGHT)
+        scroll_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        return scroll_area
+
+    def show_error(self, error: Exception) -> None:
+        """Report that the extended details could not be loaded."""
+        self.status_label.setText(f"Details unavailable: {error}")
@@ -0,0 +1,76 @@
+import os
+from PyQt6 import QtGui, QtCore
+
+from Utils.disk_cache import CACHE_DIRECTORY
+
+# Rendering profiles
+QUALITY_PROFILE = "quality"
+PERFORMANCE_PROFILE = "performance"
+AUTO_PROFILE = "auto"
+
+# Environment variables overriding the defaults below
+RENDERING_PROFILE_ENV = "BRICKBUDDY_RENDERING"
+PERFORMANCE_THRESHOLD_ENV = "BRICKBUDDY_PERFORMANCE_CARDS"
+
+DEFAULT_RENDERING_PROFILE = AUTO_PROFILE
+# Card count above which the auto profile switches to performance rendering
+DEFAULT_PERFORMANCE_THRESHOLD = 40
+
+# Width of the pre-rendered card border holding the shadow
+CARD_BORDER = 6
+# Rendered card backgrounds, per border width and color
+CARD_BACKGROUND_FILE = "card_background_{border}_{color}.png"
+
+
+def configured_profile() -> str:
+    """Return the rendering profile selected by the environment."""
+    profile = os.environ.get(RENDERING_PROFILE_ENV, DEFAULT_RENDERING_PROFILE)
+    if profile not in (QUALITY_PROFILE, PERFORMANCE_PROFILE, AUTO_PROFILE):
+        return DEFAULT_RENDERING_PROFILE
+    return profile
+
+
+def configured_threshold() -> int:
+    """Return the card count at which the auto profile switches to performance."""
+    try:
+        return int(os.environ[PERFORMANCE_THRESHOLD_ENV])
+    except (KeyError, ValueError):
+        return DEFAULT_PERFORMANCE_THRESHOLD
+
+
+def render_card_background(color: str) -> str:
+    """
+    Render a card background with a drop shadow once, to be used as a
+    stylesheet border-image instead of a QGraphicsDropShadowEffect per card.
+    The image is kept in the cache directory and reused for the same color.
+
+    Args:
+        color (str): The background color of the card.
+
+    Returns:
+        str: The path of the rendered image, usable in a stylesheet url().
+    """
+    file_name = CARD_BACKGROUND_FILE.format(
+        border=CARD_BORDER, color=QtGui.QColor(color).name(QtGui.QColor.NameFormat.HexArgb)[1:]
+    )
+    path = os.path.join(CACHE_DIRECTORY, file_name)
+    if os.path.exists(path):
+        return os.path.abspath(path).replace(os.sep, "/")
+
+    size = 4 * CARD_BORDER
+    image = QtGui.QImage(size, size, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.GlobalColor.transparent)
+
+    painter = QtGui.QPainter(image)
+    # Soft shadow offset by 2px, darkening towards the card
+    for i in range(CARD_BORDER - 2):
+        shadow = QtGui.QColor(0, 0, 0, 25 * (i + 1))
+        painter.fillRect(QtCore.QRect(2 + i, 2 + i, size - 2 - 2 * i, size - 2 - 2 * i), shadow)
+    painter.fillRect(
+        QtCore.QRect(2, 2, size - CARD_BORDER, size - CARD_BORDER), QtGui.QColor(color)
+    )
+    painter.end()
+
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    image.save(path)
+    return os.path.abspath(path).replace(os.sep, "/")
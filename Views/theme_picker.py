@@ -0,0 +1,128 @@
+from PyQt6 import QtWidgets, QtCore
+
+from Utils.theme_index import ThemeIndex
+
+# Number of matching themes listed while searching
+MAX_RESULTS = 50
+RESULTS_HEIGHT = 260
+
+
+class ThemePicker(QtWidgets.QWidget):
+    """
+    Theme selection with incremental search.
+
+    Typing filters the themes and the arrow keys move through the matches,
+    but theme_selected is only emitted when a theme is picked with Enter or
+    a click, so browsing the list never loads any sets.
+    """
+
+    theme_selected = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent: QtWidgets.QWidget = None):
+        super().__init__(parent)
+        self.current_theme = ""
+        self.set_counts = {}
+        self.index = ThemeIndex([])
+
+        layout = QtWidgets.QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(2)
+        self.setLayout(layout)
+
+        self.search_input = QtWidgets.QLineEdit()
+        self.search_input.setPlaceholderText("Search themes")
+        self.search_input.textEdited.connect(self.show_results)
+        self.search_input.installEventFilter(self)
+        layout.addWidget(self.search_input)
+
+        self.results_list = QtWidgets.QListWidget()
+        self.results_list.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.results_list.setMaximumHeight(RESULTS_HEIGHT)
+        self.results_list.itemClicked.connect(self.item_clicked)
+        self.results_list.hide()
+        layout.addWidget(self.results_list)
+
+    def set_themes(self, themes: list, set_counts: dict | None = None) -> None:
+        """
+        Replace the themes offered by the picker.
+
+        Args:
+            themes (list): The theme names.
+            set_counts (dict | None): The number of sets of each theme, if known.
+        """
+        self.index = ThemeIndex(themes)
+        self.set_counts = set_counts or {}
+        if self.results_list.isVisible():
+            self.show_results(self.search_input.text())
+
+    def set_current_theme(self, theme: str) -> None:
+        """Show a theme as selected without emitting theme_selected."""
+        self.current_theme = theme
+        self.search_input.setText(theme)
+
+    def show_results(self, query: str) -> None:
+        """List the themes matching the typed text."""
+        self.results_list.clear()
+        for theme in self.index.search(query, MAX_RESULTS):
+            count = self.set_counts.get(theme)
+            text = theme if count is None else f"{theme}  ({count} sets)"
+            item = QtWidgets.QListWidgetItem(text)
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, theme)
+            self.results_list.addItem(item)
+
+        self.results_list.setCurrentRow(0)
+        self.results_list.setVisible(self.results_list.count() > 0)
+
+    def move_selection(self, step: int) -> None:
+        """Move the highlighted match, opening the list if it is closed."""
+        if not self.results_list.isVisible():
+            self.show_results("")
+            return
+        row = self.results_list.currentRow() + step
+        self.results_list.setCurrentRow(max(0, min(row, self.results_list.count() - 1)))
+
+    def commit(self) -> None:
+        """Select the highlighted match."""
+        item = self.results_list.currentItem()
+        if item is None or not self.results_list.isVisible():
+            return
+        self.select(item.data(QtCore.Qt.ItemDataRole.UserRole))
+
+    def item_clicked(self, item: QtWidgets.QListWidgetItem) -> None:
+        """Select a clicked match."""
+        self.select(item.data(QtCore.Qt.ItemDataRole.UserRole))
+
+    def select(self, theme: str) -> None:
+        """Close the list and emit theme_selected if the theme changed."""
+        self.results_list.hide()
+        changed = theme != self.current_theme
+        self.set_current_theme(theme)
+        if changed:
+            self.theme_selected.emit(theme)
+
+    def cancel(self) -> None:
+        """Close the list and show the current theme again."""
+        self.results_list.hide()
+        self.search_input.setText(self.current_theme)
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Handle navigation keys and focus loss of the search input."""
+        if event.type() == QtCore.QEvent.Type.KeyPress:
+            key = event.key()
+            if key == QtCore.Qt.Key.Key_Down:
+                self.move_selection(1)
+                return True
+            if key == QtCore.Qt.Key.Key_Up:
+                self.move_selection(-1)
+                return True
+            if key in (QtCore.Qt.Key.Key_Return, QtCore.Qt.Key.Key_Enter):
+                self.commit()
+                return True
+            if key == QtCore.Qt.Key.Key_Escape:
+                self.cancel()
+                return True
+        elif event.type() == QtCore.QEvent.Type.FocusOut:
+            self.cancel()
+        elif event.type() == QtCore.QEvent.Type.FocusIn:
+            QtCore.QTimer.singleShot(0, self.search_input.selectAll)
+        return super().eventFilter(watched, event)
@@ -0,0 +1,146 @@
+import argparse
+import os
+import sys
+
+from Models.data_model import Model, COLLECTED_SETS_FILE, WISHLIST_FILE
+from Utils.api_setup import init_brickse
+from Utils.message_handler import ConsoleReporter, set_reporter
+from Utils.set_transfer import export_sets, file_format, import_sets
+
+DESCRIPTION = "Manage BrickBuddy collections and the wishlist without the GUI."
+
+
+def list_collections(args: argparse.Namespace) -> int:
+    """Print the wishlist and every collection with their numbers of sets."""
+    set_counts = {}
+    for row in Model.iter_csv(COLLECTED_SETS_FILE, skip_header=True):
+        set_counts[row[0]] = set_counts.get(row[0], 0) + 1
+    wishlist_count = sum(1 for _ in Model.iter_csv(WISHLIST_FILE, skip_header=True))
+
+    print(f"Wishlist: {wishlist_count} sets")
+    for collection_name, description in Model.get_all_collections():
+        print(f"{collection_name}: {set_counts.get(collection_name, 0)} sets  {description}")
+    return 0
+
+
+def report_error(error: Exception) -> int:
+    """Print an error of a command and return the exit status of a failure."""
+    if isinstance(error, BrokenPipeError):
+        # Nothing can be written to a closed standard output, also not the
+        # flush at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    print(f"error: {error}", file=sys.stderr)
+    return 1
+
+
+def show_progress(result) -> None:
+    """Show the progress of an import on the terminal."""
+    print(f"\r{result}", end="", file=sys.stderr)
+
+
+def import_command(args: argparse.Namespace) -> int:
+    """Import set numbers from a file into a collection or the wishlist."""
+    if args.collection is not None and not Model.collection_exists(args.collection):
+        if not args.create:
+            print(f"Collection {args.collection} does not exist, use --create", file=sys.stderr)
+            return 1
+        Model.create_collection(args.collection, args.description)
+
+    try:
+        init_brickse()
+        result = import_sets(
+            args.file,
+            args.collection,
+            args.notes,
+            args.format,
+            progress_func=show_progress if sys.stderr.isatty() else None,
+        )
+    except (OSError, ValueError) as error:
+        # Chunks read before the error stay imported
+        if sys.stderr.isatty():
+            print(file=sys.stderr)
+        return report_error(error)
+    if sys.stderr.isatty():
+        print(file=sys.stderr)
+
+    try:
+        print(result)
+        if result.not_found:
+            more = result.not_found_count - len(result.not_found)
+            print(
+                "Not found: " + ", ".join(result.not_found) + (f" and {more} more" if more else "")
+            )
+        sys.stdout.flush()
+    except BrokenPipeError as error:
+        return report_error(error)
+    return 0
+
+
+def export_command(args: argparse.Namespace) -> int:
+    """Export a collection or the wishlist to a file or the standard output."""
+    if args.collection is not None and not Model.collection_exists(args.collection):
+        print(f"Collection {args.collection} does not exist", file=sys.stderr)
+        return 1
+
+    output_format = file_format(args.file, args.format)
+    try:
+        if args.file == "-":
+            count = export_sets(sys.stdout, args.collection, output_format)
+            sys.stdout.flush()
+        else:
+            with open(args.file, "w", newline="" if output_format == "csv" else None) as output:
+                count = export_sets(output, args.collection, output_format)
+    except OSError as error:
+        return report_error(error)
+    print(f"Exported {count} sets", file=sys.stderr)
+    return 0
+
+
+def add_target_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments choosing a collection or the wishlist."""
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--collection", metavar="NAME", help="Use the collection NAME.")
+    target.add_argument(
+        "--wishlist", action="store_true", help="Use the wishlist."
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "json", "jsonl"],
+        help="File format, guessed from the file extension by default.",
+    )
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="List collections and their sizes.")
+    list_parser.set_defaults(func=list_collections)
+
+    import_parser = commands.add_parser(
+        "import", help="Import set numbers from a CSV, JSON or JSON lines file."
+    )
+    import_parser.add_argument("file", help="The file with set numbers.")
+    add_target_arguments(import_parser)
+    import_parser.add_argument("--notes", default="", help="Notes stored with every set.")
+    import_parser.add_argument(
+        "--create", action="store_true", help="Create the collection if it doesn't exist."
+    )
+    import_parser.add_argument(
+        "--description", default="", help="Description of a collection created by --create."
+    )
+    import_parser.set_defaults(func=import_command)
+
+    export_parser = commands.add_parser("export", help="Export sets to a CSV or JSON file.")
+    export_parser.add_argument("file", help="The output file, - for the standard output.")
+    add_target_arguments(export_parser)
+    export_parser.set_defaults(func=export_command)
+
+    return parser
+
+
+if __name__ == "__main__":
+    set_reporter(ConsoleReporter())
+    args = create_parser().parse_args()
+    sys.exit(args.func(args))
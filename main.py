@@ -1,9 +1,50 @@
+import argparse
 from PyQt6 import QtWidgets, QtGui, QtCore
-import urllib.request
 
-from Models.data_model import Model, CollectedSet
-from Utils.api_requests import get_themes, get_sets_from_theme, SetInfo
+from Models.data_model import (
+    Model,
+    CollectedSet,
+    COLLECTED_SETS_FILE,
+    COLLECTIONS_FILE,
+    WISHLIST_FILE,
+)
+from Models.model_events import model_changes, INSERTED, UPDATED
+from Utils.api_requests import get_themes_with_set_counts, get_sets_from_theme, SetInfo
 from Utils.api_setup import init_brickse
+from Utils.cache import LRUCache
+from Utils.data_watcher import DataWatcher
+from Utils.disk_cache import read_cache, write_cache
+from Utils.event_loop_watchdog import EventLoopWatchdog
+from Utils.image_loader import fetch_set_image, image_cache, ImageScheduler, IMAGE_SIZE
+from Utils.instrumentation import instrumented
+from Utils.message_handler import MessageBox
+from Utils.memory import format_memory, memory_snapshot
+from Utils.metadata_refresh import MetadataRefresh
+from Utils.metrics import metrics, format_snapshot
+from Utils.prefetch import Prefetcher
+from Utils.profiling import profiling_from_environment
+from Utils.session import SessionSnapshot, load_session, save_session
+from Utils.set_filter import SetIndex, wishlist_row_set_info
+from Utils.set_details import SetDetailsLoader
+from Utils.set_search import SetSearch, normalize_query
+from Utils.startup import StartupTimer
+from Utils.theme_merge import MultiThemeLoader, MERGE_ORDERS
+from Utils.workers import run_in_background
+from Views.filter_bar import FilterBar
+from Views.instrumentation_overlay import InstrumentationOverlay
+from Views.selection_bar import SelectionBar
+from Views.set_details_panel import SetDetailsPanel
+from Views.set_card import CardPool, SetCard
+from Views.theme_picker import ThemePicker
+from Views.styles import (
+    configured_profile,
+    configured_threshold,
+    render_card_background,
+    AUTO_PROFILE,
+    CARD_BORDER,
+    PERFORMANCE_PROFILE,
+    QUALITY_PROFILE,
+)
 
 WINDOW_TITLE = "BrickBuddy"
 DEFAULT_THEME = "Bricklink"
@@ -13,6 +54,9 @@ WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 DIALOG_WIDTH = 600
 DIALOG_HEIGHT = 400
+METRICS_DIALOG_WIDTH = 820
+DETAILS_DIALOG_HEIGHT = 640
+METRICS_DIALOG_HEIGHT = 560
 NAVBAR_WIDTH = 200
 
 # Styling
@@ -28,42 +72,236 @@ HOVER_COLOR = "#555"
 TEXT_COLOR = "white"
 SET_WIDGET_BACKGROUND_COLOR = "#1B1B1E"
 
+# Cache entries used for instant startup
+THEMES_CACHE = "themes"
+THEME_SET_COUNTS_CACHE = "theme_set_counts"
+
+# Prefetching
+THEME_CACHE_SIZE = 20
+RECENT_THEMES_COUNT = 3
+
 class MainWindow(QtWidgets.QWidget):
-    def __init__(self):
+    def __init__(self, startup_timer: StartupTimer | None = None):
         super().__init__()
+        self.startup_timer = startup_timer or StartupTimer()
 
         self.setup_default_values()
         self.setup_set_informations()
-        self.setup_set_informations()
+        self.startup_timer.mark("user_data")
         self.setup_counts()
         self.setup_window()
         self.load_navbar()
         self.setup_main_layout()
-        self.load_theme_selection_view(update_sets=True)
-        self.select_default_theme(self.current_theme)
+        self.setup_instrumentation()
+        self.restore_session_view()
+        self.startup_timer.mark("window_built")
+        self.load_remote_data()
 
     # ============================ SETUP ============================#
 
     def setup_default_values(self):
         """Setup default values for the application."""
         self.SET_DISPLAY_BATCH = 8
-        self.current_theme = "Bricklink"
+        self.current_theme = DEFAULT_THEME
+        self.active_view = None
+        self.active_view_args = []
+        self.theme_sets_cache = LRUCache(THEME_CACHE_SIZE, "theme_sets")
+        self.recent_themes = []
+        self.prefetcher = Prefetcher(self.theme_sets_cache, self)
+        self.image_scheduler = ImageScheduler(self.image_priority, self)
+        self.set_card_pool = CardPool(self.build_set_card)
+        self.filter_bar = None
+        self.set_index = None
+        self.selection = {}
+        self.selection_bar = None
+        self.search_results = []
+        self.compared_themes = []
+        self.merged_sets = []
+        self.failed_compared_themes = []
+        self.multi_theme_loader = MultiThemeLoader(self.theme_sets_cache, self)
+        self.multi_theme_loader.progress.connect(self.multi_theme_progress)
+        self.multi_theme_loader.loaded.connect(self.multi_theme_sets_loaded)
+        self.multi_theme_loader.theme_failed.connect(self.multi_theme_failed)
+        self.set_search = SetSearch(self)
+        self.set_search.results_ready.connect(self.search_results_loaded)
+        self.set_search.search_failed.connect(self.search_failed)
+        self.metadata_refresh = MetadataRefresh(self)
+        self.metadata_refresh.progress.connect(self.metadata_refresh_progress)
+        self.metadata_refresh.finished.connect(self.metadata_refresh_finished)
+        self.metadata_refresh.failed.connect(self.metadata_refresh_failed)
+        self.set_details_loader = SetDetailsLoader(self)
+        self.set_details_loader.details_ready.connect(self.set_details_loaded)
+        self.set_details_loader.details_failed.connect(self.set_details_failed)
+        self.set_details_panel = None
+        self.data_watcher = DataWatcher(self)
+        self.data_watcher.files_changed.connect(self.user_data_changed)
+        self.displayed_cards = {}
+        self.grid_column_count = 4
+        model_changes.subscribe(self.model_changed)
+        self.rendering_mode = configured_profile()
+        self.performance_threshold = configured_threshold()
+        self.rendering_profile = (
+            PERFORMANCE_PROFILE
+            if self.rendering_mode == PERFORMANCE_PROFILE
+            else QUALITY_PROFILE
+        )
 
     def setup_set_informations(self):
-        """Setup information about sets, collections, and themes."""
+        """Setup information about sets, collections, and themes.
+
+        Themes and sets come from the previous session, fresh data is fetched
+        in the background by load_remote_data."""
         self.collections = Model.get_all_collections()
         self.collection_names = [collection[0] for collection in self.collections]
-        self.themes = get_themes()
+        self.themes = read_cache(THEMES_CACHE) or [self.current_theme]
+        self.theme_set_counts = read_cache(THEME_SET_COUNTS_CACHE) or {}
         self.wishlisted_sets = Model.get_wishlist_data()
         self.sets = []
         self.currently_selected_collection = []
 
+        self.session = load_session()
+        if self.session is not None:
+            self.current_theme = self.session.theme
+            self.sets = self.session.sets
+
+    def restore_session_view(self) -> None:
+        """Reopen the view of the previous session with the same amount of
+        loaded items and scroll position. Falls back to the theme selection."""
+        session = self.session
+        if session is None:
+            self.load_theme_selection_view()
+            return
+
+        views = self.view_functions()
+        load_view, display_next, count_attribute = views.get(
+            session.active_view, views["themes"]
+        )
+        try:
+            load_view(*session.view_args)
+        except TypeError:
+            self.load_theme_selection_view()
+            return
+
+        self.show_loaded_items(
+            display_next, count_attribute, session.displayed_count, session.scroll_position
+        )
+
+    def show_loaded_items(
+        self,
+        display_next: callable,
+        count_attribute: str,
+        displayed_count: int,
+        scroll_position: int,
+    ) -> None:
+        """Display batches of a freshly loaded view until it shows as many
+        items as before, then scroll back to where the user was."""
+        while (
+            getattr(self, count_attribute) < displayed_count
+            and self.load_more_button.isVisibleTo(self)
+        ):
+            display_next()
+
+        QtCore.QTimer.singleShot(
+            0,
+            lambda: self.scroll_area.verticalScrollBar().setValue(scroll_position),
+        )
+
+    def view_functions(self) -> dict:
+        """Return the view loader, batch display function and displayed
+        count attribute of every view, by view name."""
+        return {
+            "themes": (
+                self.load_theme_selection_view,
+                self.display_next_sets_batch,
+                "displayed_sets_count",
+            ),
+            "wishlist": (
+                self.load_wishlist_view,
+                self.display_next_wishlist_batch,
+                "displayed_wishlist_items_count",
+            ),
+            "collections": (
+                self.load_collections_view,
+                self.display_next_batch_of_collections,
+                "displayed_collections_count",
+            ),
+            "collection_sets": (
+                self.load_collection_sets_view,
+                self.display_next_collected_sets_batch,
+                "displayed_collected_sets_count",
+            ),
+            "search": (
+                self.load_search_view,
+                self.display_next_search_results_batch,
+                "displayed_search_results_count",
+            ),
+            "compare": (
+                self.load_compare_themes_view,
+                self.display_next_merged_sets_batch,
+                "displayed_merged_sets_count",
+            ),
+        }
+
+    def create_session_snapshot(self) -> SessionSnapshot:
+        """Capture the current theme, its sets and the state of the active view."""
+        displayed_counts = {
+            "themes": self.displayed_sets_count,
+            "wishlist": self.displayed_wishlist_items_count,
+            "collections": self.displayed_collections_count,
+            "collection_sets": self.displayed_collected_sets_count,
+            "search": self.displayed_search_results_count,
+            "compare": self.displayed_merged_sets_count,
+        }
+        return SessionSnapshot(
+            self.current_theme,
+            self.sets,
+            self.active_view,
+            self.active_view_args,
+            displayed_counts.get(self.active_view, 0),
+            self.scroll_area.verticalScrollBar().value(),
+        )
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        """Save the session snapshot so the next launch can show it instantly."""
+        save_session(self.create_session_snapshot())
+        model_changes.unsubscribe(self.model_changed)
+        super().closeEvent(event)
+
+    def load_remote_data(self) -> None:
+        """Fetch themes and sets of the current theme without blocking the window."""
+        run_in_background(get_themes_with_set_counts, on_finished=self.themes_loaded)
+        self.fetch_theme_sets(self.current_theme)
+
+    def themes_loaded(self, theme_set_counts: dict) -> None:
+        """Replace the theme list with freshly fetched themes.
+
+        Args:
+            theme_set_counts (dict): The number of sets of every theme, by theme name.
+        """
+        self.startup_timer.mark("themes_loaded")
+        self.themes = list(theme_set_counts)
+        self.theme_set_counts = theme_set_counts
+        write_cache(THEMES_CACHE, self.themes)
+        write_cache(THEME_SET_COUNTS_CACHE, theme_set_counts)
+
+        if self.active_view == "themes":
+            self.theme_picker.set_themes(self.themes, self.theme_set_counts)
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        """Record the first paint of the window in the startup timer."""
+        super().paintEvent(event)
+        if not self.startup_timer.reported:
+            self.startup_timer.mark("first_paint")
+            self.startup_timer.reported = True
+
     def setup_counts(self) -> None:
         """Setup the counts for the displayed items."""
         self.displayed_sets_count = 0
         self.displayed_wishlist_items_count = 0
         self.displayed_collections_count = 0
         self.displayed_collected_sets_count = 0
+        self.displayed_search_results_count = 0
+        self.displayed_merged_sets_count = 0
         self.current_row = 0
         self.current_col = 0
 
@@ -71,9 +309,19 @@ class MainWindow(QtWidgets.QWidget):
         """Setup the main window properties."""
         self.setWindowTitle(WINDOW_TITLE)
         self.setGeometry(100, 100, WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.setStyleSheet(self.build_window_stylesheet())
         self.layout = QtWidgets.QHBoxLayout()
         self.setLayout(self.layout)
 
+    def setup_instrumentation(self) -> None:
+        """Start the event loop watchdog, create the overlay (F12) and the metrics shortcut."""
+        self.watchdog = EventLoopWatchdog(parent=self)
+        self.watchdog.start()
+        self.instrumentation_overlay = InstrumentationOverlay(self.watchdog, self)
+
+        self.metrics_shortcut = QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+M"), self)
+        self.metrics_shortcut.activated.connect(self.display_metrics_dialog)
+
     def setup_main_layout(self) -> None:
         """Setup the main layout of the window."""
         # Layouts
@@ -120,19 +368,44 @@ class MainWindow(QtWidgets.QWidget):
         """Add navigation buttons to the navbar."""
         # Create navigation buttons and connect them
         self.home_button = self.create_nav_button(
-            "🏠 Home", self.load_theme_selection_view
+            "🏠 Home", lambda: self.load_theme_selection_view()
         )
         self.wishlist_button = self.create_nav_button(
-            "⭐ Wishlist", self.load_wishlist_view
+            "⭐ Wishlist", lambda: self.load_wishlist_view()
         )
         self.collections_button = self.create_nav_button(
-            "📋 Collections", self.load_collections_view
+            "📋 Collections", lambda: self.load_collections_view()
+        )
+        self.search_button = self.create_nav_button(
+            "🔎 Search", lambda: self.load_search_view()
+        )
+        self.compare_button = self.create_nav_button(
+            "🧩 Compare themes", lambda: self.load_compare_themes_view()
         )
 
         # Add buttons to the navbar layout
         self.navbar_layout.addWidget(self.home_button)
         self.navbar_layout.addWidget(self.wishlist_button)
         self.navbar_layout.addWidget(self.collections_button)
+        self.navbar_layout.addWidget(self.search_button)
+        self.navbar_layout.addWidget(self.compare_button)
+
+        # Refresh of the stored set details, with its progress
+        self.refresh_button = self.create_nav_button(
+            "🔄 Refresh data", lambda: self.start_metadata_refresh()
+        )
+        self.refresh_progress_bar = QtWidgets.QProgressBar()
+        self.refresh_progress_bar.setTextVisible(False)
+        self.refresh_progress_bar.setFixedHeight(8)
+        self.refresh_progress_bar.hide()
+        self.refresh_status_label = QtWidgets.QLabel()
+        self.refresh_status_label.setWordWrap(True)
+        self.refresh_status_label.setStyleSheet(f"color: {TEXT_COLOR}; padding: 0 10px;")
+        self.refresh_status_label.hide()
+
+        self.navbar_layout.addWidget(self.refresh_button)
+        self.navbar_layout.addWidget(self.refresh_progress_bar)
+        self.navbar_layout.addWidget(self.refresh_status_label)
 
     def create_nav_button(self, text: str, callback: callable) -> QtWidgets.QPushButton:
         """Helper function to create styled navigation buttons."""
@@ -184,24 +457,29 @@ class MainWindow(QtWidgets.QWidget):
         self.title_layout.addWidget(dropdown_label)
 
     def load_theme_dropdown(self) -> None:
-        """Load and display the theme dropdown."""
+        """Load and display the searchable theme picker."""
         self.title_layout = QtWidgets.QHBoxLayout()
-        self.theme_dropdown = QtWidgets.QComboBox()
+        self.theme_picker = ThemePicker()
 
         self.load_dropdown_label()
-        self.theme_dropdown.addItems(self.themes)  # Populate the dropdown with themes
-        self.theme_dropdown.setCurrentText(self.current_theme)  # Set the default theme
-        self.theme_dropdown.currentIndexChanged.connect(
+        self.theme_picker.set_themes(self.themes, self.theme_set_counts)
+        self.theme_picker.set_current_theme(self.current_theme)  # Set the default theme
+        self.theme_picker.theme_selected.connect(
             self.theme_changed
-        )  # Signal when user changes the theme
+        )  # Signal when user picks a theme
 
-        self.title_layout.addWidget(self.theme_dropdown)
+        self.title_layout.addWidget(self.theme_picker)
         self.ui_layout.addLayout(self.title_layout)
 
-    def theme_changed(self) -> None:
-        """Handle user changing the theme in dropdown."""
-        selected_theme = self.theme_dropdown.currentText()  # Get the selected theme
+    def theme_changed(self, selected_theme: str) -> None:
+        """Handle user picking a theme.
+
+        Args:
+            selected_theme (str): The picked theme.
+        """
+        self.remember_recent_theme(self.current_theme)
         self.current_theme = selected_theme  # Update the current theme
+        self.prefetcher.cancel()
 
         # Clear the grid layout and load sets from the selected theme
         self.clear_grid_layout()
@@ -211,15 +489,6 @@ class MainWindow(QtWidgets.QWidget):
         # Load sets from the selected theme
         self.load_sets_from_theme(selected_theme)
 
-    def select_default_theme(self, theme_name: str) -> None:
-        """Select the default theme in the dropdown.
-
-        Args:
-            theme_name (str): The name of the theme to select."""
-        index = self.theme_dropdown.findText(theme_name)
-        if index != -1:  # If the theme is found
-            self.theme_dropdown.setCurrentIndex(index)
-
     def load_sets_from_theme(self, theme: str, update_sets=True) -> None:
         """Load and display sets from the selected theme.
 
@@ -228,23 +497,112 @@ class MainWindow(QtWidgets.QWidget):
             update_sets (bool): Whether to call the API to get new sets.
         """
         if update_sets:
-            self.sets = get_sets_from_theme(theme)  # Update the sets
+            self.sets = []
         self.displayed_sets_count = 0
         self.display_next_sets_batch()  # Display first batch of sets
 
+        if update_sets:
+            self.fetch_theme_sets(theme)  # Displays the sets once they arrive
+
+    def fetch_theme_sets(self, theme: str) -> None:
+        """Fetch sets of a theme in the background and display them once loaded.
+        Themes fetched earlier in the session (or prefetched) are served from cache.
+
+        Args:
+            theme (str): The name of the theme.
+        """
+        cached_sets = self.theme_sets_cache.get(theme)
+        if cached_sets is not None:
+            self.theme_sets_loaded(theme, cached_sets)
+            return
+
+        run_in_background(
+            get_sets_from_theme,
+            theme,
+            on_finished=lambda sets: self.theme_sets_fetched(theme, sets),
+        )
+
+    def theme_sets_fetched(self, theme: str, sets: list) -> None:
+        """Cache freshly fetched sets of a theme and display them.
+
+        Args:
+            theme (str): The theme the sets belong to.
+            sets (list): The fetched sets.
+        """
+        self.theme_sets_cache.put(theme, sets)
+        self.theme_sets_loaded(theme, sets)
+
+    def remember_recent_theme(self, theme: str) -> None:
+        """Add a theme to the front of the recently used themes.
+
+        Args:
+            theme (str): The name of the theme.
+        """
+        if theme in self.recent_themes:
+            self.recent_themes.remove(theme)
+        self.recent_themes.insert(0, theme)
+        del self.recent_themes[RECENT_THEMES_COUNT:]
+
+    def schedule_prefetch(self) -> None:
+        """Plan prefetching of the next batch of images and of the themes
+        the user is likely to open next: the neighbours in the dropdown and
+        recently used themes."""
+        themes = []
+        if self.current_theme in self.themes:
+            index = self.themes.index(self.current_theme)
+            themes = self.themes[max(index - 1, 0) : index + 2]
+        themes += self.recent_themes
+        themes = [
+            theme
+            for i, theme in enumerate(themes)
+            if theme != self.current_theme and theme not in themes[:i]
+        ]
+
+        next_sets = self.filter_items(self.sets)[
+            self.displayed_sets_count : self.displayed_sets_count + self.SET_DISPLAY_BATCH
+        ]
+        self.prefetcher.schedule(themes, [set_data.image_url for set_data in next_sets])
+
+    def theme_sets_loaded(self, theme: str, sets: list) -> None:
+        """Show fetched sets, unless the user moved on to another theme meanwhile.
+
+        Args:
+            theme (str): The theme the sets belong to.
+            sets (list): The fetched sets.
+        """
+        if theme != self.current_theme:
+            return
+
+        if self.startup_timer.elapsed("sets_loaded") is None:
+            self.startup_timer.mark("sets_loaded")
+
+        # Keep the restored grid (and its scroll position) if nothing changed
+        if sets == self.sets:
+            return
+        self.sets = sets
+
+        if self.active_view == "themes":
+            self.clear_grid_layout()
+            self.displayed_sets_count = 0
+            self.display_next_sets_batch()
+
     # ============================ BATCH DISPLAYING ============================#
 
     def display_next_sets_batch(self) -> None:
         """Display the next batch of sets from current theme."""
         self.displayed_sets_count += self.display_next_batch(
-            self.sets, self.displayed_sets_count, self.create_set_widget, 4
+            self.filter_items(self.sets),
+            self.displayed_sets_count,
+            self.create_set_widget,
+            4,
         )
+        self.schedule_prefetch()
 
     def display_next_wishlist_batch(self) -> None:
         """Display the next batch of wishlisted sets."""
         print(self.displayed_wishlist_items_count)
         self.displayed_wishlist_items_count += self.display_next_batch(
-            self.wishlisted_sets,
+            self.filter_items(self.wishlisted_sets, wishlist_row_set_info),
             self.displayed_wishlist_items_count,
             self.create_wishlist_set_widget,
             2,
@@ -253,12 +611,33 @@ class MainWindow(QtWidgets.QWidget):
     def display_next_collected_sets_batch(self) -> None:
         """Display the next batch of collected sets."""
         self.displayed_collected_sets_count += self.display_next_batch(
-            self.currently_selected_collection,
+            self.filter_items(
+                self.currently_selected_collection,
+                lambda collected_set: collected_set.set_info,
+            ),
             self.displayed_collected_sets_count,
             self.display_collected_set_widget,
             4,
         )
 
+    def display_next_search_results_batch(self) -> None:
+        """Display the next batch of search results."""
+        self.displayed_search_results_count += self.display_next_batch(
+            self.filter_items(self.search_results),
+            self.displayed_search_results_count,
+            self.create_set_widget,
+            4,
+        )
+
+    def display_next_merged_sets_batch(self) -> None:
+        """Display the next batch of the merged sets of the compared themes."""
+        self.displayed_merged_sets_count += self.display_next_batch(
+            self.filter_items(self.merged_sets),
+            self.displayed_merged_sets_count,
+            self.create_set_widget,
+            4,
+        )
+
     def display_next_batch_of_collections(self) -> None:
         """Display the next batch of collections."""
         self.displayed_collections_count += self.display_next_batch(
@@ -268,6 +647,34 @@ class MainWindow(QtWidgets.QWidget):
             1,
         )
 
+    # ============================ FILTERING ============================#
+
+    def filter_items(self, items: list, set_info_func: callable = None) -> list:
+        """Return the items matching the filter bar, in its sort order.
+
+        Args:
+            items (list): The items of the active view.
+            set_info_func (callable): Returns the SetInfo of an item, if items aren't SetInfo.
+        """
+        if self.filter_bar is None or self.filter_bar.is_default():
+            return items
+        if self.set_index is None or not self.set_index.is_current(items):
+            self.set_index = SetIndex(items, set_info_func)
+        return self.set_index.apply(
+            self.filter_bar.current_filter(),
+            self.filter_bar.sort_key(),
+            self.filter_bar.descending(),
+        )
+
+    def filters_changed(self) -> None:
+        """Redisplay the active view from its first batch with the new filters."""
+        _, display_next, count_attribute = self.view_functions()[self.active_view]
+        self.prefetcher.cancel()
+        self.clear_grid_layout()
+        setattr(self, count_attribute, 0)
+        display_next()
+
+    @instrumented("view.display_next_batch")
     def display_next_batch(
         self,
         items_to_display: list,
@@ -282,23 +689,74 @@ class MainWindow(QtWidgets.QWidget):
             displayed_amount (int): The amount of items already displayed.
             widget_create_func (callable): The function to create the widget.
             column_count (int): The number of columns in the grid layout.
+
+        Returns:
+            int: The number of newly displayed items.
         """
-        end_index = displayed_amount + self.SET_DISPLAY_BATCH
+        end_index = min(displayed_amount + self.SET_DISPLAY_BATCH, len(items_to_display))
+        self.grid_column_count = column_count
 
-        for i in range(displayed_amount, min(end_index, len(items_to_display))):
+        for i in range(displayed_amount, end_index):
             set_info = items_to_display[i]
             set_widget = widget_create_func(set_info)
-            self.grid_layout.addWidget(set_widget, self.current_row, self.current_col)
-            self.current_col += 1
-            if self.current_col >= column_count:
-                self.current_col = 0
-                self.current_row += 1
+            self.place_in_grid(set_widget)
+            set_widget.show()  # Recycled cards are hidden while pooled
 
+        self.update_rendering_profile()
         self.load_more_button.setVisible(end_index < len(items_to_display))
-        return end_index
+        return end_index - displayed_amount
+
+    def place_in_grid(self, widget: QtWidgets.QWidget) -> None:
+        """Add a widget to the next cell of the grid layout.
+
+        Args:
+            widget (QtWidgets.QWidget): The widget to add.
+        """
+        self.grid_layout.addWidget(widget, self.current_row, self.current_col)
+        self.current_col += 1
+        if self.current_col >= self.grid_column_count:
+            self.current_col = 0
+            self.current_row += 1
+
+    def reflow_grid_layout(self) -> None:
+        """Move the widgets of the grid layout up to close the gaps of removed ones."""
+        widgets = [self.grid_layout.itemAt(i).widget() for i in range(self.grid_layout.count())]
+        for widget in widgets:
+            self.grid_layout.removeWidget(widget)
+        self.current_row, self.current_col = 0, 0
+        for widget in widgets:
+            self.place_in_grid(widget)
 
     # ============================ WIDGETS ============================#
 
+    def add_filter_bar(self) -> None:
+        """Add the search, filter and sort controls of a set grid."""
+        self.filter_bar = FilterBar()
+        self.filter_bar.changed.connect(self.filters_changed)
+        self.ui_layout.addWidget(self.filter_bar)
+
+    def add_selection_bar(self, actions: list) -> None:
+        """Add the bar with bulk actions for the selected cards.
+
+        Args:
+            actions (list): (text, callback) pairs of the bulk actions.
+        """
+        self.selection_bar = SelectionBar(actions, self.clear_selection)
+        self.ui_layout.addWidget(self.selection_bar)
+
+    def create_select_checkbox(self, selection_item_func: callable) -> QtWidgets.QCheckBox:
+        """Create the checkbox selecting a card for bulk actions.
+
+        Args:
+            selection_item_func (callable): Returns the selection key and item of the card.
+        """
+        checkbox = QtWidgets.QCheckBox("Select")
+        checkbox.setObjectName("selectCheckbox")
+        checkbox.clicked.connect(
+            lambda checked: self.set_selected(*selection_item_func(), checked)
+        )
+        return checkbox
+
     def add_load_more_button(self, display_func) -> None:
         """Add the 'Load More' button."""
         self.load_more_button = QtWidgets.QPushButton("Load More")
@@ -307,20 +765,28 @@ class MainWindow(QtWidgets.QWidget):
 
     def clear_main_layout(self) -> None:
         """Delete all widgets from the main lauyout."""
+        self.prefetcher.cancel()
+        self.set_search.cancel()
+        self.multi_theme_loader.cancel()
+        self.filter_bar = None
+        self.set_index = None
+        self.selection = {}
+        self.selection_bar = None
+        self.clear_grid_layout()  # Return set cards to the pool first
         self.delete_items_of_layout(self.main_layout)
 
-        self.main_layout = QtWidgets.QVBoxLayout()
-        self.grid_layout = QtWidgets.QGridLayout()
-        self.ui_layout = QtWidgets.QVBoxLayout()
-
-        self.layout.addLayout(self.main_layout)
-        self.main_layout.addLayout(self.ui_layout)
-        self.scroll_layout.addLayout(self.grid_layout)
+        # setup_main_layout adds a new main layout, the emptied one would stay
+        # in the window layout for good
+        self.layout.removeItem(self.main_layout)
+        self.main_layout.deleteLater()
 
     def clear_grid_layout(self) -> None:
         """Delete all widgets from the grid layout."""
+        self.image_scheduler.cancel_all()
         self.delete_items_of_layout(self.grid_layout)
+        self.displayed_cards = {}
         self.current_row, self.current_col = 0, 0
+        self.update_rendering_profile()
 
     def clear_scroll_layout(self) -> None:
         """Delete all widgets from the scroll layout."""
@@ -336,10 +802,18 @@ class MainWindow(QtWidgets.QWidget):
             while layout.count():
                 item = layout.takeAt(0)
                 widget = item.widget()
-                if widget is not None:
+                if isinstance(widget, SetCard):
+                    self.set_card_pool.release(widget)
+                elif widget is not None:
+                    # Button callbacks keep the widget referenced, so it is
+                    # only freed when Qt destroys it
                     widget.setParent(None)
+                    widget.deleteLater()
                 else:
-                    self.delete_items_of_layout(item.layout())
+                    sub_layout = item.layout()
+                    self.delete_items_of_layout(sub_layout)
+                    if sub_layout is not None:
+                        sub_layout.deleteLater()
 
     def create_info_label(self, text: str) -> QtWidgets.QLabel:
         """Create and style an information label.
@@ -351,26 +825,61 @@ class MainWindow(QtWidgets.QWidget):
         label.setStyleSheet(f"font-size: 16px; color: {PRIMARY_TEXT_COLOR};")
         return label
 
+    def create_card_label(self, text: str, object_name: str = "cardInfo") -> QtWidgets.QLabel:
+        """Create a card label styled by the window stylesheet.
+
+        Args:
+            text (str): The text to display.
+            object_name (str): The stylesheet object name of the label.
+        """
+        label = QtWidgets.QLabel(text)
+        label.setObjectName(object_name)
+        return label
+
+    def style_card(self, widget: QtWidgets.QWidget, object_name: str = "setCard") -> None:
+        """Style a card through the window stylesheet and give it its shadow.
+
+        Args:
+            widget (QtWidgets.QWidget): The card widget.
+            object_name (str): The stylesheet object name of the card.
+        """
+        widget.setObjectName(object_name)
+        widget.setAttribute(QtCore.Qt.WidgetAttribute.WA_StyledBackground, True)
+        if object_name == "setCard":
+            self.add_shadow_effect(widget)
+
     def add_shadow_effect(self, widget: QtWidgets.QWidget) -> None:
-        """Add shadow effect to a widget.
+        """Add shadow effect to a widget. Skipped in the performance profile,
+        where the pre-rendered card background draws the shadow.
 
         Args:
             widget (QtWidgets.QWidget): The widget to add shadow effect to.
         """
+        if self.rendering_profile == PERFORMANCE_PROFILE:
+            return
         shadow = QtWidgets.QGraphicsDropShadowEffect()
         shadow.setBlurRadius(10)
         shadow.setOffset(2, 2)
         widget.setGraphicsEffect(shadow)
 
     def create_set_widget(self, set_data: SetInfo) -> QtWidgets.QWidget:
-        """Create a widget for single set. Displayed in the main layout.
+        """Return a card for single set, reusing a pooled one when possible.
+        Displayed in the main layout.
 
         Args:
             set_data (SetInfo): The information about the set.
         """
+        set_widget = self.set_card_pool.acquire()
+        set_widget.bind(set_data)
+        set_widget.select_checkbox.setChecked(str(set_data.id) in self.selection)
+        self.show_set_image(set_widget.image_label, set_data.image_url)
+        return set_widget
+
+    def build_set_card(self) -> SetCard:
+        """Build an unbound set card. Used by the card pool when it is empty."""
 
         # Create the widget components
-        set_widget = QtWidgets.QWidget()
+        set_widget = SetCard()
         set_layout = QtWidgets.QVBoxLayout()
         image_layout = QtWidgets.QHBoxLayout()
         info_layout = QtWidgets.QVBoxLayout()
@@ -383,35 +892,44 @@ class MainWindow(QtWidgets.QWidget):
         set_widget.setLayout(set_layout)
 
         # Style the widget
-        self.add_shadow_effect(set_widget)
-        set_widget.setStyleSheet(f"background-color: {SET_WIDGET_BACKGROUND_COLOR};")
+        self.style_card(set_widget)
 
-        # Set details
-        set_name = self.create_info_label(f"📇 Name: {set_data.name}")
-        set_id = self.create_info_label(f"🪪 ID: {set_data.id}")
-        set_pieces = self.create_info_label(f"🧱 Bricks: {set_data.pieces}")
+        # Set details, filled in by SetCard.bind
+        set_widget.name_label = self.create_card_label("")
+        set_widget.id_label = self.create_card_label("")
+        set_widget.pieces_label = self.create_card_label("")
 
         # Add widgets to the layout
-        info_layout.addWidget(set_name)
-        info_layout.addWidget(set_id)
-        info_layout.addWidget(set_pieces)
+        info_layout.addWidget(set_widget.name_label)
+        info_layout.addWidget(set_widget.id_label)
+        info_layout.addWidget(set_widget.pieces_label)
 
         self.style_card_info(info_layout)
 
         # Set image
-        set_image = self.load_set_image(set_data.image_url)
-        image_layout.addWidget(set_image)
+        set_widget.image_label = self.create_image_label()
+        image_layout.addWidget(set_widget.image_label)
 
-        # Create action buttons
+        # Create action buttons, they act on the set the card is bound to
         wishlist_button = self.create_action_button(
-            "⭐ Wishlist", lambda: self.display_wishlist_dialog(set_data)
+            "⭐ Wishlist", lambda: self.display_wishlist_dialog(set_widget.set_data)
         )
         add_to_collection_button = self.create_action_button(
-            "📋 Collect", lambda: self.display_collection_dialog(set_data)
+            "📋 Collect", lambda: self.display_collection_dialog(set_widget.set_data)
+        )
+        details_button = self.create_action_button(
+            "ℹ️ Details", lambda: self.display_set_details_dialog(set_widget.set_data)
         )
 
         button_layout.addWidget(add_to_collection_button)
         button_layout.addWidget(wishlist_button)
+        button_layout.addWidget(details_button)
+
+        # Selection for bulk actions, also reads the bound set at click time
+        set_widget.select_checkbox = self.create_select_checkbox(
+            lambda: (str(set_widget.set_data.id), set_widget.set_data)
+        )
+        button_layout.addWidget(set_widget.select_checkbox)
 
         return set_widget
 
@@ -449,16 +967,15 @@ class MainWindow(QtWidgets.QWidget):
         set_widget.setLayout(set_layout)
 
         # Style the widget
-        self.add_shadow_effect(set_widget)
-        set_widget.setStyleSheet("background-color: #1B1B1E;")
+        self.style_card(set_widget)
         set_widget.setMaximumHeight(400)
 
         # Set details
-        set_name = self.create_info_label(f"📇 Name: {set_data.name}")
-        set_id = self.create_info_label(f"🪪 ID: {set_data.id}")
-        set_pieces = self.create_info_label(f"🧱 Bricks: {set_data.pieces}")
-        set_brickset_url = self.create_info_label(
-            f"🔗 <a href={set_data.brickset_url}>Brickset Link</a>"
+        set_name = self.create_card_label(f"📇 Name: {set_data.name}", "infoLabel")
+        set_id = self.create_card_label(f"🪪 ID: {set_data.id}", "infoLabel")
+        set_pieces = self.create_card_label(f"🧱 Bricks: {set_data.pieces}", "infoLabel")
+        set_brickset_url = self.create_card_label(
+            f"🔗 <a href={set_data.brickset_url}>Brickset Link</a>", "infoLabel"
         )
 
         # Set the link to open in the browser
@@ -474,74 +991,99 @@ class MainWindow(QtWidgets.QWidget):
         set_image = self.load_set_image(set_data.image_url)
         image_layout.addWidget(set_image)
 
-        # Action buttons
+        # Action buttons, they read the row at click time as notes can change
+        set_widget.row = set_info
         detail_button = self.create_action_button(
             "🔍 Detail",
-            lambda: self.show_wishlist_detail_dialog(set_data, notes=set_notes),
+            lambda: self.show_wishlist_detail_dialog(set_data, notes=set_widget.row[6]),
         )
         button_layout.addWidget(detail_button)
 
         delete_button = self.create_action_button(
             "❌ Delete",
-            lambda: self.remove_from_wishlist(set_id=set_data.id, widget=set_widget),
+            lambda: self.remove_from_wishlist(set_id=set_data.id),
         )
         button_layout.addWidget(delete_button)
 
+        set_widget.select_checkbox = self.create_select_checkbox(
+            lambda: (str(set_data.id), set_widget.row)
+        )
+        set_widget.select_checkbox.setChecked(str(set_data.id) in self.selection)
+        button_layout.addWidget(set_widget.select_checkbox)
+
+        self.displayed_cards[str(set_data.id)] = set_widget
         return set_widget
 
     # ============================ UTILITIES ============================#
 
-    def remove_from_wishlist(self, set_id: str, widget: QtWidgets.QWidget) -> None:
-        """Remove a set from the database and delete its widget.
+    def remove_from_wishlist(self, set_id: str) -> None:
+        """Remove a set from the database, its card is removed by model_changed.
 
         Args:
             set_id (str): The ID of the set to remove.
-            widget (QtWidgets.QWidget): The widget to remove.
         """
         Model.remove_from_wishlist(set_id)
-        self.remove_widget(widget)
-
-    def remove_widget(self, widget: QtWidgets.QWidget) -> None:
-        """Remove a widget from the layout.
-
-        Args:
-            widget (QtWidgets.QWidget): The widget to remove.
-        """
-        widget.deleteLater()
 
+    @instrumented("view.load_set_image")
     def load_set_image(self, image_url: str) -> QtWidgets.QLabel:
-        """Load and return the set image.
+        """Return a label showing the set image. The image is downloaded in the
+        background and shown once available.
 
         Args:
             image_url (str): The URL of the image.
         """
-        set_image = QtWidgets.QLabel()
-        image_data = urllib.request.urlopen(image_url).read()
-        image = QtGui.QImage()
-        image.loadFromData(image_data)
-        pixmap = QtGui.QPixmap(image)
+        set_image = self.create_image_label()
+        self.show_set_image(set_image, image_url)
+        return set_image
 
+    def create_image_label(self) -> QtWidgets.QLabel:
+        """Create an empty label for a set image."""
+        set_image = QtWidgets.QLabel()
         set_image.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        set_image.setPixmap(
-            pixmap.scaled(
-                150,
-                150,
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-        )
+        set_image.setMinimumSize(IMAGE_SIZE, IMAGE_SIZE)
         set_image.setSizePolicy(
             QtWidgets.QSizePolicy.Policy.Expanding,
             QtWidgets.QSizePolicy.Policy.Expanding,
         )
         return set_image
 
+    @instrumented("view.show_set_image")
+    def show_set_image(self, set_image: QtWidgets.QLabel, image_url: str) -> None:
+        """Show an image in a label, from cache or once it is downloaded.
+
+        Args:
+            set_image (QtWidgets.QLabel): The label to show the image in.
+            image_url (str): The URL of the image.
+        """
+        if image_url in image_cache:
+            set_image.setPixmap(QtGui.QPixmap.fromImage(fetch_set_image(image_url)))
+        else:
+            set_image.setText("Loading...")
+            self.image_scheduler.request(set_image, image_url)
+
+    def image_priority(self, label: QtWidgets.QLabel) -> int:
+        """Return the loading priority of an image label, lower loads first.
+        Visible images come first, then the ones closest below the viewport.
+
+        Args:
+            label (QtWidgets.QLabel): The label waiting for its image.
+        """
+        viewport = self.scroll_area.viewport()
+        if not label.isVisibleTo(self):
+            return 10 * viewport.height()
+
+        origin = QtCore.QPoint(0, 0)
+        top = label.mapToGlobal(origin).y() - viewport.mapToGlobal(origin).y()
+        if top + label.height() < 0:
+            return -2 * top  # Above the viewport, less likely to be scrolled back to
+        return max(top - viewport.height(), 0)
+
     def create_action_button(
         self,
         text: str,
         callback: callable,
-        bg_color: str = "#333",
-        hover_color: str = "#555",
+        bg_color: str = BACKGROUND_COLOR,
+        hover_color: str = HOVER_COLOR,
     ) -> QtWidgets.QPushButton:
         """Create and style an action button.
 
@@ -555,6 +1097,11 @@ class MainWindow(QtWidgets.QWidget):
 
         button.setFixedHeight(30)
         button.clicked.connect(callback)
+        if bg_color == BACKGROUND_COLOR and hover_color == HOVER_COLOR:
+            # Default colors come from the window stylesheet
+            button.setObjectName("actionButton")
+            return button
+
         button.setStyleSheet(
             f"""
             QPushButton {{
@@ -582,17 +1129,11 @@ class MainWindow(QtWidgets.QWidget):
             widget = layout.itemAt(i).widget()
             if widget is not None:
                 widget.setWordWrap(True)
-                widget.setStyleSheet(
-                    f"""
-                    font-size: {PRIMARY_FONT_SIZE}px;
-                    font-weight: 500;
-                    color: white;
-                    margin: 5px 0px 5px 0px;
-                """
-                )
+                widget.setObjectName("cardInfo")
 
     # ============================ VIEWS ============================#
 
+    @instrumented("view.load_theme_selection_view")
     def load_theme_selection_view(self, update_sets=False) -> None:
         """Load and display view with theme selection and its sets.
 
@@ -602,6 +1143,8 @@ class MainWindow(QtWidgets.QWidget):
         self.collections = Model.get_all_collections()  # Get all collections
         self.collection_names = [collection[0] for collection in self.collections]
 
+        self.active_view = "themes"
+        self.active_view_args = []
         self.displayed_sets_count = 0
         self.current_row, self.current_col = 0, 0
 
@@ -610,27 +1153,47 @@ class MainWindow(QtWidgets.QWidget):
 
         self.load_title("Theme Selection")
         self.load_theme_dropdown()
+        self.add_filter_bar()
+        self.add_selection_bar(
+            [
+                ("📋 Collect selected", self.collect_selected_sets),
+                ("⭐ Wishlist selected", self.wishlist_selected_sets),
+            ]
+        )
         self.add_load_more_button(self.display_next_sets_batch)
 
         self.load_sets_from_theme(self.current_theme, update_sets)
 
+    @instrumented("view.load_wishlist_view")
     def load_wishlist_view(self) -> None:
         """Load the wishlist view."""
         self.wishlisted_sets = Model.get_wishlist_data()
         self.displayed_wishlist_items_count = 0
+        self.active_view = "wishlist"
+        self.active_view_args = []
 
         self.clear_main_layout()
         self.setup_main_layout()
 
         self.load_title("Your Wishlist")
+        self.add_filter_bar()
+        self.add_selection_bar(
+            [
+                ("📋 Collect selected", self.collect_selected_sets),
+                ("❌ Remove selected", self.remove_selected_from_wishlist),
+            ]
+        )
         self.add_load_more_button(self.display_next_wishlist_batch)
         self.display_next_wishlist_batch()
 
+    @instrumented("view.load_collections_view")
     def load_collections_view(self) -> None:
         """Load the collections view."""
         self.collections = Model.get_all_collections()
         self.collection_names = [collection[0] for collection in self.collections]
         self.displayed_collections_count = 0
+        self.active_view = "collections"
+        self.active_view_args = []
 
         self.clear_main_layout()
         self.setup_main_layout()
@@ -640,6 +1203,7 @@ class MainWindow(QtWidgets.QWidget):
         self.add_load_more_button(self.display_next_batch_of_collections)
         self.display_next_batch_of_collections()
 
+    @instrumented("view.load_collection_sets_view")
     def load_collection_sets_view(
         self, collection_name: str, collection_description: str
     ) -> None:
@@ -650,6 +1214,8 @@ class MainWindow(QtWidgets.QWidget):
             collection_description (str): The description of the collection.
         """
         self.displayed_collected_sets_count = 0
+        self.active_view = "collection_sets"
+        self.active_view_args = [collection_name, collection_description]
 
         self.clear_main_layout()
         self.setup_main_layout()
@@ -658,11 +1224,611 @@ class MainWindow(QtWidgets.QWidget):
 
         self.load_title(f"Collection: {collection_name}")
         self.load_page_description(f"Description: {collection_description}")
+        self.add_filter_bar()
+        self.add_selection_bar(
+            [
+                ("➡️ Move selected", self.move_selected_sets),
+                ("❌ Remove selected", self.remove_selected_from_collection),
+            ]
+        )
         self.add_load_more_button(self.display_next_collected_sets_batch)
         self.display_next_collected_sets_batch()
 
+    @instrumented("view.load_search_view")
+    def load_search_view(self, query: str = "") -> None:
+        """Load the search view for sets of all themes.
+
+        Args:
+            query (str): The initial search text.
+        """
+        self.search_results = []
+        self.displayed_search_results_count = 0
+        self.active_view = "search"
+        self.active_view_args = [query]
+
+        self.clear_main_layout()
+        self.setup_main_layout()
+
+        self.load_title("Search Sets")
+
+        self.search_input = QtWidgets.QLineEdit(query)
+        self.search_input.setPlaceholderText("Search all themes by name or set number")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textEdited.connect(self.search_query_changed)
+        self.ui_layout.addWidget(self.search_input)
+
+        self.search_status_label = self.create_info_label("")
+        self.ui_layout.addWidget(self.search_status_label)
+
+        self.add_filter_bar()
+        self.add_selection_bar(
+            [
+                ("📋 Collect selected", self.collect_selected_sets),
+                ("⭐ Wishlist selected", self.wishlist_selected_sets),
+            ]
+        )
+        self.add_load_more_button(self.display_next_search_results_batch)
+        self.display_next_search_results_batch()
+
+        self.search_input.setFocus()
+        if query:
+            self.search_query_changed(query)
+
+    def load_compare_themes_view(self, themes: list = None, order: str = None) -> None:
+        """Load the view showing the sets of several themes merged into one grid.
+
+        Args:
+            themes (list): The compared themes, the last compared ones by default.
+            order (str): The merge order, a key of MERGE_ORDERS.
+        """
+        if themes is not None:
+            self.compared_themes = list(themes)
+        order = order if order in MERGE_ORDERS else next(iter(MERGE_ORDERS))
+        self.merged_sets = []
+        self.displayed_merged_sets_count = 0
+        self.active_view = "compare"
+        self.active_view_args = [self.compared_themes, order]
+
+        self.clear_main_layout()
+        self.setup_main_layout()
+
+        self.load_title("Compare Themes")
+        self.load_page_description(
+            "Pick themes to browse their sets together, merged by year or name."
+        )
+
+        picker_layout = QtWidgets.QHBoxLayout()
+        self.compare_theme_picker = ThemePicker()
+        self.compare_theme_picker.set_themes(self.themes, self.theme_set_counts)
+        self.compare_theme_picker.theme_selected.connect(self.add_compared_theme)
+        picker_layout.addWidget(self.compare_theme_picker, 3)
+
+        self.merge_order_dropdown = QtWidgets.QComboBox()
+        self.merge_order_dropdown.addItems(list(MERGE_ORDERS))
+        self.merge_order_dropdown.setCurrentText(order)
+        self.merge_order_dropdown.currentTextChanged.connect(self.merge_order_changed)
+        picker_layout.addWidget(self.merge_order_dropdown, 1)
+        self.ui_layout.addLayout(picker_layout)
+
+        # A removable chip for every compared theme
+        chips_layout = QtWidgets.QHBoxLayout()
+        for theme in self.compared_themes:
+            chip = self.create_action_button(
+                f"{theme} ✕", lambda checked=False, theme=theme: self.remove_compared_theme(theme)
+            )
+            chips_layout.addWidget(chip)
+        chips_layout.addStretch()
+        self.ui_layout.addLayout(chips_layout)
+
+        self.compare_status_label = self.create_info_label("")
+        self.ui_layout.addWidget(self.compare_status_label)
+
+        self.add_filter_bar()
+        self.add_selection_bar(
+            [
+                ("📋 Collect selected", self.collect_selected_sets),
+                ("⭐ Wishlist selected", self.wishlist_selected_sets),
+            ]
+        )
+        self.add_load_more_button(self.display_next_merged_sets_batch)
+        self.display_next_merged_sets_batch()
+
+        self.failed_compared_themes = []
+        if self.compared_themes:
+            self.multi_theme_loader.load(self.compared_themes, MERGE_ORDERS[order])
+
+    def reload_compare_themes_view(self, themes: list, order: str) -> None:
+        """Reload the compare view once the control that changed it is done
+        handling its event, as reloading deletes the control."""
+        QtCore.QTimer.singleShot(0, lambda: self.load_compare_themes_view(themes, order))
+
+    def add_compared_theme(self, theme: str) -> None:
+        """Add a theme to the compared ones.
+
+        Args:
+            theme (str): The picked theme.
+        """
+        if theme not in self.compared_themes:
+            self.reload_compare_themes_view(
+                self.compared_themes + [theme], self.active_view_args[1]
+            )
+
+    def remove_compared_theme(self, theme: str) -> None:
+        """Stop comparing a theme.
+
+        Args:
+            theme (str): The removed theme.
+        """
+        themes = [compared for compared in self.compared_themes if compared != theme]
+        self.reload_compare_themes_view(themes, self.active_view_args[1])
+
+    def merge_order_changed(self, order: str) -> None:
+        """Merge the compared themes in another order.
+
+        Args:
+            order (str): The merge order, a key of MERGE_ORDERS.
+        """
+        self.reload_compare_themes_view(self.compared_themes, order)
+
+    def multi_theme_progress(self, loaded_count: int, theme_count: int) -> None:
+        """Show how many of the compared themes are loaded.
+
+        Args:
+            loaded_count (int): The number of loaded themes.
+            theme_count (int): The number of compared themes.
+        """
+        if self.active_view == "compare" and loaded_count < theme_count:
+            self.compare_status_label.setText(f"Loading themes {loaded_count}/{theme_count}...")
+
+    def multi_theme_sets_loaded(self, merged_sets) -> None:
+        """Show the merged sets of the compared themes.
+
+        Args:
+            merged_sets (MergedSets): The sets of all compared themes in merge order.
+        """
+        if self.active_view != "compare":
+            return
+        self.merged_sets = merged_sets
+        status = f"{len(merged_sets)} sets in {len(self.compared_themes)} themes"
+        if self.failed_compared_themes:
+            status += f", failed to load: {', '.join(self.failed_compared_themes)}"
+        self.compare_status_label.setText(status)
+        self.clear_grid_layout()
+        self.displayed_merged_sets_count = 0
+        self.display_next_merged_sets_batch()
+
+    def multi_theme_failed(self, theme: str, error: Exception) -> None:
+        """Report a theme whose sets could not be loaded, the others are still shown.
+
+        Args:
+            theme (str): The theme.
+            error (Exception): The reason of the failure.
+        """
+        if self.active_view != "compare":
+            return
+        self.failed_compared_themes.append(theme)
+        self.compare_status_label.setText(f"Loading sets of {theme} failed: {error}")
+
+    # ============================ SEARCH ============================#
+
+    def search_query_changed(self, query: str) -> None:
+        """Search for the typed text once the user stops typing.
+
+        Args:
+            query (str): The search text.
+        """
+        self.active_view_args = [query]
+        self.search_status_label.setText("Searching...")
+        self.set_search.search(query)
+
+    def search_results_loaded(self, query: str, results: list) -> None:
+        """Show search results unless the user has left the search meanwhile.
+
+        Args:
+            query (str): The normalized query.
+            results (list): The found sets.
+        """
+        if self.active_view != "search":
+            return
+        if query != normalize_query(self.search_input.text()):
+            return
+
+        self.search_results = results
+        self.search_status_label.setText(f"{len(results)} sets found" if query else "")
+        self.clear_grid_layout()
+        self.displayed_search_results_count = 0
+        self.display_next_search_results_batch()
+
+    def search_failed(self, query: str, error: Exception) -> None:
+        """Report a failed search.
+
+        Args:
+            query (str): The normalized query.
+            error (Exception): The reason of the failure.
+        """
+        if self.active_view == "search":
+            self.search_status_label.setText(f"Search failed: {error}")
+
+    # ============================ SHARED DATA ============================#
+
+    def user_data_changed(self, changed_files: list) -> None:
+        """Re-read the data files changed by another process and reload the
+        view showing them, keeping its loaded items and scroll position.
+
+        Args:
+            changed_files (list): The paths of the changed data files.
+        """
+        if COLLECTIONS_FILE in changed_files:
+            self.collections = Model.get_all_collections()
+            self.collection_names = [collection[0] for collection in self.collections]
+        if WISHLIST_FILE in changed_files:
+            self.wishlisted_sets = Model.get_wishlist_data()
+
+        affected_views = {
+            COLLECTIONS_FILE: ("collections", "collection_sets"),
+            COLLECTED_SETS_FILE: ("collection_sets",),
+            WISHLIST_FILE: ("wishlist",),
+        }
+        if not any(self.active_view in affected_views[path] for path in changed_files):
+            return
+
+        if self.active_view == "collection_sets" and not Model.collection_exists(
+            self.active_view_args[0]
+        ):
+            self.load_collections_view()
+            return
+
+        load_view, display_next, count_attribute = self.view_functions()[self.active_view]
+        displayed_count = getattr(self, count_attribute)
+        scroll_position = self.scroll_area.verticalScrollBar().value()
+        load_view(*self.active_view_args)
+        self.show_loaded_items(display_next, count_attribute, displayed_count, scroll_position)
+
+    # ============================ MODEL CHANGES ============================#
+
+    def model_changed(self, changes: list) -> None:
+        """Apply rows changed by Model operations to the loaded data and patch
+        the affected cards of the active view, instead of reloading it.
+
+        Args:
+            changes (list): The ModelChange of every changed row.
+        """
+        handlers = {
+            COLLECTIONS_FILE: self.collection_changed,
+            COLLECTED_SETS_FILE: self.collected_set_changed,
+            WISHLIST_FILE: self.wishlisted_set_changed,
+        }
+        for change in changes:
+            handlers[change.file_path](change)
+
+    def collection_changed(self, change) -> None:
+        """Add or remove a collection and its card.
+
+        Args:
+            change (ModelChange): The change of a collections row.
+        """
+        if change.kind == INSERTED:
+            self.collection_names.append(change.key)
+            self.insert_displayed_item("collections", self.collections, change.row)
+            return
+
+        if change.key not in self.collection_names:
+            return
+        index = self.collection_names.index(change.key)
+        del self.collection_names[index]
+        self.remove_displayed_item("collections", self.collections, index, change.key)
+        if self.active_view == "collection_sets" and self.active_view_args[0] == change.key:
+            self.load_collections_view()
+
+    def collected_set_changed(self, change) -> None:
+        """Patch the set of the open collection and its card.
+
+        Args:
+            change (ModelChange): The change of a collected sets row.
+        """
+        collection_name, set_id = change.key
+        if self.active_view != "collection_sets" or self.active_view_args[0] != collection_name:
+            return
+
+        if change.kind == INSERTED:
+            row = change.row
+            self.insert_displayed_item(
+                "collection_sets",
+                self.currently_selected_collection,
+                CollectedSet(SetInfo(*row[1:7]), row[0], row[7]),
+            )
+            return
+
+        index = next(
+            (
+                i
+                for i, collected_set in enumerate(self.currently_selected_collection)
+                if str(collected_set.set_info.id) == set_id
+            ),
+            None,
+        )
+        if index is None:
+            return
+        if change.kind == UPDATED:
+            collected_set = self.currently_selected_collection[index]
+            collected_set.notes = change.row[7]
+            widget = self.displayed_cards.get(change.key)
+            if widget is not None:
+                widget.notes_label.setText(f"📝 Notes: {collected_set.notes}")
+        else:
+            self.deselect(set_id)
+            self.remove_displayed_item(
+                "collection_sets", self.currently_selected_collection, index, change.key
+            )
+
+    def wishlisted_set_changed(self, change) -> None:
+        """Patch the wishlist and the card of the set.
+
+        Args:
+            change (ModelChange): The change of a wishlist row.
+        """
+        if change.kind == INSERTED:
+            self.insert_displayed_item("wishlist", self.wishlisted_sets, change.row)
+            return
+
+        index = next(
+            (i for i, row in enumerate(self.wishlisted_sets) if row[0] == change.key), None
+        )
+        if index is None:
+            return
+        if change.kind == UPDATED:
+            self.wishlisted_sets[index] = change.row
+            if self.active_view == "wishlist" and change.key in self.displayed_cards:
+                self.displayed_cards[change.key].row = change.row
+        else:
+            if self.active_view == "wishlist":
+                self.deselect(change.key)
+            self.remove_displayed_item("wishlist", self.wishlisted_sets, index, change.key)
+
+    def insert_displayed_item(self, view: str, items: list, item) -> None:
+        """Add an item to the items of a view and show its card if the view
+        is active. With filters the matching cards are displayed again, as the
+        item may belong between displayed ones.
+
+        Args:
+            view (str): The name of the view showing the items.
+            items (list): The items of the view.
+            item: The new item.
+        """
+        items.append(item)
+        if self.active_view != view:
+            return
+
+        _, display_next, count_attribute = self.view_functions()[view]
+        if self.filter_bar is not None and not self.filter_bar.is_default():
+            displayed_count = getattr(self, count_attribute)
+            scroll_position = self.scroll_area.verticalScrollBar().value()
+            self.filters_changed()
+            self.show_loaded_items(
+                display_next, count_attribute, displayed_count + 1, scroll_position
+            )
+        elif self.load_more_button.isHidden():
+            display_next()  # Every other item is displayed, so only this one is added
+
+    def remove_displayed_item(self, view: str, items: list, index: int, key) -> None:
+        """Remove an item from the items of a view and its card if the view is
+        active. The following cards move up to fill the gap.
+
+        Args:
+            view (str): The name of the view showing the items.
+            items (list): The items of the view.
+            index (int): The index of the item.
+            key: The key of the card in displayed_cards.
+        """
+        del items[index]
+        if self.active_view != view or key not in self.displayed_cards:
+            return
+
+        widget = self.displayed_cards.pop(key)
+        self.grid_layout.removeWidget(widget)
+        widget.hide()  # Not painted over the reflowed grid until it is destroyed
+        widget.deleteLater()
+        self.reflow_grid_layout()
+
+        _, _, count_attribute = self.view_functions()[view]
+        setattr(self, count_attribute, getattr(self, count_attribute) - 1)
+
+    def deselect(self, key: str) -> None:
+        """Remove an item from the selection, e.g. because it was deleted.
+
+        Args:
+            key (str): The set ID of the item.
+        """
+        if self.selection.pop(key, None) is not None and self.selection_bar is not None:
+            self.selection_bar.set_count(len(self.selection))
+
+    # ============================ METADATA REFRESH ============================#
+
+    def start_metadata_refresh(self) -> None:
+        """Refresh the stored details of wishlisted and collected sets in the background."""
+        if not self.metadata_refresh.start():
+            return
+        self.refresh_button.setEnabled(False)
+        self.refresh_progress_bar.show()
+        self.refresh_status_label.show()
+
+    def metadata_refresh_progress(self, done: int, total: int) -> None:
+        """Show the progress of the metadata refresh.
+
+        Args:
+            done (int): The number of fetched sets.
+            total (int): The number of distinct stored sets.
+        """
+        self.refresh_progress_bar.setRange(0, max(total, 1))
+        self.refresh_progress_bar.setValue(done)
+        self.refresh_status_label.setText(f"Refreshing {done}/{total} sets")
+
+    def metadata_refresh_finished(self, updated_count: int) -> None:
+        """Report the refresh and reload the view showing stored sets.
+
+        Args:
+            updated_count (int): The number of rows whose details changed.
+        """
+        self.refresh_button.setEnabled(True)
+        self.refresh_progress_bar.hide()
+        self.refresh_status_label.setText(f"Updated {updated_count} sets")
+        if not updated_count:
+            return
+        if self.active_view == "wishlist":
+            self.load_wishlist_view()
+        elif self.active_view == "collection_sets":
+            self.load_collection_sets_view(*self.active_view_args)
+
+    def metadata_refresh_failed(self, error: Exception) -> None:
+        """Report a failed refresh, the stored data is left unchanged.
+
+        Args:
+            error (Exception): The reason of the failure.
+        """
+        self.refresh_button.setEnabled(True)
+        self.refresh_progress_bar.hide()
+        self.refresh_status_label.setText(f"Refresh failed: {error}")
+
+    # ============================ SELECTION ============================#
+
+    def set_selected(self, key: str, item, selected: bool) -> None:
+        """Add an item to the selection or remove it.
+
+        Args:
+            key (str): The set ID of the item.
+            item: The item as shown by the active view.
+            selected (bool): Whether the item is selected.
+        """
+        if selected:
+            self.selection[key] = item
+        else:
+            self.selection.pop(key, None)
+        self.selection_bar.set_count(len(self.selection))
+
+    def clear_selection(self) -> None:
+        """Deselect all items and uncheck the displayed cards."""
+        self.selection = {}
+        self.selection_bar.set_count(0)
+        for i in range(self.grid_layout.count()):
+            checkbox = getattr(self.grid_layout.itemAt(i).widget(), "select_checkbox", None)
+            if checkbox is not None:
+                checkbox.setChecked(False)
+
+    def selected_set_infos(self) -> list:
+        """Return the SetInfo of every selected item."""
+        set_infos = []
+        for item in self.selection.values():
+            if isinstance(item, CollectedSet):
+                set_infos.append(item.set_info)
+            elif isinstance(item, SetInfo):
+                set_infos.append(item)
+            else:
+                set_infos.append(wishlist_row_set_info(item))
+        return set_infos
+
+    def collect_selected_sets(self) -> None:
+        """Add the selected sets to a collection picked in a dialog."""
+        self.display_bulk_collection_dialog(
+            "Collect Sets",
+            "💾 Save to Collection",
+            self.collection_names,
+            self.add_selected_to_collection,
+            with_notes=True,
+        )
+
+    def move_selected_sets(self) -> None:
+        """Move the selected sets to another collection picked in a dialog."""
+        source_collection = self.active_view_args[0]
+        self.display_bulk_collection_dialog(
+            "Move Sets",
+            "➡️ Move to Collection",
+            [name for name in self.collection_names if name != source_collection],
+            self.move_selected_to_collection,
+        )
+
     # ============================ STYLING ============================#
 
+    def build_window_stylesheet(self) -> str:
+        """Return the stylesheet shared by all cards of the window. Cards are
+        matched by object name, so they don't need per-widget stylesheets."""
+        if self.rendering_profile == PERFORMANCE_PROFILE:
+            background_url = render_card_background(SET_WIDGET_BACKGROUND_COLOR)
+            set_card_background = (
+                f"border-image: url({background_url}) {CARD_BORDER} stretch; "
+                f"border-width: {CARD_BORDER}px;"
+            )
+        else:
+            set_card_background = f"background-color: {SET_WIDGET_BACKGROUND_COLOR};"
+
+        return f"""
+            QWidget#setCard {{
+                {set_card_background}
+            }}
+            QWidget#collectionCard {{
+                background-color: {SET_WIDGET_BACKGROUND_COLOR};
+            }}
+            QWidget#setCard QLabel, QWidget#collectionCard QLabel {{
+                background: transparent;
+            }}
+            QLabel#cardInfo {{
+                font-size: {PRIMARY_FONT_SIZE}px;
+                font-weight: 500;
+                color: {TEXT_COLOR};
+                margin: 5px 0px 5px 0px;
+            }}
+            QLabel#infoLabel {{
+                font-size: 16px;
+                color: {PRIMARY_TEXT_COLOR};
+            }}
+            QPushButton#actionButton {{
+                font-size: {BUTTON_FONT_SIZE}px;
+                background-color: {BACKGROUND_COLOR};
+                color: white;
+                border: none;
+                text-align: center;
+                font-weight: 600;
+            }}
+            QPushButton#actionButton:hover {{
+                background-color: {HOVER_COLOR};
+            }}
+            QCheckBox#selectCheckbox {{
+                color: {TEXT_COLOR};
+                background: transparent;
+            }}
+        """
+
+    def update_rendering_profile(self) -> None:
+        """Pick the rendering profile for the number of cards in the grid,
+        when the profile is chosen automatically."""
+        if self.rendering_mode != AUTO_PROFILE:
+            return
+
+        if self.grid_layout.count() > self.performance_threshold:
+            self.set_rendering_profile(PERFORMANCE_PROFILE)
+        else:
+            self.set_rendering_profile(QUALITY_PROFILE)
+
+    def set_rendering_profile(self, profile: str) -> None:
+        """Switch between per-card shadow effects and pre-rendered backgrounds.
+
+        Args:
+            profile (str): QUALITY_PROFILE or PERFORMANCE_PROFILE.
+        """
+        if profile != self.rendering_profile:
+            self.rendering_profile = profile
+            self.setStyleSheet(self.build_window_stylesheet())
+
+        # Recycled cards may have been built under the other profile
+        for i in range(self.grid_layout.count()):
+            widget = self.grid_layout.itemAt(i).widget()
+            if widget is None or widget.objectName() != "setCard":
+                continue
+            if profile == PERFORMANCE_PROFILE:
+                if widget.graphicsEffect() is not None:
+                    widget.setGraphicsEffect(None)
+            elif widget.graphicsEffect() is None:
+                self.add_shadow_effect(widget)
+
     def style_major_button(
         self,
         button: QtWidgets.QPushButton,
@@ -849,6 +2015,75 @@ class MainWindow(QtWidgets.QWidget):
 
         dialog.exec()
 
+    def display_set_details_dialog(self, set_data: SetInfo) -> None:
+        """Display the details of a set. Extended details are loaded in the
+        background the first time a set is opened and cached afterwards.
+
+        Args:
+            set_data (SetInfo): The information about the set.
+        """
+        dialog = self.create_dialog("Set Details", DIALOG_WIDTH, DETAILS_DIALOG_HEIGHT)
+        dialog = self.style_dialog(dialog)
+
+        self.set_details_panel = SetDetailsPanel(set_data, self.show_set_image)
+        dialog.layout().addWidget(self.set_details_panel)
+        self.set_details_loader.load(self.set_details_panel.set_id)
+
+        dialog.exec()
+        self.set_details_panel = None
+
+    def set_details_loaded(self, set_id: int, details) -> None:
+        """Show loaded details if their set is still open.
+
+        Args:
+            set_id (int): The ID of the set.
+            details (SetDetails): The extended details of the set.
+        """
+        if self.set_details_panel is not None and self.set_details_panel.set_id == set_id:
+            self.set_details_panel.show_details(details)
+
+    def set_details_failed(self, set_id: int, error: Exception) -> None:
+        """Report details that could not be loaded if their set is still open.
+
+        Args:
+            set_id (int): The ID of the set.
+            error (Exception): The reason of the failure.
+        """
+        if self.set_details_panel is not None and self.set_details_panel.set_id == set_id:
+            self.set_details_panel.show_error(error)
+
+    def display_metrics_dialog(self) -> None:
+        """Display network and cache metrics (Ctrl+Shift+M)."""
+        dialog = self.create_dialog("Metrics", METRICS_DIALOG_WIDTH, METRICS_DIALOG_HEIGHT)
+        dialog = self.style_dialog(dialog)
+        layout = dialog.layout()
+
+        metrics_text = QtWidgets.QTextEdit()
+        metrics_text = self.style_text_edit(metrics_text)
+        metrics_text.setReadOnly(True)
+        metrics_text.setLineWrapMode(QtWidgets.QTextEdit.LineWrapMode.NoWrap)
+        metrics_text.setFont(
+            QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont)
+        )
+        metrics_text.setPlainText(self.metrics_report())
+
+        refresh_button = QtWidgets.QPushButton("🔄 Refresh")
+        refresh_button = self.style_major_button(refresh_button)
+        refresh_button.clicked.connect(lambda: metrics_text.setPlainText(self.metrics_report()))
+
+        save_button = QtWidgets.QPushButton("💾 Save as JSON")
+        save_button = self.style_major_button(save_button)
+        save_button.clicked.connect(lambda: self.save_metrics_snapshot(dialog))
+
+        buttons_layout = QtWidgets.QHBoxLayout()
+        buttons_layout.addWidget(refresh_button)
+        buttons_layout.addWidget(save_button)
+
+        layout.addWidget(metrics_text)
+        layout.addLayout(buttons_layout)
+
+        dialog.exec()
+
     def display_collected_set_edit_dialog(self, collected_set_info: CollectedSet):
         """Display the edit window for a collected set."""
         dialog = self.create_dialog("Edit Collection", DIALOG_WIDTH, DIALOG_HEIGHT)
@@ -917,6 +2152,59 @@ class MainWindow(QtWidgets.QWidget):
 
         dialog.exec()
 
+    def display_bulk_collection_dialog(
+        self,
+        title: str,
+        button_text: str,
+        collection_names: list,
+        callback: callable,
+        with_notes: bool = False,
+    ) -> None:
+        """Display a dialog picking the target collection of a bulk action.
+
+        Args:
+            title (str): The title of the dialog.
+            button_text (str): The text of the confirm button.
+            collection_names (list): The collections to choose from.
+            callback (callable): Called with the collection name, notes and dialog.
+            with_notes (bool): Whether to ask for notes stored with the sets.
+        """
+        if not collection_names:
+            MessageBox.show_warning("Create a collection first")
+            return
+
+        dialog = self.create_dialog(title, DIALOG_WIDTH, DIALOG_HEIGHT)
+        dialog = self.style_dialog(dialog)
+        layout = dialog.layout()
+
+        count_label = self.create_info_label(f"🧱 {len(self.selection)} sets selected")
+        count_label.setStyleSheet("font-size: 18px; font-weight: bold; color: white;")
+        collection_label = self.create_info_label("📃 Select Collection:")
+
+        dropdown = QtWidgets.QComboBox()
+        dropdown.addItems(collection_names)
+
+        set_notes = QtWidgets.QTextEdit()
+        set_notes.setPlaceholderText("Add notes for all sets here")
+        set_notes = self.style_text_edit(set_notes)
+
+        save_button = QtWidgets.QPushButton(button_text)
+        save_button = self.style_major_button(save_button)
+        save_button.clicked.connect(
+            lambda: callback(dropdown.currentText(), set_notes.toPlainText(), dialog)
+        )
+
+        layout.addWidget(count_label)
+        layout.addWidget(collection_label)
+        layout.addWidget(dropdown)
+        if with_notes:
+            layout.addWidget(set_notes)
+        else:
+            layout.addStretch()
+        layout.addWidget(save_button)
+
+        dialog.exec()
+
     def create_dialog(self, title: str, width: int, height: int) -> QtWidgets.QDialog:
         """Helper function to create and return a dialog.
 
@@ -934,6 +2222,28 @@ class MainWindow(QtWidgets.QWidget):
 
     # ============================ DATA ============================#
 
+    def metrics_report(self) -> str:
+        """Return the metrics, memory telemetry and card pool counters as text."""
+        pool = self.set_card_pool
+        return (
+            f"{format_snapshot(metrics.snapshot())}\n\n"
+            f"{format_memory(memory_snapshot(image_cache))}\n"
+            f"cards created {pool.created}  reused {pool.reused}  "
+            f"destroyed {pool.destroyed}  pooled {len(pool.free)}/{pool.max_size}"
+        )
+
+    def save_metrics_snapshot(self, dialog: QtWidgets.QDialog) -> None:
+        """Ask for a file name and write the current metrics to it as JSON.
+
+        Args:
+            dialog (QtWidgets.QDialog): The parent of the file dialog.
+        """
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            dialog, "Save Metrics", "metrics.json", "JSON (*.json)"
+        )
+        if path:
+            metrics.dump(path)
+
     def update_wishlisted_set_notes(self, set_id: str, notes: str, dialog) -> None:
         """Update the notes for a wishlisted set and close passed dialog.
 
@@ -976,10 +2286,56 @@ class MainWindow(QtWidgets.QWidget):
         Model.save_collected_set(set_data, collection_name, notes)
         dialog.close()
 
+    def add_selected_to_collection(
+        self, collection_name: str, notes: str, dialog: QtWidgets.QDialog
+    ) -> None:
+        """Add the selected sets to a collection in one write and close the dialog.
+
+        Args:
+            collection_name (str): The name of the collection.
+            notes (str): Notes stored with every set.
+            dialog (QtWidgets.QDialog): The dialog to close.
+        """
+        Model.save_collected_sets(self.selected_set_infos(), collection_name, notes)
+        dialog.close()
+        self.clear_selection()
+
+    def move_selected_to_collection(
+        self, collection_name: str, notes: str, dialog: QtWidgets.QDialog
+    ) -> None:
+        """Move the selected sets to another collection in one write and close
+        the dialog. Their cards are removed by model_changed.
+
+        Args:
+            collection_name (str): The name of the target collection.
+            notes (str): Unused, notes of moved sets are kept.
+            dialog (QtWidgets.QDialog): The dialog to close.
+        """
+        Model.move_collected_sets(
+            list(self.selection), self.active_view_args[0], collection_name
+        )
+        dialog.close()
+        self.clear_selection()
+
+    def wishlist_selected_sets(self) -> None:
+        """Add the selected sets to the wishlist in one write."""
+        Model.save_many_to_wishlist(self.selected_set_infos())
+        self.clear_selection()
+
+    def remove_selected_from_wishlist(self) -> None:
+        """Remove the selected sets from the wishlist in one write."""
+        Model.remove_many_from_wishlist(list(self.selection))
+        self.clear_selection()
+
+    def remove_selected_from_collection(self) -> None:
+        """Remove the selected sets from the collection in one write."""
+        Model.remove_many_from_collection(self.active_view_args[0], list(self.selection))
+        self.clear_selection()
+
     def save_collection(
         self, name: str, description: str, dialog: QtWidgets.QDialog
     ) -> None:
-        """Save the new collection and close the dialog. Reloads the collections view.
+        """Save the new collection and close the dialog. Its card is added by model_changed.
 
         Args:
             name (str): The name of the collection.
@@ -988,17 +2344,14 @@ class MainWindow(QtWidgets.QWidget):
         """
         Model.create_collection(name, description)
         dialog.close()
-        self.load_collections_view()  # Reload the collections view
 
-    def delete_collection(self, name: str, widget: QtWidgets.QWidget) -> None:
-        """Delete a collection and remove its widget.
+    def delete_collection(self, name: str) -> None:
+        """Delete a collection, its card is removed by model_changed.
 
         Args:
             name (str): The name of the collection.
-            widget (QtWidgets.QWidget): The widget to remove.
         """
         Model.delete_collection(name)
-        self.remove_widget(widget)
 
     def update_collected_set(
         self, collected_set_info: CollectedSet, notes: str, dialog: QtWidgets.QDialog
@@ -1015,17 +2368,13 @@ class MainWindow(QtWidgets.QWidget):
         )
         dialog.close()
 
-    def remove_from_collection(
-        self, collection_name: str, set_id: str, widget: QtWidgets.QWidget
-    ) -> None:
-        """Remove a set from a collection.
+    def remove_from_collection(self, collection_name: str, set_id: str) -> None:
+        """Remove a set from a collection, its card is removed by model_changed.
 
         Args:
             collection_name (str): The name of the collection.
             set_id (str): The ID of the set.
-            widget (QtWidgets.QWidget): The widget to remove.
         """
-        self.remove_widget(widget)
         Model.remove_from_collection(collection_name, set_id)
 
     # ============================ WIDGETS ============================#
@@ -1050,9 +2399,7 @@ class MainWindow(QtWidgets.QWidget):
         layout = QtWidgets.QVBoxLayout()
         collection_widget = QtWidgets.QWidget()
         collection_widget.setLayout(layout)
-        collection_widget.setStyleSheet(
-            f"background-color: {SET_WIDGET_BACKGROUND_COLOR};"
-        )
+        self.style_card(collection_widget, "collectionCard")
 
         collection_name_label = self.create_info_label(collection_name)
         collection_name_label.setAlignment(
@@ -1062,7 +2409,7 @@ class MainWindow(QtWidgets.QWidget):
 
         delete_button = self.create_action_button(
             "❌ Delete",
-            lambda: self.delete_collection(collection_name, collection_widget),
+            lambda: self.delete_collection(collection_name),
         )
         view_button = self.create_action_button(
             "🔍 View",
@@ -1075,6 +2422,7 @@ class MainWindow(QtWidgets.QWidget):
         layout.addWidget(view_button)
         layout.addWidget(delete_button)
 
+        self.displayed_cards[collection_name] = collection_widget
         return collection_widget
 
     def display_collected_set_widget(
@@ -1095,24 +2443,24 @@ class MainWindow(QtWidgets.QWidget):
         set_layout.addLayout(info_layout)
         set_layout.addLayout(button_layout)
         set_widget.setLayout(set_layout)
-        set_widget.setStyleSheet(f"background-color: {SET_WIDGET_BACKGROUND_COLOR};")
 
-        # Add shadow effect
-        self.add_shadow_effect(set_widget)
+        # Style the widget and add its shadow
+        self.style_card(set_widget)
 
         # Set details
-        set_name = self.create_info_label(
+        set_name = self.create_card_label(
             f"📇 Name: {collected_set_info.set_info.name}"
         )
-        set_id = self.create_info_label(f"🪪 ID: {collected_set_info.set_info.id}")
-        set_pieces = self.create_info_label(
+        set_id = self.create_card_label(f"🪪 ID: {collected_set_info.set_info.id}")
+        set_pieces = self.create_card_label(
             f"🧱 Bricks: {collected_set_info.set_info.pieces}"
         )
-        set_url = self.create_info_label(
+        set_url = self.create_card_label(
             f"🔗 <a href='{collected_set_info.set_info.brickset_url}'>Brickset link</a>"
         )
         set_url.setOpenExternalLinks(True)
-        set_notes = self.create_info_label(f"📝 Notes: {collected_set_info.notes}")
+        set_notes = self.create_card_label(f"📝 Notes: {collected_set_info.notes}")
+        set_widget.notes_label = set_notes
 
         info_layout.addWidget(set_name)
         info_layout.addWidget(set_id)
@@ -1132,7 +2480,6 @@ class MainWindow(QtWidgets.QWidget):
             lambda: self.remove_from_collection(
                 collected_set_info.collection_name,
                 collected_set_info.set_info.id,
-                set_widget,
             ),
         )
         add_to_collection_button = self.create_action_button(
@@ -1143,15 +2490,44 @@ class MainWindow(QtWidgets.QWidget):
         button_layout.addWidget(add_to_collection_button)
         button_layout.addWidget(wishlist_button)
 
+        set_widget.select_checkbox = self.create_select_checkbox(
+            lambda: (str(collected_set_info.set_info.id), collected_set_info)
+        )
+        set_widget.select_checkbox.setChecked(
+            str(collected_set_info.set_info.id) in self.selection
+        )
+        button_layout.addWidget(set_widget.select_checkbox)
+
+        self.displayed_cards[
+            (collected_set_info.collection_name, str(collected_set_info.set_info.id))
+        ] = set_widget
         return set_widget
 
 
 if __name__ == "__main__":
+    startup_timer = StartupTimer()
+
+    parser = argparse.ArgumentParser(description=WINDOW_TITLE)
+    parser.add_argument(
+        "--profile",
+        metavar="DIRECTORY",
+        help="Write a trace and timing summary of the session to DIRECTORY.",
+    )
+    parser.add_argument(
+        "--cprofile", action="store_true", help="Also capture a cProfile with --profile."
+    )
+    args = parser.parse_args()
+
+    profiling_session = profiling_from_environment(
+        args.profile, args.cprofile, startup_timer
+    )
     init_brickse()
 
     app = QtWidgets.QApplication([])
+    if profiling_session is not None:
+        app.aboutToQuit.connect(profiling_session.stop)
 
-    window = MainWindow()
+    window = MainWindow(startup_timer)
     window.show()
 
     app.exec()